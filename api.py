@@ -26,6 +26,7 @@ from scrapers.browser_pool import browser_pool
 from scrapers.dibbs_date import scrape_nsns_by_date, scrape_available_dates
 from scrapers.sam_gov import search_opportunities
 from scrapers.canada_buys import search_tenders as search_canada_tenders
+from scrapers.canada_buys import close_client as close_canada_buys_client
 from scrapers.alberta_purchasing import search_opportunities as search_apc
 from services.document import download_document, extract_text_from_pdf, parse_bid_package
 from services.llm import classify_conversation_stage, draft_reply, extract_quote_data
@@ -394,10 +395,11 @@ class ExtractQuoteResponse(BaseModel):
 
 @asynccontextmanager
 async def lifespan(app):
-    """Start shared browser pool on startup, stop on shutdown."""
+    """Start shared browser pool on startup; stop it and pooled HTTP clients on shutdown."""
     await browser_pool.start()
     yield
     await browser_pool.stop()
+    await close_canada_buys_client()
 
 
 # Create FastAPI app
@@ -527,25 +529,23 @@ async def process_batch(request: Request, body: BatchRequest):
 
     try:
         batch_result = await scrape_batch(body.nsns)
-        flat_rows = flatten_batch_results(batch_result)
-
         supplier_rows = [
             SupplierRow(
-                nsn=row["nsn"],
-                open_status=row["open_status"],
-                supplier_name=row["supplier_name"],
-                cage_code=row["cage_code"],
-                email=row["email"],
-                phone=row["phone"]
+                nsn=row.nsn,
+                open_status=row.open_status,
+                supplier_name=row.supplier_name,
+                cage_code=row.cage_code,
+                email=row.email,
+                phone=row.phone
             )
-            for row in flat_rows
+            for row in flatten_batch_results(batch_result)
         ]
 
         return BatchResponse(
             results=supplier_rows,
             summary=BatchSummary(
                 total_nsns=batch_result.total_nsns,
-                total_rows=len(flat_rows),
+                total_rows=len(supplier_rows),
                 successful=batch_result.successful,
                 failed=batch_result.failed
             )
@@ -803,11 +803,11 @@ async def get_available_dates(request: Request, api_key: str = Depends(verify_ap
     Get available RFQ issue dates from DIBBS.
     """
     try:
-        async with browser_pool.get_context() as ctx:
-            result = await asyncio.wait_for(
-                scrape_available_dates(browser_context=ctx),
-                timeout=280,
-            )
+        # Leases a pool context only on a cache miss
+        result = await asyncio.wait_for(
+            scrape_available_dates(pool=browser_pool),
+            timeout=280,
+        )
 
         return AvailableDatesResponse(
             dates=result["dates"],
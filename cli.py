@@ -18,7 +18,7 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Set
 
-from core import scrape_batch, flatten_to_rows
+from core import scrape_batch, flatten_to_rows, FlatRow
 from utils.helpers import format_nsn_with_dashes
 
 
@@ -123,7 +123,7 @@ def load_processed_nsns(csv_path: Path) -> Set[str]:
     return processed
 
 
-def append_to_csv(rows: List[dict], filepath: Path) -> None:
+def append_to_csv(rows: List[FlatRow], filepath: Path) -> None:
     """Append rows to CSV file (create with header if new)."""
     file_exists = filepath.exists() and filepath.stat().st_size > 0
 
@@ -134,19 +134,11 @@ def append_to_csv(rows: List[dict], filepath: Path) -> None:
         if not file_exists:
             writer.writerow(["NSN", "Open Status", "Supplier Name", "CAGE Code", "Email", "Phone"])
 
-        # Write data rows
-        for row in rows:
-            writer.writerow([
-                row["nsn"],
-                row["open_status"],
-                row["supplier_name"],
-                row["cage_code"],
-                row["email"],
-                row["phone"]
-            ])
+        # Write data rows (FlatRow field order matches the header)
+        writer.writerows(rows)
 
 
-def update_json(new_rows: List[dict], filepath: Path, summary: dict) -> None:
+def update_json(new_rows: List[FlatRow], filepath: Path, summary: dict) -> None:
     """Update JSON file with new results (append to existing)."""
     existing = {"results": [], "summary": {}, "last_updated": None}
 
@@ -159,7 +151,7 @@ def update_json(new_rows: List[dict], filepath: Path, summary: dict) -> None:
             existing = {"results": [], "summary": {}, "last_updated": None}
 
     # Append new rows
-    existing["results"].extend(new_rows)
+    existing["results"].extend(row._asdict() for row in new_rows)
     existing["summary"] = summary
     existing["last_updated"] = datetime.now().isoformat()
 
@@ -313,7 +305,7 @@ Examples:
             cumulative_stats["processed"] += 1
 
             # Flatten and save immediately
-            rows = flatten_to_rows(nsn_result.result)
+            rows = list(flatten_to_rows(nsn_result.result))
             append_to_csv(rows, csv_path)
             cumulative_stats["total_rows"] += len(rows)
 
@@ -64,6 +64,14 @@ class Config:
 
     # Rate limiting
     BATCH_DELAY: int = int(os.getenv("BATCH_DELAY", "500"))
+    DIBBS_CONCURRENCY: int = int(os.getenv("DIBBS_CONCURRENCY", "4"))
+    WBPARTS_CONCURRENCY: int = int(os.getenv("WBPARTS_CONCURRENCY", "4"))
+    # Browser pages paginating one DIBBS date search in parallel (1 = click through serially)
+    DIBBS_DATE_PAGE_CONCURRENCY: int = int(os.getenv("DIBBS_DATE_PAGE_CONCURRENCY", "4"))
+    DIBBS_DATES_CACHE_TTL: int = int(os.getenv("DIBBS_DATES_CACHE_TTL", "600"))  # seconds; 0 disables
+
+    # Batch memory: drop rawData from in-memory batch results once saved to disk
+    KEEP_RAW_DATA: bool = os.getenv("KEEP_RAW_DATA", "true").lower() != "false"
 
     # OpenRouter LLM
     OPENROUTER_API_KEY: str = get_secret("OPENROUTER_API_KEY", "")
@@ -78,9 +86,12 @@ class Config:
         "CANADA_BUYS_FEED_URL",
         "https://canadabuys.canada.ca/opendata/pub/openTenderNotice-ouvertAvisAppelOffres.csv"
     )
+    CANADA_BUYS_PAGE_CONCURRENCY: int = int(get_secret("CANADA_BUYS_PAGE_CONCURRENCY", "4"))
     APC_SCRAPE_DELAY: int = int(get_secret("APC_SCRAPE_DELAY", "3000"))
     APC_ENRICH_CONTACTS: bool = get_secret("APC_ENRICH_CONTACTS", "false").lower() != "false"
     APC_DETAIL_CONCURRENCY: int = int(get_secret("APC_DETAIL_CONCURRENCY", "5"))
+    APC_PAGE_CONCURRENCY: int = int(get_secret("APC_PAGE_CONCURRENCY", "4"))
+    APC_CACHE_TTL: int = int(get_secret("APC_CACHE_TTL", "300"))  # seconds; 0 disables
 
     # Logging
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
@@ -90,6 +101,15 @@ class Config:
     HEADLESS: bool = os.getenv("HEADLESS", "true").lower() != "false"
     MAX_BROWSER_PAGES: int = int(os.getenv("MAX_BROWSER_PAGES", "4"))
     BROWSER_POOL_TIMEOUT: int = int(os.getenv("BROWSER_POOL_TIMEOUT", "300"))
+    # Comma-separated Playwright resource types aborted in pooled contexts ("" disables)
+    BROWSER_BLOCK_RESOURCES: str = os.getenv("BROWSER_BLOCK_RESOURCES", "image,font,media")
+    # Comma-separated tracker hosts (and their subdomains) aborted in every context ("" disables)
+    BROWSER_BLOCK_HOSTS: str = os.getenv(
+        "BROWSER_BLOCK_HOSTS", "google-analytics.com,googletagmanager.com,doubleclick.net"
+    )
+    # Opt-in page visited once at pool start; its cookies/localStorage seed every
+    # pooled context. Only worth setting to a site the pooled scrapers browse
+    BROWSER_WARMUP_URL: str = os.getenv("BROWSER_WARMUP_URL", "")
     USER_AGENT: str = os.getenv(
         "USER_AGENT",
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
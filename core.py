@@ -6,7 +6,7 @@ Shared scraping and processing functions used by Streamlit, API, and CLI interfa
 
 import asyncio
 import time
-from typing import Callable, Optional, List
+from typing import Callable, Dict, Iterator, NamedTuple, Optional, List, Tuple
 
 from config import config
 from models import (
@@ -18,6 +18,8 @@ from models import (
     WBPartsManufacturer,
     BatchProcessingResult,
     BatchNSNResult,
+    ScrapeResult,
+    WBPartsScrapeResult,
 )
 from scrapers.browser_pool import browser_pool
 from scrapers.dibbs import scrape_dibbs
@@ -40,19 +42,51 @@ BatchProgressCallback = Callable[[int, int, str], None]
 BatchStatusCallback = Callable[[int, BatchNSNResult], None]
 
 
-def noop_progress(step: int, message: str) -> None:
-    """No-op progress callback."""
-    pass
+class FlatRow(NamedTuple):
+    """One flattened supplier row; field order matches the CSV columns."""
+    nsn: str
+    open_status: str
+    supplier_name: str
+    cage_code: str
+    email: str
+    phone: str
 
 
-def noop_batch_progress(current: int, total: int, message: str) -> None:
-    """No-op batch progress callback."""
-    pass
+# Config is fixed at import time; bind the values read on every NSN once
+_FIRECRAWL_ENABLED = config.is_firecrawl_configured()
+_FIRECRAWL_CONCURRENCY = config.FIRECRAWL_CONCURRENCY
 
 
-def noop_batch_status(nsn_index: int, nsn_result: BatchNSNResult) -> None:
-    """No-op batch status callback."""
-    pass
+# Process-wide concurrency guards, keyed by scraper name.
+# Lazy-initialized per event loop (CLI/Streamlit call asyncio.run repeatedly).
+_semaphores: Dict[str, Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = {}
+
+
+def _get_semaphore(name: str, limit: int) -> asyncio.Semaphore:
+    """Get or create the named semaphore for the current event loop."""
+    loop = asyncio.get_running_loop()
+    entry = _semaphores.get(name)
+    if entry is None or entry[0] is not loop:
+        entry = (loop, asyncio.Semaphore(limit))
+        _semaphores[name] = entry
+    return entry[1]
+
+
+def get_firecrawl_semaphore() -> asyncio.Semaphore:
+    """Get the process-wide Firecrawl semaphore for the current event loop."""
+    return _get_semaphore("firecrawl", _FIRECRAWL_CONCURRENCY)
+
+
+async def _bounded_dibbs(nsn: str, browser_context=None) -> ScrapeResult:
+    """Scrape DIBBS under the shared DIBBS concurrency limit."""
+    async with _get_semaphore("dibbs", config.DIBBS_CONCURRENCY):
+        return await scrape_dibbs(nsn, browser_context=browser_context)
+
+
+async def _bounded_wbparts(nsn: str, browser_context=None) -> WBPartsScrapeResult:
+    """Scrape WBParts under the shared WBParts concurrency limit."""
+    async with _get_semaphore("wbparts", config.WBPARTS_CONCURRENCY):
+        return await scrape_wbparts(nsn, browser_context=browser_context)
 
 
 def get_unique_suppliers_list(
@@ -64,7 +98,7 @@ def get_unique_suppliers_list(
     suppliers = []
 
     for source in dibbs_sources:
-        key = f"{source.company_name}|{source.cage_code}"
+        key = (source.company_name, source.cage_code)
         if key not in seen and source.company_name:
             seen.add(key)
             suppliers.append({
@@ -74,7 +108,7 @@ def get_unique_suppliers_list(
             })
 
     for mfr in wbparts_mfrs:
-        key = f"{mfr.company_name}|{mfr.cage_code}"
+        key = (mfr.company_name, mfr.cage_code)
         if key not in seen and mfr.company_name:
             seen.add(key)
             suppliers.append({
@@ -90,7 +124,8 @@ async def scrape_nsn(
     nsn: str,
     progress_callback: Optional[ProgressCallback] = None,
     max_suppliers: int = 0,
-    timeout_seconds: int = 0
+    timeout_seconds: int = 0,
+    firecrawl_sem: Optional[asyncio.Semaphore] = None
 ) -> EnhancedRFQResult:
     """
     Run the full scraping workflow for a single NSN.
@@ -104,28 +139,32 @@ async def scrape_nsn(
         nsn: The NSN to scrape
         progress_callback: Optional callback for progress updates (step, message)
         max_suppliers: Max suppliers for contact discovery (0 = all)
-        timeout_seconds: Wall-clock deadline for the entire function (0 = no limit)
+        timeout_seconds: Wall-clock deadline for contact discovery; lookups not
+            started by then are skipped (0 = no limit)
+        firecrawl_sem: Semaphore bounding Firecrawl lookups (default: the
+            process-wide one, so concurrent NSNs share a single limit)
 
     Returns:
         EnhancedRFQResult with complete data
     """
-    callback = progress_callback or noop_progress
+    notify = progress_callback
 
     # Step 1: Scrape DIBBS + WBParts
-    callback(1, "Scraping DIBBS + WBParts...")
+    if notify:
+        notify(1, "Scraping DIBBS + WBParts...")
     scrape_start = time.monotonic()
     logger.info("scrape_nsn: started", nsn=nsn, max_suppliers=max_suppliers, timeout_seconds=timeout_seconds)
 
     if browser_pool._started:
-        async with browser_pool.get_context() as ctx:
+        async with browser_pool.lease_context() as ctx:
             dibbs_result, wbparts_result = await asyncio.gather(
-                scrape_dibbs(nsn, browser_context=ctx),
-                scrape_wbparts(nsn, browser_context=ctx),
+                _bounded_dibbs(nsn, browser_context=ctx),
+                _bounded_wbparts(nsn, browser_context=ctx),
             )
     else:
         dibbs_result, wbparts_result = await asyncio.gather(
-            scrape_dibbs(nsn),
-            scrape_wbparts(nsn)
+            _bounded_dibbs(nsn),
+            _bounded_wbparts(nsn)
         )
 
     # Get suppliers
@@ -152,38 +191,44 @@ async def scrape_nsn(
     has_open_rfq = dibbs_result.data.has_open_rfqs if dibbs_result.data else False
 
     # Step 2: Contact discovery
-    callback(2, f"Discovering contacts for {len(all_suppliers)} supplier(s)...")
-    logger.debug("Firecrawl configured: %s", config.is_firecrawl_configured())
+    if notify:
+        notify(2, f"Discovering contacts for {len(all_suppliers)} supplier(s)...")
+    logger.debug("Firecrawl configured: %s", _FIRECRAWL_ENABLED)
 
     suppliers_with_contacts = []
     firecrawl_status = "skipped"
     timed_out = False
 
-    # Set wall-clock deadline if timeout_seconds > 0
-    deadline = (time.monotonic() + timeout_seconds) if timeout_seconds > 0 else None
-
-    if all_suppliers and config.is_firecrawl_configured():
+    if not all_suppliers:
+        # Nothing to discover — skip semaphore/gather setup entirely
+        logger.debug("Skipping Firecrawl: no suppliers found")
+    elif _FIRECRAWL_ENABLED:
         success_count = 0
         logger.info("Starting Firecrawl contact discovery for %d suppliers (concurrency=%d)",
-                     len(all_suppliers), config.FIRECRAWL_CONCURRENCY)
+                     len(all_suppliers), _FIRECRAWL_CONCURRENCY)
 
-        firecrawl_sem = asyncio.Semaphore(config.FIRECRAWL_CONCURRENCY)
+        if firecrawl_sem is None:
+            firecrawl_sem = get_firecrawl_semaphore()
 
-        async def _discover_one(idx: int, supplier: dict) -> SupplierWithContact:
-            """Discover contact for a single supplier, respecting deadline."""
-            nonlocal timed_out
+        # Checked before each lookup starts; a Firecrawl call runs in a thread
+        # and can't be interrupted, so in-flight lookups finish holding their slot
+        deadline = (time.monotonic() + timeout_seconds) if timeout_seconds > 0 else None
 
-            # Check deadline before starting
-            if deadline is not None and (deadline - time.monotonic()) <= 5:
-                timed_out = True
-                return SupplierWithContact(
-                    companyName=supplier["companyName"],
-                    cageCode=supplier["cageCode"],
-                    partNumber=supplier["partNumber"],
-                    contact=None
-                )
+        def _no_contact(supplier: dict) -> SupplierWithContact:
+            return SupplierWithContact(
+                companyName=supplier["companyName"],
+                cageCode=supplier["cageCode"],
+                partNumber=supplier["partNumber"],
+                contact=None
+            )
 
+        async def _discover_one(idx: int, supplier: dict) -> Optional[SupplierWithContact]:
+            """Discover contact for a single supplier; None if the deadline passed first."""
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
             async with firecrawl_sem:
+                if deadline is not None and time.monotonic() >= deadline:
+                    return None
                 logger.debug("Finding contact for supplier %d/%d: %s",
                              idx + 1, len(all_suppliers), supplier["companyName"])
                 try:
@@ -209,9 +254,28 @@ async def scrape_nsn(
                     contact=contact
                 )
 
-        results = await asyncio.gather(*[
-            _discover_one(idx, s) for idx, s in enumerate(all_suppliers)
-        ])
+        outcomes = await asyncio.gather(
+            *[_discover_one(idx, s) for idx, s in enumerate(all_suppliers)],
+            return_exceptions=True,
+        )
+        results = []
+        skipped = 0
+        for outcome, supplier in zip(outcomes, all_suppliers):
+            if outcome is None:
+                skipped += 1
+                outcome = _no_contact(supplier)
+            elif isinstance(outcome, BaseException):
+                logger.error("Contact discovery failed for %s: %s", supplier["companyName"], outcome,
+                             exc_info=(type(outcome), outcome, outcome.__traceback__))
+                outcome = _no_contact(supplier)
+            results.append(outcome)
+        if skipped:
+            timed_out = True
+            logger.warning(
+                "scrape_nsn: contact discovery hit %ds deadline, %d/%d suppliers skipped",
+                timeout_seconds, skipped, len(all_suppliers),
+                nsn=nsn,
+            )
         suppliers_with_contacts = list(results)
 
         for swc in suppliers_with_contacts:
@@ -232,10 +296,7 @@ async def scrape_nsn(
         else:
             firecrawl_status = "error"
     else:
-        if not all_suppliers:
-            logger.debug("Skipping Firecrawl: no suppliers found")
-        elif not config.is_firecrawl_configured():
-            logger.debug("Skipping Firecrawl: API not configured")
+        logger.debug("Skipping Firecrawl: API not configured")
         # No Firecrawl - just add suppliers without contacts
         for supplier in all_suppliers:
             suppliers_with_contacts.append(SupplierWithContact(
@@ -246,7 +307,8 @@ async def scrape_nsn(
             ))
 
     # Step 3: Build result
-    callback(3, "Building result...")
+    if notify:
+        notify(3, "Building result...")
 
     logger.info(
         "scrape_nsn: finished in %.1fs",
@@ -280,6 +342,19 @@ async def scrape_nsn(
     return result
 
 
+async def _save_worker(queue: asyncio.Queue) -> None:
+    """Write queued (nsn, result_dict) pairs to disk until a None sentinel."""
+    while True:
+        item = await queue.get()
+        if item is None:
+            break
+        nsn, result_dict = item
+        try:
+            await asyncio.to_thread(save_result, nsn, result_dict)
+        except Exception as e:
+            logger.error("Failed to save result for %s: %s", nsn, e, exc_info=True)
+
+
 async def scrape_batch(
     nsns: List[str],
     progress_callback: Optional[BatchProgressCallback] = None,
@@ -296,144 +371,146 @@ async def scrape_batch(
     Returns:
         BatchProcessingResult with all individual results
     """
-    progress_cb = progress_callback or noop_batch_progress
-    status_cb = batch_status_callback or noop_batch_status
+    progress_cb = progress_callback
+    status_cb = batch_status_callback
 
     batch_result = BatchProcessingResult(
         totalNsns=len(nsns),
         results=[],
         startedAt=get_timestamp()
     )
+    firecrawl_sem = get_firecrawl_semaphore()
+
+    # Disk writes run on a background worker so they overlap the next scrape
+    save_queue: asyncio.Queue = asyncio.Queue()
+    save_task = asyncio.create_task(_save_worker(save_queue))
+
+    try:
+        for idx, nsn in enumerate(nsns, start=1):
+            # Validate NSN
+            if not validate_nsn(nsn):
+                batch_result.results.append(BatchNSNResult(
+                    nsn=nsn,
+                    status="error",
+                    errorMessage=f"Invalid NSN format: {nsn}",
+                    processedAt=get_timestamp()
+                ))
+                batch_result.processed += 1
+                batch_result.failed += 1
+                if status_cb:
+                    status_cb(idx, batch_result.results[-1])
+                continue
+
+            # Format NSN
+            formatted_nsn = format_nsn_with_dashes(nsn)
+
+            # Update batch progress
+            if progress_cb:
+                progress_cb(idx, len(nsns), f"Processing NSN {idx}/{len(nsns)}: {formatted_nsn}")
+
+            # Create batch result entry
+            batch_nsn_result = BatchNSNResult(
+                nsn=formatted_nsn,
+                status="processing"
+            )
+            batch_result.results.append(batch_nsn_result)
+            if status_cb:
+                status_cb(idx, batch_nsn_result)
+
+            try:
+                # Process individual NSN
+                nsn_progress = None
+                if progress_cb:
+                    def nsn_progress(step: int, message: str):
+                        full_message = f"NSN {idx}/{len(nsns)} - Step {step}/3: {message}"
+                        progress_cb(idx, len(nsns), full_message)
+
+                result = await scrape_nsn(formatted_nsn, nsn_progress, firecrawl_sem=firecrawl_sem)
+
+                # Update success
+                batch_nsn_result.status = "success"
+                batch_nsn_result.result = result
+                batch_nsn_result.processed_at = get_timestamp()
+                batch_result.successful += 1
+
+                # Save individual result
+                result_dict = result.model_dump(by_alias=True, exclude_none=True)
+                save_queue.put_nowait((formatted_nsn, result_dict))
+
+                # Raw DIBBS/WBParts payloads are on disk now; free them for large batches
+                if not config.KEEP_RAW_DATA:
+                    result.raw_data = RawData()
+
+            except Exception as e:
+                # Update failure
+                batch_nsn_result.status = "error"
+                batch_nsn_result.error_message = str(e)
+                batch_nsn_result.processed_at = get_timestamp()
+                batch_result.failed += 1
 
-    for idx, nsn in enumerate(nsns, start=1):
-        # Validate NSN
-        if not validate_nsn(nsn):
-            batch_result.results.append(BatchNSNResult(
-                nsn=nsn,
-                status="error",
-                errorMessage=f"Invalid NSN format: {nsn}",
-                processedAt=get_timestamp()
-            ))
             batch_result.processed += 1
-            batch_result.failed += 1
-            status_cb(idx, batch_result.results[-1])
-            continue
-
-        # Format NSN
-        formatted_nsn = format_nsn_with_dashes(nsn)
-
-        # Update batch progress
-        progress_cb(idx, len(nsns), f"Processing NSN {idx}/{len(nsns)}: {formatted_nsn}")
-
-        # Create batch result entry
-        batch_nsn_result = BatchNSNResult(
-            nsn=formatted_nsn,
-            status="processing"
-        )
-        batch_result.results.append(batch_nsn_result)
-        status_cb(idx, batch_nsn_result)
+            if status_cb:
+                status_cb(idx, batch_nsn_result)
 
-        try:
-            # Process individual NSN
-            def nsn_progress(step: int, message: str):
-                full_message = f"NSN {idx}/{len(nsns)} - Step {step}/3: {message}"
-                progress_cb(idx, len(nsns), full_message)
-
-            result = await scrape_nsn(formatted_nsn, nsn_progress)
-
-            # Update success
-            batch_nsn_result.status = "success"
-            batch_nsn_result.result = result
-            batch_nsn_result.processed_at = get_timestamp()
-            batch_result.successful += 1
-
-            # Save individual result
-            result_dict = result.model_dump(by_alias=True, exclude_none=True)
-            save_result(formatted_nsn, result_dict)
-
-        except Exception as e:
-            # Update failure
-            batch_nsn_result.status = "error"
-            batch_nsn_result.error_message = str(e)
-            batch_nsn_result.processed_at = get_timestamp()
-            batch_result.failed += 1
-
-        batch_result.processed += 1
-        status_cb(idx, batch_nsn_result)
-
-        # Rate limiting between NSNs (except last one)
-        if idx < len(nsns):
-            await asyncio.sleep(config.BATCH_DELAY / 1000)
+            # Rate limiting between NSNs (except last one)
+            if idx < len(nsns):
+                await asyncio.sleep(config.BATCH_DELAY / 1000)
+    finally:
+        # Flush pending saves before returning
+        save_queue.put_nowait(None)
+        await save_task
 
     batch_result.completed_at = get_timestamp()
     return batch_result
 
 
-def flatten_to_rows(result: EnhancedRFQResult) -> List[dict]:
+def flatten_to_rows(result: EnhancedRFQResult) -> Iterator[FlatRow]:
     """
     Flatten EnhancedRFQResult to one row per supplier.
 
     Args:
         result: The enhanced RFQ result to flatten
 
-    Returns:
-        List of flat dictionaries, one per supplier
+    Yields:
+        FlatRow tuples, one per supplier (use ``._asdict()`` for JSON)
     """
-    rows = []
     open_status = "OPEN" if result.has_open_rfq else "CLOSED"
 
     if not result.suppliers:
         # No suppliers - output one row with empty fields
-        rows.append({
-            "nsn": result.nsn,
-            "open_status": open_status,
-            "supplier_name": "",
-            "cage_code": "",
-            "email": "",
-            "phone": ""
-        })
-    else:
-        # One row per supplier
-        for supplier in result.suppliers:
-            email = supplier.contact.email if supplier.contact else ""
-            phone = supplier.contact.phone if supplier.contact else ""
-            rows.append({
-                "nsn": result.nsn,
-                "open_status": open_status,
-                "supplier_name": supplier.company_name,
-                "cage_code": supplier.cage_code,
-                "email": email or "",
-                "phone": phone or ""
-            })
-
-    return rows
+        yield FlatRow(result.nsn, open_status, "", "", "", "")
+        return
+
+    # One row per supplier
+    for supplier in result.suppliers:
+        email = supplier.contact.email if supplier.contact else ""
+        phone = supplier.contact.phone if supplier.contact else ""
+        yield FlatRow(
+            result.nsn,
+            open_status,
+            supplier.company_name,
+            supplier.cage_code,
+            email or "",
+            phone or "",
+        )
 
 
-def flatten_batch_results(batch_result: BatchProcessingResult) -> List[dict]:
+def flatten_batch_results(batch_result: BatchProcessingResult) -> Iterator[FlatRow]:
     """
     Flatten all batch results to flat rows.
 
+    Rows are yielded lazily so large batches can be streamed straight into
+    a CSV writer without holding every supplier row in memory at once.
+
     Args:
         batch_result: The batch processing result
 
-    Returns:
-        List of flat dictionaries, one per supplier across all NSNs
+    Yields:
+        FlatRow tuples, one per supplier across all NSNs
     """
-    all_rows = []
-
     for nsn_result in batch_result.results:
         if nsn_result.status == "success" and nsn_result.result:
-            rows = flatten_to_rows(nsn_result.result)
-            all_rows.extend(rows)
+            yield from flatten_to_rows(nsn_result.result)
         elif nsn_result.status == "error":
             # Include error NSNs with empty supplier data
-            all_rows.append({
-                "nsn": nsn_result.nsn,
-                "open_status": "ERROR",
-                "supplier_name": "",
-                "cage_code": "",
-                "email": "",
-                "phone": ""
-            })
-
-    return all_rows
+            yield FlatRow(nsn_result.nsn, "ERROR", "", "", "", "")
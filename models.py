@@ -6,7 +6,7 @@ Type definitions for RFQ data structures matching the TypeScript interfaces.
 
 from datetime import datetime
 from typing import Optional, List, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # ============== DIBBS Types ==============
@@ -17,8 +17,7 @@ class ApprovedSource(BaseModel):
     part_number: str = Field(alias="partNumber")
     company_name: str = Field(alias="companyName")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class Solicitation(BaseModel):
@@ -33,8 +32,7 @@ class Solicitation(BaseModel):
     issue_date: str = Field(alias="issueDate")
     return_by_date: str = Field(alias="returnByDate")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class RFQData(BaseModel):
@@ -48,8 +46,7 @@ class RFQData(BaseModel):
     scraped_at: str = Field(alias="scrapedAt")
     source_url: str = Field(alias="sourceUrl")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class ScrapeResult(BaseModel):
@@ -67,8 +64,7 @@ class WBPartsManufacturer(BaseModel):
     cage_code: str = Field(alias="cageCode")
     company_name: str = Field(alias="companyName")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class WBPartsTechSpec(BaseModel):
@@ -98,8 +94,7 @@ class WBPartsData(BaseModel):
     source_url: str = Field(alias="sourceUrl")
     scraped_at: str = Field(alias="scrapedAt")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class WBPartsScrapeResult(BaseModel):
@@ -132,8 +127,7 @@ class SupplierContact(BaseModel):
     confidence: Literal["high", "medium", "low"] = "low"
     scraped_at: str = Field(alias="scrapedAt")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class SupplierWithContact(BaseModel):
@@ -143,8 +137,7 @@ class SupplierWithContact(BaseModel):
     part_number: str = Field(alias="partNumber")
     contact: Optional[SupplierContact] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 # ============== Enhanced Result ==============
@@ -161,8 +154,7 @@ class WorkflowStatus(BaseModel):
     wbparts_status: Literal["success", "error", "skipped"] = Field("skipped", alias="wbpartsStatus")
     firecrawl_status: Literal["success", "error", "skipped", "partial", "partial_timeout"] = Field("skipped", alias="firecrawlStatus")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class EnhancedRFQResult(BaseModel):
@@ -175,8 +167,7 @@ class EnhancedRFQResult(BaseModel):
     workflow: WorkflowStatus = Field(default_factory=WorkflowStatus)
     scraped_at: str = Field(alias="scrapedAt")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
     def model_dump_json_compatible(self) -> dict:
         """Export with camelCase keys for JSON compatibility"""
@@ -193,8 +184,7 @@ class BatchNSNResult(BaseModel):
     error_message: Optional[str] = Field(None, alias="errorMessage")
     processed_at: Optional[str] = Field(None, alias="processedAt")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class BatchProcessingResult(BaseModel):
@@ -207,8 +197,7 @@ class BatchProcessingResult(BaseModel):
     started_at: str = Field(alias="startedAt")
     completed_at: Optional[str] = Field(None, alias="completedAt")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 # ============== Unified Lead Schema ==============
@@ -252,8 +241,7 @@ class SAMPointOfContact(BaseModel):
     phone: Optional[str] = None
     type: Optional[str] = None  # "primary" or "secondary"
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class SAMOpportunity(BaseModel):
@@ -275,8 +263,7 @@ class SAMOpportunity(BaseModel):
     source_url: str = Field("", alias="sourceUrl")
     notice_type: Optional[str] = Field(None, alias="noticeType")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class SAMSearchResult(BaseModel):
@@ -288,5 +275,4 @@ class SAMSearchResult(BaseModel):
     opportunities: List[SAMOpportunity] = Field(default_factory=list)
     scraped_at: str = Field(alias="scrapedAt")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
@@ -9,21 +9,59 @@ Full workflow:
 """
 
 import asyncio
+import time
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pacsv
+from pyarrow import parquet as pq
 from datetime import datetime
-import io
-import json
+import orjson
 
 import streamlit as st
 
 # Import scraper functions
 import sys
-sys.path.insert(0, str(__file__).rsplit("/", 2)[0])
+from pathlib import Path
+_ROOT = str(Path(__file__).resolve().parents[1])
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from scrapers.dibbs_date import scrape_available_dates, scrape_nsns_by_date
 from core import scrape_nsn
 
 
+# Max NSNs scraped concurrently in Step 3 (DIBBS/WBParts/Firecrawl are
+# further bounded by the shared semaphores in core.py)
+SUPPLIER_SCRAPE_CONCURRENCY = 16
+
+# Minimum seconds between Step 3 progress updates
+PROGRESS_INTERVAL = 0.1
+
+# Rows rendered per page in the result tables
+PAGE_SIZE = 500
+
+# Supplier contact confidence levels kept in Step 3 (LOW is dropped)
+KEEP_CONFIDENCE = frozenset(("high", "medium"))
+
+# Records shown in the JSON previews (the downloads carry everything)
+PREVIEW_ROWS = 3
+
+# Columns of the Step 3 supplier table (rows are collected as tuples in this order)
+SUPPLIER_SCHEMA = pa.schema([
+    ("nsn", pa.string()),
+    ("nomenclature", pa.string()),
+    ("quantity", pa.int32()),
+    ("companyName", pa.string()),
+    ("cageCode", pa.string()),
+    ("partNumber", pa.string()),
+    ("email", pa.string()),
+    ("phone", pa.string()),
+    ("address", pa.string()),
+    ("website", pa.string()),
+    ("confidence", pa.string()),
+])
+
+
 # Page configuration
 st.set_page_config(
     page_title="DIBBS Date Scraper - RFQ Automation",
@@ -32,9 +70,23 @@ st.set_page_config(
 )
 
 
-async def fetch_available_dates():
-    """Fetch available dates from DIBBS"""
-    return await scrape_available_dates()
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Event loop kept in session state and reused across reruns.
+
+    Avoids asyncio.run() building and tearing down a loop on every click.
+    A loop still running from an interrupted rerun is replaced.
+    """
+    loop = st.session_state.get("_event_loop")
+    if loop is None or loop.is_closed() or loop.is_running():
+        loop = asyncio.new_event_loop()
+        st.session_state["_event_loop"] = loop
+    return loop
+
+
+async def fetch_available_dates(force: bool = False):
+    """Fetch available dates from DIBBS (the scraper caches non-empty results)"""
+    return await scrape_available_dates(force=force)
 
 
 async def fetch_nsns_for_date(date: str, max_pages: int):
@@ -47,6 +99,272 @@ async def fetch_supplier_contacts(nsn: str):
     return await scrape_nsn(nsn)
 
 
+async def fetch_all_supplier_contacts(nsns_to_scrape, on_done=None):
+    """
+    Fetch supplier contacts for many NSNs concurrently on one event loop.
+
+    Returns results in input order; failed NSNs yield their exception.
+    on_done(completed_count) is called as each NSN finishes.
+    """
+    sem = asyncio.Semaphore(SUPPLIER_SCRAPE_CONCURRENCY)
+    completed = 0
+
+    async def _one(nsn_data):
+        nonlocal completed
+        async with sem:
+            try:
+                return await fetch_supplier_contacts(nsn_data["nsn"])
+            finally:
+                completed += 1
+                if on_done:
+                    on_done(completed)
+
+    return await asyncio.gather(
+        *[_one(n) for n in nsns_to_scrape], return_exceptions=True
+    )
+
+
+def table_to_csv_bytes(table: pa.Table) -> bytes:
+    """Serialize an Arrow table to CSV using pyarrow's native writer"""
+    buf = pa.BufferOutputStream()
+    pacsv.write_csv(table, buf)
+    return buf.getvalue().to_pybytes()
+
+
+def table_to_parquet_bytes(table: pa.Table) -> bytes:
+    """Serialize an Arrow table to zstd-compressed Parquet"""
+    buf = pa.BufferOutputStream()
+    pq.write_table(table, buf, compression="zstd")
+    return buf.getvalue().to_pybytes()
+
+
+def df_to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize a DataFrame to CSV using pyarrow's native writer"""
+    return table_to_csv_bytes(pa.Table.from_pandas(df, preserve_index=False))
+
+
+def build_supplier_table(rows: list) -> pa.Table:
+    """Build the typed supplier table column-wise from Step 3 row tuples"""
+    columns = list(zip(*rows)) if rows else [()] * len(SUPPLIER_SCHEMA)
+    return pa.Table.from_arrays(
+        [pa.array(col, type=field.type) for col, field in zip(columns, SUPPLIER_SCHEMA)],
+        schema=SUPPLIER_SCHEMA,
+    )
+
+
+def show_paginated(df: pd.DataFrame, key: str):
+    """
+    Render df one page at a time so only PAGE_SIZE rows are serialized per rerun.
+
+    The full df stays available to the caller for the export buttons.
+    """
+    page = 1
+    if len(df) > PAGE_SIZE:
+        n_pages = (len(df) - 1) // PAGE_SIZE + 1
+        # A newer, shorter result may leave the stored page out of range
+        if st.session_state.get(key, 1) > n_pages:
+            st.session_state[key] = 1
+        page = st.number_input(
+            f"Page (of {n_pages}, {PAGE_SIZE} rows each)",
+            min_value=1,
+            max_value=n_pages,
+            key=key,
+        )
+    st.dataframe(
+        df.iloc[(page - 1) * PAGE_SIZE:page * PAGE_SIZE],
+        use_container_width=True,
+        hide_index=True,
+        height=400,
+    )
+
+
+def store_nsn_results(result: dict):
+    """
+    Keep a scrape result in session state with the NSN list as an Arrow table.
+
+    The table pickles as a few contiguous buffers between reruns instead of
+    thousands of small dicts; scrape_results keeps only the summary fields.
+    """
+    st.session_state.nsns_table = pa.Table.from_pylist(result["nsns"])
+    st.session_state.scrape_results = {k: v for k, v in result.items() if k != "nsns"}
+
+
+@st.cache_data(ttl=3600, max_entries=20, show_spinner=False)
+def build_nsn_df(scraped_at: str, date: str, count: int, _nsns: pa.Table) -> pd.DataFrame:
+    """
+    Build the NSN table once per scrape result.
+
+    Keyed on a cheap fingerprint (scrapedAt/date/count); _nsns is excluded
+    from hashing so reruns don't re-convert the full table. Every scrape adds
+    a key, so entries expire and are capped to bound memory across sessions.
+    """
+    df = _nsns.to_pandas()
+    df.columns = ["NSN", "Description", "Solicitation", "QTY", "Issue Date", "Return By"]
+    return df
+
+
+@st.fragment
+def render_step3():
+    """Step 3 as a fragment: its widgets rerun only this block, not Steps 1/2"""
+    st.markdown("### Step 3: Scrape Supplier Contacts (Optional)")
+
+    if not st.session_state.scrape_results or not st.session_state.nsns_table.num_rows:
+        st.warning("⚠️ Please scrape NSNs first (Step 2)")
+    else:
+        nsns_table = st.session_state.nsns_table
+        total_nsns = nsns_table.num_rows
+
+        st.info(f"Found **{total_nsns} NSNs**. You can now scrape supplier contacts for each one using Firecrawl.")
+
+        col1, col2, col3 = st.columns([1, 1, 1])
+
+        with col1:
+            scrape_all_nsns = st.checkbox(
+                "Scrape All NSNs",
+                value=False,
+                help="Scrape contacts for all NSNs (may take a while)"
+            )
+
+        with col2:
+            if scrape_all_nsns:
+                max_nsns = total_nsns
+                st.text_input("Max NSNs", value=f"All ({total_nsns})", disabled=True)
+            else:
+                max_nsns = st.number_input(
+                    "Max NSNs to Scrape",
+                    min_value=1,
+                    max_value=total_nsns,
+                    value=min(5, total_nsns),
+                    help="Limit number of NSNs to scrape contacts for"
+                )
+
+        with col3:
+            st.markdown("<br>", unsafe_allow_html=True)
+            scrape_suppliers_button = st.button(
+                "🔍 Scrape Supplier Contacts",
+                type="primary",
+                use_container_width=True
+            )
+
+        if scrape_suppliers_button:
+            nsns_to_scrape = nsns_table.slice(0, max_nsns).to_pylist()
+            supplier_results = []
+
+            progress_bar = st.progress(0)
+            status_text = st.empty()
+
+            total = len(nsns_to_scrape)
+            last_update = 0.0
+
+            def _on_done(completed):
+                # Each update is a websocket round-trip; cap them at ~10/s
+                nonlocal last_update
+                now = time.monotonic()
+                if completed != total and now - last_update < PROGRESS_INTERVAL:
+                    return
+                last_update = now
+                status_text.markdown(f"**Processing {completed}/{total}**")
+                progress_bar.progress(completed / total)
+
+            results = get_event_loop().run_until_complete(fetch_all_supplier_contacts(nsns_to_scrape, _on_done))
+
+            append = supplier_results.append
+            for nsn_data, result in zip(nsns_to_scrape, results):
+                nsn = nsn_data["nsn"]
+                if isinstance(result, BaseException):
+                    st.warning(f"Failed to scrape {nsn}: {str(result)}")
+                    continue
+
+                # Per-NSN fields shared by every supplier row
+                nomenclature = nsn_data.get("nomenclature", "")
+                quantity = nsn_data.get("quantity", 0)
+
+                # Filter to HIGH and MEDIUM confidence
+                for supplier in result.suppliers:
+                    c = supplier.contact
+                    if c is None or c.confidence not in KEEP_CONFIDENCE:
+                        continue
+                    append((
+                        nsn,
+                        nomenclature,
+                        quantity,
+                        supplier.company_name,
+                        supplier.cage_code,
+                        supplier.part_number,
+                        c.email or "",
+                        c.phone or "",
+                        c.address or "",
+                        c.website or "",
+                        c.confidence,
+                    ))
+
+            progress_bar.progress(1.0)
+            status_text.markdown(f"**✅ Complete!** Found {len(supplier_results)} supplier contacts.")
+
+            st.session_state.supplier_results = build_supplier_table(supplier_results)
+
+        # Display Supplier Results
+        if st.session_state.supplier_results is not None:
+            suppliers = st.session_state.supplier_results
+            scrape_date = st.session_state.scrape_results["date"]
+
+            st.markdown("---")
+            st.markdown("### 📋 Supplier Contact Results")
+
+            st.metric("Total Supplier Contacts", suppliers.num_rows)
+
+            if suppliers.num_rows:
+                # Results table
+                show_paginated(suppliers.to_pandas(), key="supplier_page")
+
+                # Export section
+                st.markdown("#### 📥 Export Supplier Data")
+
+                col1, col2, col3 = st.columns(3)
+
+                with col1:
+                    csv_data = table_to_csv_bytes(suppliers)
+
+                    st.download_button(
+                        label="📊 Download Suppliers CSV",
+                        data=csv_data,
+                        file_name=f"suppliers_{scrape_date}.csv",
+                        mime="text/csv",
+                        use_container_width=True
+                    )
+
+                with col2:
+                    # Serialized on click, on Streamlit's download thread
+                    def json_data():
+                        return orjson.dumps(suppliers.to_pylist(), option=orjson.OPT_INDENT_2)
+
+                    st.download_button(
+                        label="📥 Download Suppliers JSON",
+                        data=json_data,
+                        file_name=f"suppliers_{scrape_date}.json",
+                        mime="application/json",
+                        use_container_width=True
+                    )
+
+                with col3:
+                    st.download_button(
+                        label="📦 Download Suppliers Parquet",
+                        data=lambda: table_to_parquet_bytes(suppliers),
+                        file_name=f"suppliers_{scrape_date}.parquet",
+                        mime="application/octet-stream",
+                        use_container_width=True
+                    )
+
+                # JSON Preview
+                st.markdown("#### 🔍 Supplier JSON Preview")
+                with st.expander("View Supplier JSON Structure", expanded=False):
+                    preview = suppliers.slice(0, PREVIEW_ROWS).to_pylist()
+                    st.code(orjson.dumps(preview, option=orjson.OPT_INDENT_2).decode(), language="json")
+
+            else:
+                st.info("No supplier contacts found (all were LOW confidence).")
+
+
 def main():
     """Main Streamlit page"""
 
@@ -60,6 +378,8 @@ def main():
         st.session_state.available_dates = None
     if "scrape_results" not in st.session_state:
         st.session_state.scrape_results = None
+    if "nsns_table" not in st.session_state:
+        st.session_state.nsns_table = None
     if "supplier_results" not in st.session_state:
         st.session_state.supplier_results = None
 
@@ -83,9 +403,15 @@ def main():
     if load_dates_button:
         with st.spinner("Fetching available dates from DIBBS..."):
             try:
-                result = asyncio.run(fetch_available_dates())
-                st.session_state.available_dates = result["dates"]
-                st.success(f"Found {len(result['dates'])} available dates!")
+                # Clicking again once dates are loaded is an explicit refresh
+                result = get_event_loop().run_until_complete(fetch_available_dates(
+                    force=st.session_state.available_dates is not None
+                ))
+                if result["dates"]:
+                    st.session_state.available_dates = tuple(result["dates"])
+                    st.success(f"Found {len(result['dates'])} available dates!")
+                else:
+                    st.error("No dates returned from DIBBS. Please try again.")
             except Exception as e:
                 st.error(f"Failed to fetch dates: {str(e)}")
 
@@ -144,8 +470,8 @@ def main():
             pages_msg = "all pages" if max_pages == 0 else f"{max_pages} page(s)"
             with st.spinner(f"Scraping NSNs for {selected_date} ({pages_msg})..."):
                 try:
-                    result = asyncio.run(fetch_nsns_for_date(selected_date, max_pages))
-                    st.session_state.scrape_results = result
+                    result = get_event_loop().run_until_complete(fetch_nsns_for_date(selected_date, max_pages))
+                    store_nsn_results(result)
                     st.session_state.supplier_results = None  # Reset supplier results
                     st.success(f"Found {result['totalNsns']} NSNs!")
                 except Exception as e:
@@ -154,6 +480,7 @@ def main():
         # Display NSN Results
         if st.session_state.scrape_results:
             result = st.session_state.scrape_results
+            nsns_table = st.session_state.nsns_table
 
             st.markdown("---")
             st.markdown("### 📊 NSN Results")
@@ -170,30 +497,22 @@ def main():
             with col4:
                 st.metric("Scraped At", result["scrapedAt"][:10])
 
-            if result["nsns"]:
+            if nsns_table.num_rows:
                 # Results table
                 st.markdown("#### NSN List")
 
-                df = pd.DataFrame(result["nsns"])
-                df.columns = ["NSN", "Description", "Solicitation", "QTY", "Issue Date", "Return By"]
+                df = build_nsn_df(result["scrapedAt"], result["date"], nsns_table.num_rows, nsns_table)
 
-                st.dataframe(
-                    df,
-                    use_container_width=True,
-                    hide_index=True,
-                    height=400
-                )
+                show_paginated(df, key="nsn_page")
 
                 # Export section
                 st.markdown("#### 📥 Export NSN Data")
 
-                col1, col2 = st.columns(2)
+                col1, col2, col3 = st.columns(3)
 
                 with col1:
                     # CSV download
-                    csv_buffer = io.StringIO()
-                    df.to_csv(csv_buffer, index=False)
-                    csv_data = csv_buffer.getvalue()
+                    csv_data = df_to_csv_bytes(df)
 
                     st.download_button(
                         label="📊 Download CSV",
@@ -204,8 +523,12 @@ def main():
                     )
 
                 with col2:
-                    # JSON download
-                    json_data = json.dumps(result, indent=2)
+                    # JSON download, serialized on click on Streamlit's download thread
+                    def json_data():
+                        return orjson.dumps(
+                            {**result, "nsns": nsns_table.to_pylist()},
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                        )
 
                     st.download_button(
                         label="📥 Download JSON",
@@ -215,10 +538,20 @@ def main():
                         use_container_width=True
                     )
 
+                with col3:
+                    st.download_button(
+                        label="📦 Download Parquet",
+                        data=lambda: table_to_parquet_bytes(pa.Table.from_pandas(df, preserve_index=False)),
+                        file_name=f"nsns_{result['date']}.parquet",
+                        mime="application/octet-stream",
+                        use_container_width=True
+                    )
+
                 # JSON Preview
                 st.markdown("#### 🔍 JSON Preview")
                 with st.expander("View JSON Structure", expanded=False):
-                    st.json(result)
+                    preview = {**result, "nsns": nsns_table.slice(0, PREVIEW_ROWS).to_pylist()}
+                    st.code(orjson.dumps(preview, option=orjson.OPT_INDENT_2).decode(), language="json")
 
             else:
                 st.info("No NSNs found for this date.")
@@ -228,145 +561,7 @@ def main():
     # ==========================================
     # STEP 3: Scrape Supplier Contacts
     # ==========================================
-    st.markdown("### Step 3: Scrape Supplier Contacts (Optional)")
-
-    if not st.session_state.scrape_results or not st.session_state.scrape_results.get("nsns"):
-        st.warning("⚠️ Please scrape NSNs first (Step 2)")
-    else:
-        nsns = st.session_state.scrape_results["nsns"]
-        total_nsns = len(nsns)
-
-        st.info(f"Found **{total_nsns} NSNs**. You can now scrape supplier contacts for each one using Firecrawl.")
-
-        col1, col2, col3 = st.columns([1, 1, 1])
-
-        with col1:
-            scrape_all_nsns = st.checkbox(
-                "Scrape All NSNs",
-                value=False,
-                help="Scrape contacts for all NSNs (may take a while)"
-            )
-
-        with col2:
-            if scrape_all_nsns:
-                max_nsns = total_nsns
-                st.text_input("Max NSNs", value=f"All ({total_nsns})", disabled=True)
-            else:
-                max_nsns = st.number_input(
-                    "Max NSNs to Scrape",
-                    min_value=1,
-                    max_value=total_nsns,
-                    value=min(5, total_nsns),
-                    help="Limit number of NSNs to scrape contacts for"
-                )
-
-        with col3:
-            st.markdown("<br>", unsafe_allow_html=True)
-            scrape_suppliers_button = st.button(
-                "🔍 Scrape Supplier Contacts",
-                type="primary",
-                use_container_width=True
-            )
-
-        if scrape_suppliers_button:
-            nsns_to_scrape = nsns[:max_nsns]
-            supplier_results = []
-
-            progress_bar = st.progress(0)
-            status_text = st.empty()
-
-            for idx, nsn_data in enumerate(nsns_to_scrape):
-                nsn = nsn_data["nsn"]
-                status_text.markdown(f"**Processing {idx + 1}/{len(nsns_to_scrape)}:** {nsn}")
-                progress_bar.progress((idx + 1) / len(nsns_to_scrape))
-
-                try:
-                    result = asyncio.run(fetch_supplier_contacts(nsn))
-
-                    # Filter to HIGH and MEDIUM confidence
-                    filtered_suppliers = []
-                    for supplier in result.suppliers:
-                        if supplier.contact and supplier.contact.confidence in ["high", "medium"]:
-                            filtered_suppliers.append({
-                                "nsn": nsn,
-                                "nomenclature": nsn_data.get("nomenclature", ""),
-                                "quantity": nsn_data.get("quantity", 0),
-                                "companyName": supplier.company_name,
-                                "cageCode": supplier.cage_code,
-                                "partNumber": supplier.part_number,
-                                "email": supplier.contact.email or "",
-                                "phone": supplier.contact.phone or "",
-                                "address": supplier.contact.address or "",
-                                "website": supplier.contact.website or "",
-                                "confidence": supplier.contact.confidence
-                            })
-
-                    supplier_results.extend(filtered_suppliers)
-
-                except Exception as e:
-                    st.warning(f"Failed to scrape {nsn}: {str(e)}")
-
-            progress_bar.progress(1.0)
-            status_text.markdown(f"**✅ Complete!** Found {len(supplier_results)} supplier contacts.")
-
-            st.session_state.supplier_results = supplier_results
-
-        # Display Supplier Results
-        if st.session_state.supplier_results:
-            suppliers = st.session_state.supplier_results
-
-            st.markdown("---")
-            st.markdown("### 📋 Supplier Contact Results")
-
-            st.metric("Total Supplier Contacts", len(suppliers))
-
-            if suppliers:
-                # Results table
-                df_suppliers = pd.DataFrame(suppliers)
-
-                st.dataframe(
-                    df_suppliers,
-                    use_container_width=True,
-                    hide_index=True,
-                    height=400
-                )
-
-                # Export section
-                st.markdown("#### 📥 Export Supplier Data")
-
-                col1, col2 = st.columns(2)
-
-                with col1:
-                    csv_buffer = io.StringIO()
-                    df_suppliers.to_csv(csv_buffer, index=False)
-                    csv_data = csv_buffer.getvalue()
-
-                    st.download_button(
-                        label="📊 Download Suppliers CSV",
-                        data=csv_data,
-                        file_name=f"suppliers_{st.session_state.scrape_results['date']}.csv",
-                        mime="text/csv",
-                        use_container_width=True
-                    )
-
-                with col2:
-                    json_data = json.dumps(suppliers, indent=2)
-
-                    st.download_button(
-                        label="📥 Download Suppliers JSON",
-                        data=json_data,
-                        file_name=f"suppliers_{st.session_state.scrape_results['date']}.json",
-                        mime="application/json",
-                        use_container_width=True
-                    )
-
-                # JSON Preview
-                st.markdown("#### 🔍 Supplier JSON Preview")
-                with st.expander("View Supplier JSON Structure", expanded=False):
-                    st.json(suppliers[:5] if len(suppliers) > 5 else suppliers)
-
-            else:
-                st.info("No supplier contacts found (all were LOW confidence).")
+    render_step3()
 
     # ==========================================
     # Sidebar
@@ -378,7 +573,7 @@ def main():
         1. **Load Dates** - Get available dates from DIBBS
         2. **Scrape NSNs** - Get all NSNs for a date
         3. **Scrape Contacts** - Get supplier info via Firecrawl
-        4. **Export** - Download CSV or JSON
+        4. **Export** - Download CSV, JSON or Parquet
         """)
 
         st.markdown("---")
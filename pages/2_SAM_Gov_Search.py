@@ -12,20 +12,49 @@ Workflow:
 
 import asyncio
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pacsv
+from pyarrow import parquet as pq
 from datetime import datetime
-import io
-import json
+import orjson
 
 import streamlit as st
 
 # Import scraper functions
 import sys
-sys.path.insert(0, str(__file__).rsplit("/", 2)[0])
+from pathlib import Path
+_ROOT = str(Path(__file__).resolve().parents[1])
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from scrapers.sam_gov import search_opportunities, VALID_SET_ASIDES, VALID_PTYPES
 from config import config
 
 
+# Rows rendered per page in the result tables
+PAGE_SIZE = 500
+
+# Records shown in the JSON preview (the download carries everything)
+PREVIEW_ROWS = 3
+
+# Display/export columns for the opportunities table
+OPPORTUNITY_COLS = (
+    "Title", "Solicitation #", "Type", "Set-Aside", "Agency", "Posted", "Deadline",
+    "NAICS", "Contact Name", "Contact Email", "Contact Phone", "Location", "Link",
+)
+
+# Source fields behind OPPORTUNITY_COLS, in the same order
+_OPP_DISPLAY_FIELDS = (
+    "title", "solicitationNumber", "noticeType", "setAside", "agency", "postedDate",
+    "responseDeadline", "naicsCode", "contact_name", "contact_email", "contact_phone",
+    "placeOfPerformance", "sourceUrl",
+)
+_OPP_SOURCE_FIELDS = _OPP_DISPLAY_FIELDS[:8] + (
+    "placeOfPerformance", "sourceUrl", "department", "pointOfContact",
+)
+_CONTACT_FIELDS = ("name", "email", "phone", "type")
+
+
 # Page configuration
 st.set_page_config(
     page_title="SAM.gov Search - RFQ Automation",
@@ -34,6 +63,20 @@ st.set_page_config(
 )
 
 
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Event loop kept in session state and reused across reruns.
+
+    Avoids asyncio.run() building and tearing down a loop on every click.
+    A loop still running from an interrupted rerun is replaced.
+    """
+    loop = st.session_state.get("_event_loop")
+    if loop is None or loop.is_closed() or loop.is_running():
+        loop = asyncio.new_event_loop()
+        st.session_state["_event_loop"] = loop
+    return loop
+
+
 async def fetch_opportunities(days_back, set_aside, ptype, naics_code, keyword, max_pages, enrich_contacts=True):
     """Fetch opportunities from SAM.gov"""
     return await search_opportunities(
@@ -47,6 +90,201 @@ async def fetch_opportunities(days_back, set_aside, ptype, naics_code, keyword,
     )
 
 
+def df_to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize a DataFrame to CSV using pyarrow's native writer"""
+    buf = pa.BufferOutputStream()
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), buf)
+    return buf.getvalue().to_pybytes()
+
+
+def table_to_parquet_bytes(table: pa.Table) -> bytes:
+    """Serialize an Arrow table to zstd-compressed Parquet"""
+    buf = pa.BufferOutputStream()
+    pq.write_table(table, buf, compression="zstd")
+    return buf.getvalue().to_pybytes()
+
+
+def show_paginated(df: pd.DataFrame, key: str):
+    """
+    Render df one page at a time so only PAGE_SIZE rows are serialized per rerun.
+
+    The full df stays available to the caller for the export buttons.
+    """
+    page = 1
+    if len(df) > PAGE_SIZE:
+        n_pages = (len(df) - 1) // PAGE_SIZE + 1
+        # A newer, shorter result may leave the stored page out of range
+        if st.session_state.get(key, 1) > n_pages:
+            st.session_state[key] = 1
+        page = st.number_input(
+            f"Page (of {n_pages}, {PAGE_SIZE} rows each)",
+            min_value=1,
+            max_value=n_pages,
+            key=key,
+        )
+    st.dataframe(
+        df.iloc[(page - 1) * PAGE_SIZE:page * PAGE_SIZE],
+        use_container_width=True,
+        hide_index=True,
+        height=400,
+    )
+
+
+class SearchFailed(Exception):
+    """A search that returned an error; carries the result for display."""
+
+    def __init__(self, result: dict):
+        super().__init__(result["error"])
+        self.result = result
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def cached_opportunities(days_back, set_aside, ptype, naics_code, keyword, max_pages, enrich_contacts=True):
+    """
+    Search results keyed on the filter values, cached for 10 minutes.
+
+    Raises SearchFailed on an API error; st.cache_data doesn't store
+    exceptions, so the next click retries instead of replaying the failure.
+    """
+    result = get_event_loop().run_until_complete(fetch_opportunities(
+        days_back=days_back,
+        set_aside=set_aside,
+        ptype=ptype,
+        naics_code=naics_code,
+        keyword=keyword,
+        max_pages=max_pages,
+        enrich_contacts=enrich_contacts,
+    ))
+    if result.get("error"):
+        raise SearchFailed(result)
+    return result
+
+
+def store_search_results(result: dict):
+    """
+    Keep a search result in session state with the opportunities as an Arrow table.
+
+    The table pickles as a few contiguous buffers between reruns instead of
+    nested dicts; sam_results keeps only the summary fields.
+    """
+    opps = result.get("opportunities", [])
+    # Opportunities are dumped with exclude_none, so rows carry different keys;
+    # take the union (from_pylist would keep only the first row's columns)
+    fields = dict.fromkeys(key for opp in opps for key in opp)
+    st.session_state.sam_opps_table = pa.table({key: [opp.get(key) for opp in opps] for key in fields})
+    st.session_state.sam_results = {k: v for k, v in result.items() if k != "opportunities"}
+
+
+@st.cache_data(ttl=600, max_entries=20, show_spinner=False)
+def build_opportunities_df(scraped_at: str, count: int, _opps: pa.Table) -> pd.DataFrame:
+    """
+    Build the opportunities table once per search result.
+
+    Keyed on a cheap fingerprint (scrapedAt/count); _opps is excluded from
+    hashing so reruns don't re-convert the full table. Every search adds a
+    key, so entries expire with the search cache and are capped.
+    """
+    df = _opps.to_pandas().reindex(columns=_OPP_SOURCE_FIELDS)
+
+    # Primary contact per opportunity, falling back to the first listed
+    poc = df["pointOfContact"].explode().dropna()
+    contacts = pd.DataFrame(poc.tolist(), index=poc.index).reindex(columns=_CONTACT_FIELDS)
+    contacts = contacts.sort_values("type", key=lambda t: t != "primary", kind="stable")
+    primary = contacts[~contacts.index.duplicated()]
+    df = df.join(primary[["name", "email", "phone"]].add_prefix("contact_"))
+
+    agency = df["agency"]
+    df["agency"] = agency.where(agency.notna() & (agency != ""), df["department"])
+    df["postedDate"] = df["postedDate"].astype("string").str.slice(0, 10)
+    df["responseDeadline"] = df["responseDeadline"].astype("string").str.slice(0, 10)
+
+    df = df[list(_OPP_DISPLAY_FIELDS)].fillna("")
+    df.columns = OPPORTUNITY_COLS
+    return df
+
+
+@st.fragment
+def render_results():
+    """Results as a fragment: pagination and downloads don't rerun the search form"""
+    if st.session_state.sam_results:
+        result = st.session_state.sam_results
+        opps_table = st.session_state.sam_opps_table
+
+        if result.get("error") and not opps_table.num_rows:
+            pass  # Error already shown above
+        else:
+            st.markdown("---")
+            st.markdown("### 📊 Search Results")
+
+            # Summary metrics
+            col1, col2, col3, col4 = st.columns(4)
+
+            with col1:
+                st.metric("Total Opportunities", result["totalOpportunities"])
+            with col2:
+                st.metric("Results Fetched", opps_table.num_rows)
+            with col3:
+                st.metric("Pages Scraped", f"{result['pagesScraped']}/{result['totalPages']}")
+            with col4:
+                st.metric("Scraped At", result["scrapedAt"][:10])
+
+            if opps_table.num_rows:
+                df = build_opportunities_df(result["scrapedAt"], opps_table.num_rows, opps_table)
+
+                st.markdown("#### Opportunities")
+                show_paginated(df, key="opportunity_page")
+
+                # Export section
+                st.markdown("#### 📥 Export Data")
+
+                col1, col2, col3 = st.columns(3)
+
+                with col1:
+                    csv_data = df_to_csv_bytes(df)
+
+                    st.download_button(
+                        label="📊 Download CSV",
+                        data=csv_data,
+                        file_name=f"sam_gov_{datetime.now().strftime('%Y-%m-%d')}.csv",
+                        mime="text/csv",
+                        use_container_width=True,
+                    )
+
+                with col2:
+                    # Serialized on click, on Streamlit's download thread
+                    def json_data():
+                        return orjson.dumps(
+                            {**result, "opportunities": opps_table.to_pylist()},
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                        )
+
+                    st.download_button(
+                        label="📥 Download JSON",
+                        data=json_data,
+                        file_name=f"sam_gov_{datetime.now().strftime('%Y-%m-%d')}.json",
+                        mime="application/json",
+                        use_container_width=True,
+                    )
+
+                with col3:
+                    st.download_button(
+                        label="📦 Download Parquet",
+                        data=lambda: table_to_parquet_bytes(pa.Table.from_pandas(df, preserve_index=False)),
+                        file_name=f"sam_gov_{datetime.now().strftime('%Y-%m-%d')}.parquet",
+                        mime="application/octet-stream",
+                        use_container_width=True,
+                    )
+
+                # JSON Preview
+                st.markdown("#### 🔍 JSON Preview")
+                with st.expander("View JSON Structure", expanded=False):
+                    preview = {**result, "opportunities": opps_table.slice(0, PREVIEW_ROWS).to_pylist()}
+                    st.code(orjson.dumps(preview, option=orjson.OPT_INDENT_2).decode(), language="json")
+
+            else:
+                st.info("No opportunities found matching your criteria.")
+
+
 def main():
     """Main Streamlit page"""
 
@@ -66,6 +304,8 @@ def main():
     # Initialize session state
     if "sam_results" not in st.session_state:
         st.session_state.sam_results = None
+    if "sam_opps_table" not in st.session_state:
+        st.session_state.sam_opps_table = None
 
     # ==========================================
     # Search Filters
@@ -153,7 +393,7 @@ def main():
         spinner_msg = "Searching SAM.gov and fetching contacts..." if enrich_contacts else "Searching SAM.gov..."
         with st.spinner(spinner_msg):
             try:
-                result = asyncio.run(fetch_opportunities(
+                result = cached_opportunities(
                     days_back=days_back,
                     set_aside=set_aside,
                     ptype=ptype,
@@ -161,13 +401,13 @@ def main():
                     keyword=keyword,
                     max_pages=max_pages,
                     enrich_contacts=enrich_contacts,
-                ))
-                st.session_state.sam_results = result
+                )
+                store_search_results(result)
+                st.success(f"Found {result['totalOpportunities']} opportunities!")
 
-                if result.get("error"):
-                    st.error(f"API Error: {result['error']}")
-                else:
-                    st.success(f"Found {result['totalOpportunities']} opportunities!")
+            except SearchFailed as e:
+                store_search_results(e.result)
+                st.error(f"API Error: {e}")
 
             except Exception as e:
                 st.error(f"Search failed: {str(e)}")
@@ -175,104 +415,7 @@ def main():
     # ==========================================
     # Results Display
     # ==========================================
-    if st.session_state.sam_results:
-        result = st.session_state.sam_results
-
-        if result.get("error") and not result.get("opportunities"):
-            pass  # Error already shown above
-        else:
-            st.markdown("---")
-            st.markdown("### 📊 Search Results")
-
-            # Summary metrics
-            col1, col2, col3, col4 = st.columns(4)
-
-            with col1:
-                st.metric("Total Opportunities", result["totalOpportunities"])
-            with col2:
-                st.metric("Results Fetched", len(result.get("opportunities", [])))
-            with col3:
-                st.metric("Pages Scraped", f"{result['pagesScraped']}/{result['totalPages']}")
-            with col4:
-                st.metric("Scraped At", result["scrapedAt"][:10])
-
-            opps = result.get("opportunities", [])
-            if opps:
-                # Build dataframe
-                rows = []
-                for opp in opps:
-                    # Get primary contact
-                    contacts = opp.get("pointOfContact", [])
-                    primary = next((c for c in contacts if c.get("type") == "primary"), None)
-                    if not primary and contacts:
-                        primary = contacts[0]
-
-                    rows.append({
-                        "Title": opp.get("title", ""),
-                        "Solicitation #": opp.get("solicitationNumber", ""),
-                        "Type": opp.get("noticeType", ""),
-                        "Set-Aside": opp.get("setAside", ""),
-                        "Agency": opp.get("agency") or opp.get("department", ""),
-                        "Posted": opp.get("postedDate", "")[:10] if opp.get("postedDate") else "",
-                        "Deadline": opp.get("responseDeadline", "")[:10] if opp.get("responseDeadline") else "",
-                        "NAICS": opp.get("naicsCode", ""),
-                        "Contact Name": primary.get("name", "") if primary else "",
-                        "Contact Email": primary.get("email", "") if primary else "",
-                        "Contact Phone": primary.get("phone", "") if primary else "",
-                        "Location": opp.get("placeOfPerformance", ""),
-                        "Link": opp.get("sourceUrl", ""),
-                    })
-
-                df = pd.DataFrame(rows)
-
-                st.markdown("#### Opportunities")
-                st.dataframe(
-                    df,
-                    use_container_width=True,
-                    hide_index=True,
-                    height=400,
-                )
-
-                # Export section
-                st.markdown("#### 📥 Export Data")
-
-                col1, col2 = st.columns(2)
-
-                with col1:
-                    csv_buffer = io.StringIO()
-                    df.to_csv(csv_buffer, index=False)
-                    csv_data = csv_buffer.getvalue()
-
-                    st.download_button(
-                        label="📊 Download CSV",
-                        data=csv_data,
-                        file_name=f"sam_gov_{datetime.now().strftime('%Y-%m-%d')}.csv",
-                        mime="text/csv",
-                        use_container_width=True,
-                    )
-
-                with col2:
-                    json_data = json.dumps(result, indent=2)
-
-                    st.download_button(
-                        label="📥 Download JSON",
-                        data=json_data,
-                        file_name=f"sam_gov_{datetime.now().strftime('%Y-%m-%d')}.json",
-                        mime="application/json",
-                        use_container_width=True,
-                    )
-
-                # JSON Preview
-                st.markdown("#### 🔍 JSON Preview")
-                with st.expander("View JSON Structure", expanded=False):
-                    preview = {
-                        **{k: v for k, v in result.items() if k != "opportunities"},
-                        "opportunities": opps[:3],
-                    }
-                    st.json(preview)
-
-            else:
-                st.info("No opportunities found matching your criteria.")
+    render_results()
 
     # ==========================================
     # Sidebar
@@ -284,7 +427,7 @@ def main():
         1. **Set Filters** - Days back, set-aside, type
         2. **Search** - Query SAM.gov API
         3. **Review** - Browse opportunities
-        4. **Export** - Download CSV or JSON
+        4. **Export** - Download CSV, JSON or Parquet
         """)
 
         st.markdown("---")
@@ -6,18 +6,79 @@ Shows opportunity counts, status breakdown, and recent activity.
 """
 
 import asyncio
-import pandas as pd
 from datetime import datetime
 import json
 
 import streamlit as st
 
 import sys
-sys.path.insert(0, str(__file__).rsplit("/", 2)[0])
+from pathlib import Path
+_ROOT = str(Path(__file__).resolve().parents[1])
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from config import config
 
 
+# Source status cards (every source has a Playwright/feed path, so all are Active)
+SOURCES = {
+    "DIBBS": {"icon": "📅", "endpoint": "/api/available-dates", "status": "Active"},
+    "SAM.gov": {"icon": "🏛️", "endpoint": "/api/search-sam", "status": "Active"},
+    "Canada Buys": {"icon": "🍁", "endpoint": "/api/search-canada-buys", "status": "Active"},
+    "Alberta Purchasing": {"icon": "🏔️", "endpoint": "/api/search-alberta-purchasing", "status": "Active"},
+}
+
+# Procurement workflow stages
+PIPELINE_STAGES = [
+    {"stage": "New", "description": "Freshly discovered opportunities", "icon": "🆕"},
+    {"stage": "Outreach Sent", "description": "Initial email sent to supplier", "icon": "📧"},
+    {"stage": "Quote Received", "description": "Supplier provided pricing", "icon": "💰"},
+    {"stage": "Substitute y/n", "description": "Supplier offered alternative", "icon": "🔄"},
+    {"stage": "Send", "description": "Ready for next action", "icon": "📤"},
+    {"stage": "Not Yet", "description": "Paused for manual review", "icon": "⏸️"},
+]
+
+# (service, purpose) for the configuration status list; main() checks each in this order
+CONFIG_ITEMS = [
+    ("Firecrawl API", "Contact discovery"),
+    ("SAM.gov API Key", "SAM.gov search (Playwright fallback available)"),
+    ("OpenRouter LLM", "Email classification & drafting"),
+    ("Email (SMTP/IMAP)", "Email outreach automation"),
+    ("RFQ API Key", "API authentication"),
+]
+
+# API endpoints reference table rows
+ENDPOINTS = [
+    ("GET", "/health", "Health check", "None"),
+    ("POST", "/api/batch", "Batch NSN processing", "None"),
+    ("POST", "/api/scrape-nsns-by-date", "DIBBS date scraper", "X-API-Key"),
+    ("POST", "/api/scrape-nsn-suppliers", "NSN supplier contacts", "X-API-Key"),
+    ("GET", "/api/available-dates", "DIBBS available dates", "X-API-Key"),
+    ("POST", "/api/search-sam", "SAM.gov search", "X-API-Key"),
+    ("POST", "/api/extract-document", "PDF/OCR extraction", "X-API-Key"),
+    ("POST", "/api/search-canada-buys", "Canada Buys search", "X-API-Key"),
+    ("POST", "/api/search-alberta-purchasing", "Alberta Purchasing search", "X-API-Key"),
+    ("POST", "/api/classify-thread", "Email classification", "X-API-Key"),
+    ("POST", "/api/draft-reply", "Email draft reply", "X-API-Key"),
+    ("POST", "/api/extract-quote", "Quote data extraction", "X-API-Key"),
+]
+
+# n8n workflow reference table rows
+WORKFLOWS = [
+    ("RFQ Daily Scraper", "workflow-rfq-daily.json", "Daily DIBBS → Suppliers → Sheets"),
+    ("SAM.gov Daily", "workflow-sam-daily.json", "Daily SAM.gov search → Sheets"),
+    ("Document Pipeline", "workflow-document-pipeline.json", "PDF extraction → Sheets"),
+    ("Canada Buys Daily", "workflow-canada-buys-daily.json", "Canada Buys feed → Sheets"),
+    ("Alberta Daily", "workflow-alberta-daily.json", "APC scrape → Sheets"),
+    ("Email Outreach", "workflow-email-outreach.json", "New row → Send email → Update status"),
+    ("Email Monitor", "workflow-email-monitor.json", "IMAP poll → Classify → Draft reply → Sheets"),
+]
+
+# Equal-width flex row used for the source cards and pipeline stages
+_ROW_STYLE = "display:flex;gap:1rem"
+_CELL_STYLE = "flex:1;min-width:0"
+
+
 # Page configuration
 st.set_page_config(
     page_title="CRM Dashboard - RFQ Automation",
@@ -26,6 +87,56 @@ st.set_page_config(
 )
 
 
+@st.cache_data(show_spinner=False)
+def source_cards_html() -> str:
+    """Source status cards as one HTML row, built once and reused across reruns"""
+    cards = "".join(
+        f'<div style="{_CELL_STYLE}">'
+        f"<h4>{info['icon']} {name}</h4>"
+        f"<p><strong>Status:</strong> {info['status']}</p>"
+        f"<p><strong>Endpoint:</strong> <code>{info['endpoint']}</code></p>"
+        "</div>"
+        for name, info in SOURCES.items()
+    )
+    return f'<div style="{_ROW_STYLE}">{cards}</div>'
+
+
+@st.cache_data(show_spinner=False)
+def pipeline_stages_html() -> str:
+    """Pipeline stage cells as one HTML row, built once and reused across reruns"""
+    cells = "".join(
+        f'<div style="{_CELL_STYLE}">'
+        f"<strong>{stage['icon']} {stage['stage']}</strong><br>"
+        f'<small style="opacity:0.6">{stage["description"]}</small>'
+        "</div>"
+        for stage in PIPELINE_STAGES
+    )
+    return f'<div style="{_ROW_STYLE}">{cells}</div>'
+
+
+@st.cache_data(show_spinner=False)
+def config_status_md(flags: tuple) -> str:
+    """Configuration status lines for CONFIG_ITEMS, cached per combination of configured flags"""
+    return "\n\n".join(
+        f"{'✅' if ok else '⚠️'} **{name}**: {'Configured' if ok else 'Not configured'} — {purpose}"
+        for (name, purpose), ok in zip(CONFIG_ITEMS, flags)
+    )
+
+
+@st.cache_data(show_spinner=False)
+def endpoints_md() -> str:
+    """API endpoints reference as a markdown table, built once and reused across reruns"""
+    rows = "\n".join(f"| {m} | `{p}` | {d} | {a} |" for m, p, d, a in ENDPOINTS)
+    return "| Method | Path | Description | Auth |\n|---|---|---|---|\n" + rows
+
+
+@st.cache_data(show_spinner=False)
+def workflows_md() -> str:
+    """n8n workflow reference as a markdown table, built once and reused across reruns"""
+    rows = "\n".join(f"| {w} | `{f}` | {d} |" for w, f, d in WORKFLOWS)
+    return "| Workflow | File | Description |\n|---|---|---|\n" + rows
+
+
 def main():
     """Main CRM Dashboard page"""
 
@@ -38,40 +149,7 @@ def main():
     # ==========================================
     st.markdown("### Source Status")
 
-    col1, col2, col3, col4 = st.columns(4)
-
-    sources = {
-        "DIBBS": {
-            "icon": "📅",
-            "endpoint": "/api/available-dates",
-            "status": "Active" if True else "Offline",
-            "color": "green",
-        },
-        "SAM.gov": {
-            "icon": "🏛️",
-            "endpoint": "/api/search-sam",
-            "status": "Active" if config.SAM_GOV_API_KEY or True else "No API Key",
-            "color": "green" if config.SAM_GOV_API_KEY else "yellow",
-        },
-        "Canada Buys": {
-            "icon": "🍁",
-            "endpoint": "/api/search-canada-buys",
-            "status": "Active",
-            "color": "green",
-        },
-        "Alberta Purchasing": {
-            "icon": "🏔️",
-            "endpoint": "/api/search-alberta-purchasing",
-            "status": "Active",
-            "color": "green",
-        },
-    }
-
-    for col, (name, info) in zip([col1, col2, col3, col4], sources.items()):
-        with col:
-            st.markdown(f"#### {info['icon']} {name}")
-            st.markdown(f"**Status:** {info['status']}")
-            st.markdown(f"**Endpoint:** `{info['endpoint']}`")
+    st.markdown(source_cards_html(), unsafe_allow_html=True)
 
     st.markdown("---")
 
@@ -81,20 +159,7 @@ def main():
     st.markdown("### Pipeline Stages")
     st.markdown("Track opportunities through the procurement workflow.")
 
-    stages = [
-        {"stage": "New", "description": "Freshly discovered opportunities", "icon": "🆕"},
-        {"stage": "Outreach Sent", "description": "Initial email sent to supplier", "icon": "📧"},
-        {"stage": "Quote Received", "description": "Supplier provided pricing", "icon": "💰"},
-        {"stage": "Substitute y/n", "description": "Supplier offered alternative", "icon": "🔄"},
-        {"stage": "Send", "description": "Ready for next action", "icon": "📤"},
-        {"stage": "Not Yet", "description": "Paused for manual review", "icon": "⏸️"},
-    ]
-
-    cols = st.columns(len(stages))
-    for col, stage in zip(cols, stages):
-        with col:
-            st.markdown(f"**{stage['icon']} {stage['stage']}**")
-            st.caption(stage["description"])
+    st.markdown(pipeline_stages_html(), unsafe_allow_html=True)
 
     st.markdown("---")
 
@@ -103,18 +168,15 @@ def main():
     # ==========================================
     st.markdown("### Service Configuration")
 
-    config_items = [
-        ("Firecrawl API", config.is_firecrawl_configured(), "Contact discovery"),
-        ("SAM.gov API Key", bool(config.SAM_GOV_API_KEY), "SAM.gov search (Playwright fallback available)"),
-        ("OpenRouter LLM", config.is_llm_configured(), "Email classification & drafting"),
-        ("Email (SMTP/IMAP)", bool(config.EMAIL_ADDRESS), "Email outreach automation"),
-        ("RFQ API Key", bool(config.RFQ_API_KEY), "API authentication"),
-    ]
+    configured_flags = (
+        config.is_firecrawl_configured(),
+        bool(config.SAM_GOV_API_KEY),
+        config.is_llm_configured(),
+        bool(config.EMAIL_ADDRESS),
+        bool(config.RFQ_API_KEY),
+    )
 
-    for name, configured, purpose in config_items:
-        status = "Configured" if configured else "Not configured"
-        icon = "✅" if configured else "⚠️"
-        st.markdown(f"{icon} **{name}**: {status} — {purpose}")
+    st.markdown(config_status_md(configured_flags))
 
     st.markdown("---")
 
@@ -123,23 +185,7 @@ def main():
     # ==========================================
     st.markdown("### API Endpoints")
 
-    endpoints = [
-        ("GET", "/health", "Health check", "None"),
-        ("POST", "/api/batch", "Batch NSN processing", "None"),
-        ("POST", "/api/scrape-nsns-by-date", "DIBBS date scraper", "X-API-Key"),
-        ("POST", "/api/scrape-nsn-suppliers", "NSN supplier contacts", "X-API-Key"),
-        ("GET", "/api/available-dates", "DIBBS available dates", "X-API-Key"),
-        ("POST", "/api/search-sam", "SAM.gov search", "X-API-Key"),
-        ("POST", "/api/extract-document", "PDF/OCR extraction", "X-API-Key"),
-        ("POST", "/api/search-canada-buys", "Canada Buys search", "X-API-Key"),
-        ("POST", "/api/search-alberta-purchasing", "Alberta Purchasing search", "X-API-Key"),
-        ("POST", "/api/classify-thread", "Email classification", "X-API-Key"),
-        ("POST", "/api/draft-reply", "Email draft reply", "X-API-Key"),
-        ("POST", "/api/extract-quote", "Quote data extraction", "X-API-Key"),
-    ]
-
-    df = pd.DataFrame(endpoints, columns=["Method", "Path", "Description", "Auth"])
-    st.dataframe(df, use_container_width=True, hide_index=True)
+    st.markdown(endpoints_md())
 
     st.markdown("---")
 
@@ -148,18 +194,7 @@ def main():
     # ==========================================
     st.markdown("### n8n Workflows")
 
-    workflows = [
-        ("RFQ Daily Scraper", "workflow-rfq-daily.json", "Daily DIBBS → Suppliers → Sheets"),
-        ("SAM.gov Daily", "workflow-sam-daily.json", "Daily SAM.gov search → Sheets"),
-        ("Document Pipeline", "workflow-document-pipeline.json", "PDF extraction → Sheets"),
-        ("Canada Buys Daily", "workflow-canada-buys-daily.json", "Canada Buys feed → Sheets"),
-        ("Alberta Daily", "workflow-alberta-daily.json", "APC scrape → Sheets"),
-        ("Email Outreach", "workflow-email-outreach.json", "New row → Send email → Update status"),
-        ("Email Monitor", "workflow-email-monitor.json", "IMAP poll → Classify → Draft reply → Sheets"),
-    ]
-
-    df_wf = pd.DataFrame(workflows, columns=["Workflow", "File", "Description"])
-    st.dataframe(df_wf, use_container_width=True, hide_index=True)
+    st.markdown(workflows_md())
 
     # ==========================================
     # Sidebar
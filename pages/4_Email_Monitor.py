@@ -7,14 +7,33 @@ Allows manual testing of the classify-thread and draft-reply LLM endpoints.
 
 import asyncio
 import json
+import threading
 
 import streamlit as st
 
 import sys
-sys.path.insert(0, str(__file__).rsplit("/", 2)[0])
+from pathlib import Path
+_ROOT = str(Path(__file__).resolve().parents[1])
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from config import config
-from services.llm import STAGES
+
+
+# Sample threads for the Quick Templates buttons (immutable; copied on load)
+TEMPLATES = {
+    "Initial Outreach": (
+        {"from": "us", "body": "Hello,\n\nCan you please provide a quote on the following:\n\n- PN: 12345-678\n- QTY: 50\n- Description: BOLT, MACHINE\n\nThank you, and I look forward to your response."},
+    ),
+    "Quote Received": (
+        {"from": "us", "body": "Hello,\n\nCan you please provide a quote for PN 12345-678, QTY 50?"},
+        {"from": "supplier", "body": "Hi,\n\nThank you for your inquiry. Here is our quote:\n\n- PN: 12345-678\n- Unit Price: $12.50\n- Qty: 50\n- Total: $625.00\n- Lead Time: 30 days ARO\n\nPlease let me know if you need anything else."},
+    ),
+    "Substitute Offered": (
+        {"from": "us", "body": "Can you provide a quote for PN 12345-678?"},
+        {"from": "supplier", "body": "We no longer manufacture that exact part, but we have a direct replacement: PN 12345-679. Same specs, updated revision. Would you like a quote for the substitute?"},
+    ),
+}
 
 
 # Page configuration
@@ -25,85 +44,47 @@ st.set_page_config(
 )
 
 
-def main():
-    """Main Email Monitor page"""
+@st.cache_resource
+def get_llm_loop() -> asyncio.AbstractEventLoop:
+    """
+    Process-wide event loop running forever on a daemon thread.
 
-    st.title("📧 Email Monitor")
-    st.markdown("Classify email threads and generate reply drafts using LLM.")
-    st.markdown("---")
+    Shared by every session, so the LLM client's connection pool (bound to
+    its loop) stays warm across clicks and users.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="llm-loop", daemon=True).start()
+    return loop
 
-    # Check OpenRouter config
-    if not config.is_llm_configured():
-        st.warning(
-            "**OpenRouter not configured.** "
-            "Add `OPENROUTER_API_KEY` to your `.env` file to enable LLM features."
-        )
 
-    # ==========================================
-    # Thread Input
-    # ==========================================
-    st.markdown("### Email Thread")
+def run_llm(coro):
+    """Run a coroutine on the shared LLM loop and wait for its result"""
+    return asyncio.run_coroutine_threadsafe(coro, get_llm_loop()).result()
 
-    # Initialize session state
-    if "email_thread" not in st.session_state:
-        st.session_state.email_thread = []
-    if "classification" not in st.session_state:
-        st.session_state.classification = None
-    if "draft" not in st.session_state:
-        st.session_state.draft = None
 
-    # Add email to thread
-    st.markdown("#### Add Email to Thread")
+@st.cache_data(show_spinner=False)
+def get_stages() -> list:
+    """Conversation stages; services.llm (and openai) is imported on first use"""
+    from services.llm import STAGES
+    return STAGES
 
-    col1, col2 = st.columns([1, 4])
 
-    with col1:
-        sender = st.selectbox("From", options=["us", "supplier"])
+@st.cache_data(show_spinner=False)
+def get_stage_index() -> dict:
+    """Stage name -> position in the conversation stages"""
+    return {s: i for i, s in enumerate(get_stages())}
 
-    with col2:
-        body = st.text_area(
-            "Email Body",
-            height=100,
-            placeholder="Enter the email body text...",
-        )
 
-    col1, col2, col3 = st.columns([1, 1, 2])
+@st.cache_data(show_spinner=False)
+def stages_html() -> str:
+    """Sidebar list of conversation stages as one HTML list"""
+    items = "".join(f"<li><strong>{s}</strong></li>" for s in get_stages())
+    return f"<ul>{items}</ul>"
 
-    with col1:
-        if st.button("Add to Thread", type="primary", use_container_width=True):
-            if body.strip():
-                st.session_state.email_thread.append({
-                    "from": sender,
-                    "body": body.strip(),
-                })
-                st.session_state.classification = None
-                st.session_state.draft = None
-                st.rerun()
-            else:
-                st.warning("Please enter email body text.")
 
-    with col2:
-        if st.button("Clear Thread", use_container_width=True):
-            st.session_state.email_thread = []
-            st.session_state.classification = None
-            st.session_state.draft = None
-            st.rerun()
-
-    # Display current thread
-    if st.session_state.email_thread:
-        st.markdown("---")
-        st.markdown("#### Current Thread")
-
-        for i, msg in enumerate(st.session_state.email_thread):
-            sender_label = "Us" if msg["from"] == "us" else "Supplier"
-            icon = "📤" if msg["from"] == "us" else "📥"
-            st.markdown(f"**{icon} Email {i+1} (from: {sender_label})**")
-            st.text(msg["body"][:500])
-            st.markdown("---")
-
-    # ==========================================
-    # Classification
-    # ==========================================
+@st.fragment
+def render_classify_draft(llm_ready: bool):
+    """Classify & Draft as a fragment: its buttons rerun only this block"""
     if st.session_state.email_thread:
         st.markdown("### Classify & Draft")
 
@@ -114,12 +95,12 @@ def main():
                 "Classify Thread",
                 type="primary",
                 use_container_width=True,
-                disabled=not config.is_llm_configured(),
+                disabled=not llm_ready,
             ):
                 with st.spinner("Classifying with LLM..."):
                     try:
                         from services.llm import classify_conversation_stage
-                        stage = asyncio.run(classify_conversation_stage(st.session_state.email_thread))
+                        stage = run_llm(classify_conversation_stage(st.session_state.email_thread))
                         st.session_state.classification = stage
                     except Exception as e:
                         st.error(f"Classification failed: {str(e)}")
@@ -134,12 +115,12 @@ def main():
         # Show classification result
         if st.session_state.classification:
             stage = st.session_state.classification
-            stage_idx = STAGES.index(stage) if stage in STAGES else -1
+            stage_idx = get_stage_index().get(stage, -1)
             st.success(f"**Stage:** {stage}")
 
             # Stage progress bar
             if stage_idx >= 0:
-                progress = (stage_idx + 1) / len(STAGES)
+                progress = (stage_idx + 1) / len(get_stage_index())
                 st.progress(progress)
 
             # Draft reply button
@@ -147,7 +128,7 @@ def main():
                 "Draft Reply",
                 type="primary",
                 use_container_width=True,
-                disabled=not config.is_llm_configured(),
+                disabled=not llm_ready,
             ):
                 with st.spinner("Drafting reply with LLM..."):
                     try:
@@ -158,7 +139,7 @@ def main():
                         if context_qty:
                             context["quantity"] = context_qty
 
-                        reply = asyncio.run(draft_reply(
+                        reply = run_llm(draft_reply(
                             st.session_state.email_thread,
                             stage,
                             context if context else None,
@@ -180,31 +161,101 @@ def main():
             # Copy button hint
             st.caption("Select all text above and copy to use in your email client.")
 
+
+def main():
+    """Main Email Monitor page"""
+
+    st.title("📧 Email Monitor")
+    st.markdown("Classify email threads and generate reply drafts using LLM.")
+    st.markdown("---")
+
+    # Check OpenRouter config (read once per rerun)
+    llm_ready = config.is_llm_configured()
+    if not llm_ready:
+        st.warning(
+            "**OpenRouter not configured.** "
+            "Add `OPENROUTER_API_KEY` to your `.env` file to enable LLM features."
+        )
+
+    # ==========================================
+    # Thread Input
+    # ==========================================
+    st.markdown("### Email Thread")
+
+    # Initialize session state
+    if "email_thread" not in st.session_state:
+        st.session_state.email_thread = []
+    if "classification" not in st.session_state:
+        st.session_state.classification = None
+    if "draft" not in st.session_state:
+        st.session_state.draft = None
+
+    # Add email to thread
+    st.markdown("#### Add Email to Thread")
+
+    col1, col2 = st.columns([1, 4])
+
+    with col1:
+        sender = st.selectbox("From", options=["us", "supplier"])
+
+    with col2:
+        body = st.text_area(
+            "Email Body",
+            height=100,
+            placeholder="Enter the email body text...",
+        )
+
+    col1, col2, col3 = st.columns([1, 1, 2])
+
+    with col1:
+        if st.button("Add to Thread", type="primary", use_container_width=True):
+            if body.strip():
+                st.session_state.email_thread.append({
+                    "from": sender,
+                    "body": body.strip(),
+                })
+                st.session_state.classification = None
+                st.session_state.draft = None
+                st.rerun()
+            else:
+                st.warning("Please enter email body text.")
+
+    with col2:
+        if st.button("Clear Thread", use_container_width=True):
+            st.session_state.email_thread = []
+            st.session_state.classification = None
+            st.session_state.draft = None
+            st.rerun()
+
+    # Display current thread
+    if st.session_state.email_thread:
+        st.markdown("---")
+        st.markdown("#### Current Thread")
+
+        parts = []
+        for i, msg in enumerate(st.session_state.email_thread):
+            sender_label = "Us" if msg["from"] == "us" else "Supplier"
+            icon = "📤" if msg["from"] == "us" else "📥"
+            parts.append(f"─── {icon} Email {i+1} (from: {sender_label}) ───\n{msg['body'][:500]}")
+        st.code("\n\n".join(parts), language=None)
+
+    # ==========================================
+    # Classification
+    # ==========================================
+    render_classify_draft(llm_ready)
+
     # ==========================================
     # Quick Templates
     # ==========================================
     st.markdown("---")
     st.markdown("### Quick Templates")
 
-    templates = {
-        "Initial Outreach": [
-            {"from": "us", "body": "Hello,\n\nCan you please provide a quote on the following:\n\n- PN: 12345-678\n- QTY: 50\n- Description: BOLT, MACHINE\n\nThank you, and I look forward to your response."}
-        ],
-        "Quote Received": [
-            {"from": "us", "body": "Hello,\n\nCan you please provide a quote for PN 12345-678, QTY 50?"},
-            {"from": "supplier", "body": "Hi,\n\nThank you for your inquiry. Here is our quote:\n\n- PN: 12345-678\n- Unit Price: $12.50\n- Qty: 50\n- Total: $625.00\n- Lead Time: 30 days ARO\n\nPlease let me know if you need anything else."},
-        ],
-        "Substitute Offered": [
-            {"from": "us", "body": "Can you provide a quote for PN 12345-678?"},
-            {"from": "supplier", "body": "We no longer manufacture that exact part, but we have a direct replacement: PN 12345-679. Same specs, updated revision. Would you like a quote for the substitute?"},
-        ],
-    }
-
-    cols = st.columns(len(templates))
-    for col, (name, thread) in zip(cols, templates.items()):
+    cols = st.columns(len(TEMPLATES))
+    for col, (name, thread) in zip(cols, TEMPLATES.items()):
         with col:
             if st.button(f"Load: {name}", use_container_width=True):
-                st.session_state.email_thread = thread
+                # Copy so "Add to Thread" doesn't append to the template itself
+                st.session_state.email_thread = [dict(m) for m in thread]
                 st.session_state.classification = None
                 st.session_state.draft = None
                 st.rerun()
@@ -225,13 +276,12 @@ def main():
         st.markdown("---")
 
         st.markdown("### Conversation Stages")
-        for stage in STAGES:
-            st.markdown(f"- **{stage}**")
+        st.markdown(stages_html(), unsafe_allow_html=True)
 
         st.markdown("---")
 
         st.markdown("### Configuration")
-        if config.is_llm_configured():
+        if llm_ready:
             st.markdown(f"**Model:** `{config.OPENROUTER_MODEL}`")
             st.markdown("**Status:** Connected")
         else:
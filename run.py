@@ -3,8 +3,8 @@
 Railway-compatible FastAPI launcher.
 Reads PORT from environment variable and launches uvicorn.
 """
+import importlib.util
 import os
-import uvicorn
 
 from utils.logging import get_logger
 
@@ -12,9 +12,25 @@ logger = get_logger(__name__)
 
 
 def main():
+    import uvicorn
+
     port = int(os.environ.get("PORT", 8000))
-    logger.info("Starting FastAPI on port %d", port)
-    uvicorn.run("api:app", host="0.0.0.0", port=port)
+    # Each worker is a separate process with its own browser pool
+    workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+    # C event loop / HTTP parser from uvicorn[standard]; fall back where unavailable (e.g. uvloop on Windows)
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+    logger.info("Starting FastAPI on port %d (workers=%d, loop=%s, http=%s)", port, workers, loop, http)
+    uvicorn.run(
+        "api:app",
+        host="0.0.0.0",
+        port=port,
+        workers=workers,
+        loop=loop,
+        http=http,
+        # api.py logs every request with a correlation ID already
+        access_log=False,
+    )
 
 if __name__ == "__main__":
     main()
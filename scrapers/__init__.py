@@ -1,4 +1,4 @@
-from .dibbs import scrape_dibbs
+from .dibbs import scrape_dibbs, scrape_dibbs_batch
 from .wbparts import scrape_wbparts
 
-__all__ = ["scrape_dibbs", "scrape_wbparts"]
+__all__ = ["scrape_dibbs", "scrape_dibbs_batch", "scrape_wbparts"]
@@ -9,11 +9,15 @@ Target: https://purchasing.alberta.ca/
 """
 
 import asyncio
+import importlib.util
 import re
-from datetime import datetime, timedelta
-from typing import Optional, List
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import Dict, Optional, List, Tuple
 
 import httpx
+import orjson
 
 import sys
 sys.path.insert(0, str(__file__).rsplit("/", 2)[0])
@@ -27,6 +31,30 @@ APC_BASE_URL = "https://purchasing.alberta.ca"
 APC_API_URL = f"{APC_BASE_URL}/api/opportunity/search"
 APC_DETAIL_API_URL = f"{APC_BASE_URL}/api/opportunity/public"
 APC_POSTING_URL = f"{APC_BASE_URL}/posting"
+APC_DETAIL_TIMEOUT = httpx.Timeout(15.0, connect=5.0)
+_POSTING_LINK_SELECTOR = "a[href*='/posting/']"
+
+# Map status codes to readable names
+_STATUS_MAP = {
+    "OPEN": "Open",
+    "CLOSED": "Closed",
+    "AWARD": "Awarded",
+    "CANCELLED": "Cancelled",
+    "EVALUATION": "Under Evaluation",
+    "SELECTION": "Selection",
+    "EXPIRED": "Expired",
+}
+_ADDRESS_FIELDS = ("addressLine1", "addressLine2", "city", "province", "postalCode")
+
+_REF_RE = re.compile(r"^AB-(\d{4})-0*(\d+)$")
+_POSTING_REF_RE = re.compile(r"/posting/(AB-\d{4}-\d+)")
+
+# Per-process search cache: params -> (expires_at, orjson-encoded result).
+# Stored as bytes so callers can't mutate the cached copy.
+_SEARCH_CACHE: Dict[tuple, Tuple[float, bytes]] = {}
+
+# HTTP/2 needs the optional h2 package (httpx[http2]); fall back to HTTP/1.1 without it
+_HTTP2 = importlib.util.find_spec("h2") is not None
 
 
 def _build_search_payload(
@@ -97,43 +125,25 @@ def _build_search_payload(
 
 def _parse_opportunity(raw: dict) -> dict:
     """Parse an API opportunity object into our normalized format."""
-    ref = raw.get("referenceNumber", "")
-    source_url = f"{APC_POSTING_URL}/{ref}" if ref else ""
-
-    # Parse dates
-    post_dt = raw.get("postDateTime", "")
-    close_dt = raw.get("closeDateTime", "")
-    published_date = post_dt[:10] if post_dt else ""
-    closing_date = close_dt[:10] if close_dt else ""
-
-    # Map status codes to readable names
-    status_code = raw.get("statusCode", "")
-    status_map = {
-        "OPEN": "Open",
-        "CLOSED": "Closed",
-        "AWARD": "Awarded",
-        "CANCELLED": "Cancelled",
-        "EVALUATION": "Under Evaluation",
-        "SELECTION": "Selection",
-        "EXPIRED": "Expired",
-    }
-    status = status_map.get(status_code, status_code)
+    g = raw.get
+    ref = g("referenceNumber", "")
+    status_code = g("statusCode", "")
 
     return {
-        "title": raw.get("shortTitle") or raw.get("title", ""),
+        "title": g("shortTitle") or g("title", ""),
         "referenceNumber": ref,
-        "solicitationNumber": raw.get("solicitationNumber", ""),
-        "status": status,
-        "publishedDate": published_date,
-        "closingDate": closing_date,
-        "organization": raw.get("contractingOrganization", ""),
-        "categoryCode": raw.get("categoryCode", ""),
-        "solicitationTypeCode": raw.get("solicitationTypeCode", ""),
-        "opportunityTypeCode": raw.get("opportunityTypeCode", ""),
-        "description": (raw.get("projectDescription") or "")[:500],
-        "commodityCodes": raw.get("commodityCodes", []),
-        "regionOfDelivery": raw.get("regionOfDelivery", []),
-        "sourceUrl": source_url,
+        "solicitationNumber": g("solicitationNumber", ""),
+        "status": _STATUS_MAP.get(status_code, status_code),
+        "publishedDate": (g("postDateTime") or "")[:10],
+        "closingDate": (g("closeDateTime") or "")[:10],
+        "organization": g("contractingOrganization", ""),
+        "categoryCode": g("categoryCode", ""),
+        "solicitationTypeCode": g("solicitationTypeCode", ""),
+        "opportunityTypeCode": g("opportunityTypeCode", ""),
+        "description": (g("projectDescription") or "")[:500],
+        "commodityCodes": g("commodityCodes", []),
+        "regionOfDelivery": g("regionOfDelivery", []),
+        "sourceUrl": f"{APC_POSTING_URL}/{ref}" if ref else "",
         "source": "alberta_purchasing",
     }
 
@@ -144,7 +154,7 @@ def _parse_reference_number(ref: str) -> Optional[tuple]:
 
     Returns None if the reference number doesn't match the expected format.
     """
-    m = re.match(r"^AB-(\d{4})-0*(\d+)$", ref)
+    m = _REF_RE.match(ref)
     if not m:
         return None
     return (m.group(1), m.group(2))
@@ -168,34 +178,22 @@ async def _fetch_detail_contacts(
     url = f"{APC_DETAIL_API_URL}/{year}/{opp_id}"
 
     try:
-        resp = await client.get(url)
+        resp = await client.get(url, timeout=APC_DETAIL_TIMEOUT)
         resp.raise_for_status()
-        data = resp.json()
+        data = orjson.loads(resp.content)
 
         opp = data.get("opportunity") or data
         contact = opp.get("contactInformation") or {}
 
-        # Build full name from firstName + lastName
-        first = (contact.get("firstName") or "").strip()
-        last = (contact.get("lastName") or "").strip()
-        full_name = f"{first} {last}".strip()
-
-        # Build address from available fields
-        addr_parts = [
-            (contact.get("addressLine1") or "").strip(),
-            (contact.get("addressLine2") or "").strip(),
-            (contact.get("city") or "").strip(),
-            (contact.get("province") or "").strip(),
-            (contact.get("postalCode") or "").strip(),
-        ]
-        address = ", ".join(p for p in addr_parts if p)
+        def _s(key: str) -> str:
+            return (contact.get(key) or "").strip()
 
         return {
-            "contactName": full_name,
-            "contactTitle": (contact.get("title") or "").strip(),
-            "contactEmail": (contact.get("emailAddress") or "").strip(),
-            "contactPhone": (contact.get("phoneNumber") or "").strip(),
-            "contactAddress": address,
+            "contactName": f"{_s('firstName')} {_s('lastName')}".strip(),
+            "contactTitle": _s("title"),
+            "contactEmail": _s("emailAddress"),
+            "contactPhone": _s("phoneNumber"),
+            "contactAddress": ", ".join(filter(None, map(_s, _ADDRESS_FIELDS))),
         }
     except httpx.HTTPStatusError as e:
         logger.debug("Detail API %d for %s", e.response.status_code, reference_number)
@@ -207,31 +205,65 @@ async def _fetch_detail_contacts(
 
 async def _enrich_with_contacts(
     opportunities: List[dict],
+    client: httpx.AsyncClient,
     max_concurrent: int = 5,
 ) -> List[dict]:
     """
     Batch-enrich opportunities with contact info from the detail API.
 
-    Uses asyncio.Semaphore for concurrency control and 0.2s delay between requests.
+    Runs max_concurrent workers over a shared iterator on the caller's client,
+    so only that many coroutines exist regardless of len(opportunities), and
+    detail calls reuse the connections opened by the search.
     """
-    sem = asyncio.Semaphore(max_concurrent)
+    pending = iter(opportunities)
 
-    async def _enrich_one(client: httpx.AsyncClient, opp: dict) -> None:
-        ref = opp.get("referenceNumber", "")
-        if not ref:
-            return
-        async with sem:
-            contacts = await _fetch_detail_contacts(client, ref)
-            opp.update(contacts)
-            await asyncio.sleep(0.2)
+    async def _worker() -> None:
+        # The iterator is shared: each opp is taken by exactly one worker
+        for opp in pending:
+            ref = opp.get("referenceNumber", "")
+            if ref:
+                opp.update(await _fetch_detail_contacts(client, ref))
 
-    headers = {"User-Agent": config.USER_AGENT, "Accept": "application/json"}
-    async with httpx.AsyncClient(timeout=15, headers=headers) as client:
-        await asyncio.gather(*[_enrich_one(client, opp) for opp in opportunities])
+    await asyncio.gather(*[_worker() for _ in range(min(max_concurrent, len(opportunities)))])
 
     return opportunities
 
 
+async def _fetch_page(client: httpx.AsyncClient, payload: dict, offset: int) -> dict:
+    """POST one page of the search; the base payload is shared, so copy before setting offset."""
+    response = await client.post(APC_API_URL, content=orjson.dumps({**payload, "offset": offset}))
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+
+def _build_client() -> httpx.AsyncClient:
+    """One pooled client for both the search pages and the detail calls."""
+    return httpx.AsyncClient(
+        http2=_HTTP2,
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        headers={
+            "User-Agent": config.USER_AGENT,
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        },
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=20,
+            keepalive_expiry=30.0,
+        ),
+    )
+
+
+@asynccontextmanager
+async def _use_client(client: Optional[httpx.AsyncClient]):
+    """Yield the caller's client as-is, or a fresh one closed on exit."""
+    if client is not None:
+        yield client
+        return
+    async with _build_client() as own:
+        yield own
+
+
 async def search_opportunities(
     keywords: str = "",
     days_back: int = 7,
@@ -241,6 +273,7 @@ async def search_opportunities(
     category: Optional[str] = None,
     enrich_contacts: bool = False,
     browser_context=None,
+    client: Optional[httpx.AsyncClient] = None,
 ) -> dict:
     """
     Search Alberta Purchasing Connection for opportunities.
@@ -254,68 +287,69 @@ async def search_opportunities(
         status_filter: Status filter (OPEN, CLOSED, AWARD, etc.). Empty = all.
         solicitation_type: Filter by type (RFQ, RFP, ITB, etc.). None = all.
         category: Filter by category (GD=Goods, SRV=Services, CNST=Construction). None = all.
+        client: Optional long-lived AsyncClient (see _build_client()); a
+                temporary one is created and closed when omitted.
 
     Returns:
         Dict with source, opportunities list, metadata
+
+    Successful results are cached per process for APC_CACHE_TTL seconds.
     """
+    cache_key = (keywords, days_back, max_results, status_filter, solicitation_type, category, enrich_contacts)
+    cached = _SEARCH_CACHE.get(cache_key)
+    if cached:
+        if cached[0] > time.monotonic():
+            logger.debug("APC search cache hit for %r", keywords)
+            return orjson.loads(cached[1])
+        del _SEARCH_CACHE[cache_key]
+
     opportunities: List[dict] = []
     total_count = 0
     error_msg = None
 
     try:
-        # Paginate through results
-        offset = 0
         page_size = min(max_results, 200)
-
-        async with httpx.AsyncClient(timeout=30) as client:
-            while offset < max_results:
-                payload = _build_search_payload(
-                    keywords=keywords,
-                    days_back=days_back,
-                    max_results=page_size,
-                    offset=offset,
-                    status_filter=status_filter,
-                    solicitation_type=solicitation_type,
-                    category=category,
-                )
-
-                response = await client.post(
-                    APC_API_URL,
-                    json=payload,
-                    headers={"Content-Type": "application/json"},
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                total_count = data.get("totalCount", 0)
-                values = data.get("values", [])
-
-                if not values:
-                    break
-
-                for raw in values:
-                    opportunities.append(_parse_opportunity(raw))
-                    if len(opportunities) >= max_results:
-                        break
-
-                if len(opportunities) >= max_results:
-                    break
-
-                offset += page_size
-                if offset >= total_count:
-                    break
-
-                # Rate limit between pages
-                await asyncio.sleep(0.3)
-
-        logger.info("API returned %d of %d total opportunities", len(opportunities), total_count)
-
-        if enrich_contacts and opportunities:
-            concurrency = int(getattr(config, "APC_DETAIL_CONCURRENCY", 5))
-            logger.info("Enriching %d opportunities with contacts (concurrency=%d)", len(opportunities), concurrency)
-            await _enrich_with_contacts(opportunities, max_concurrent=concurrency)
-            enriched = sum(1 for o in opportunities if o.get("contactEmail"))
-            logger.info("Contact enrichment complete: %d/%d have email", enriched, len(opportunities))
+        payload = _build_search_payload(
+            keywords=keywords,
+            days_back=days_back,
+            max_results=page_size,
+            status_filter=status_filter,
+            solicitation_type=solicitation_type,
+            category=category,
+        )
+
+        async with _use_client(client) as client:
+            # First page reveals totalCount; the remaining offsets are independent
+            data = await _fetch_page(client, payload, 0)
+            total_count = data.get("totalCount", 0)
+            pages = [data.get("values", [])]
+
+            offsets = range(page_size, min(max_results, total_count), page_size)
+            if pages[0] and offsets:
+                sem = asyncio.Semaphore(config.APC_PAGE_CONCURRENCY)
+
+                async def _fetch_bounded(offset: int) -> list:
+                    async with sem:
+                        page = await _fetch_page(client, payload, offset)
+                    return page.get("values", [])
+
+                # gather preserves offset order, so results stay sorted by post date
+                pages += await asyncio.gather(*[_fetch_bounded(o) for o in offsets])
+
+            for values in pages:
+                opportunities.extend(map(_parse_opportunity, values[:max_results - len(opportunities)]))
+                # Drop raw dicts as soon as they're normalized
+                values.clear()
+            del pages
+
+            logger.info("API returned %d of %d total opportunities", len(opportunities), total_count)
+
+            if enrich_contacts and opportunities:
+                concurrency = int(getattr(config, "APC_DETAIL_CONCURRENCY", 5))
+                logger.info("Enriching %d opportunities with contacts (concurrency=%d)", len(opportunities), concurrency)
+                await _enrich_with_contacts(opportunities, client, max_concurrent=concurrency)
+                enriched = sum(1 for o in opportunities if o.get("contactEmail"))
+                logger.info("Contact enrichment complete: %d/%d have email", enriched, len(opportunities))
 
     except httpx.HTTPStatusError as e:
         error_msg = f"API error: HTTP {e.response.status_code}"
@@ -332,64 +366,73 @@ async def search_opportunities(
         "totalOpportunities": len(opportunities),
         "totalAvailable": total_count,
         "opportunities": opportunities,
-        "scrapedAt": datetime.utcnow().isoformat() + "Z",
+        "scrapedAt": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
     }
     if error_msg:
         result["error"] = error_msg
+    else:
+        _cache_result(cache_key, result)
 
     return result
 
 
+def _cache_result(key: tuple, result: dict) -> None:
+    """Store a successful search result for APC_CACHE_TTL seconds."""
+    ttl = config.APC_CACHE_TTL
+    if ttl <= 0:
+        return
+    now = time.monotonic()
+    # Evict expired entries so the cache stays bounded by distinct live searches
+    for k in [k for k, (expires_at, _) in _SEARCH_CACHE.items() if expires_at <= now]:
+        del _SEARCH_CACHE[k]
+    _SEARCH_CACHE[key] = (now + ttl, orjson.dumps(result))
+
+
 async def _do_scrape_fallback(page, keywords: str, max_results: int) -> list:
     """Core Playwright fallback logic operating on an existing page."""
-    opportunities = []
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
     url = f"{APC_BASE_URL}/search"
     if keywords:
         url += f"?keywords={keywords.replace(' ', '+')}"
 
     await page.goto(url, timeout=30000)
-    await page.wait_for_load_state("networkidle")
-    await asyncio.sleep(3)
+    # Return as soon as the posting links render, rather than waiting out
+    # networkidle (analytics beacons) plus a fixed delay
+    try:
+        await page.wait_for_selector(_POSTING_LINK_SELECTOR, state="attached", timeout=15000)
+    except PlaywrightTimeoutError:
+        logger.warning("Playwright fallback: no posting links found on %s", url)
+        return []
 
-    links = page.locator("a[href*='/posting/']")
-    count = await links.count()
+    # One IPC round trip for every link instead of three per link
+    pairs = await page.eval_on_selector_all(
+        _POSTING_LINK_SELECTOR,
+        "els => els.map(e => [e.innerText.trim(), e.getAttribute('href') || ''])",
+    )
 
-    seen_refs = set()
-    for i in range(count):
-        if len(opportunities) >= max_results:
+    # Keyed by reference number: dedups while keeping page order
+    by_ref = {}
+    for title, href in pairs:
+        if len(by_ref) >= max_results:
             break
-        try:
-            link = links.nth(i)
-            title = (await link.inner_text()).strip()
-            href = await link.get_attribute("href") or ""
-
-            if not title or len(title) < 5:
-                continue
-
-            ref_match = re.search(r'/posting/(AB-\d{4}-\d+)', href)
-            ref = ref_match.group(1) if ref_match else ""
-
-            if ref in seen_refs:
-                continue
-            seen_refs.add(ref)
-
-            source_url = href if href.startswith("http") else f"{APC_BASE_URL}{href}"
-
-            opportunities.append({
-                "title": title,
-                "referenceNumber": ref,
-                "status": "Open",
-                "publishedDate": "",
-                "closingDate": "",
-                "organization": "",
-                "sourceUrl": source_url,
-                "source": "alberta_purchasing",
-            })
-        except Exception:
+        ref_match = _POSTING_REF_RE.search(href)
+        ref = ref_match.group(1) if ref_match else ""
+        if not ref or ref in by_ref or len(title) < 5:
             continue
 
-    return opportunities
+        by_ref[ref] = {
+            "title": title,
+            "referenceNumber": ref,
+            "status": "Open",
+            "publishedDate": "",
+            "closingDate": "",
+            "organization": "",
+            "sourceUrl": href if href.startswith("http") else f"{APC_BASE_URL}{href}",
+            "source": "alberta_purchasing",
+        }
+
+    return list(by_ref.values())
 
 
 async def _scrape_fallback(
@@ -439,6 +482,30 @@ async def _scrape_fallback(
         return []
 
 
+# Persistent loop + client for the sync wrapper, created on first call so
+# repeated calls (CLI loops, workers) keep their warm connections
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None
+_sync_client: Optional[httpx.AsyncClient] = None
+
+
 def search_opportunities_sync(keywords="", days_back=7) -> dict:
-    """Synchronous wrapper."""
-    return asyncio.run(search_opportunities(keywords=keywords, days_back=days_back))
+    """Synchronous wrapper. Reuses one event loop and client across calls; see shutdown_sync()."""
+    global _sync_loop, _sync_client
+    if _sync_loop is None or _sync_loop.is_closed():
+        _sync_loop = asyncio.new_event_loop()
+        _sync_client = _build_client()
+    return _sync_loop.run_until_complete(
+        search_opportunities(keywords=keywords, days_back=days_back, client=_sync_client)
+    )
+
+
+def shutdown_sync() -> None:
+    """Close the client and event loop held by search_opportunities_sync()."""
+    global _sync_loop, _sync_client
+    if _sync_loop is None:
+        return
+    if _sync_client is not None and not _sync_loop.is_closed():
+        _sync_loop.run_until_complete(_sync_client.aclose())
+    _sync_loop.close()
+    _sync_loop = None
+    _sync_client = None
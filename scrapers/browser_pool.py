@@ -14,12 +14,17 @@ Usage (scrapers):
     async with browser_pool.get_context() as ctx:
         page = await ctx.new_page()
         ...
+
+get_context() with no arguments hands out a pre-warmed context and returns
+it to the pool afterwards rather than creating and closing one per call;
+passing new_context() kwargs falls back to a throwaway context.
 """
 
 import asyncio
 import time
 from contextlib import asynccontextmanager
-from typing import Optional
+from typing import AbstractSet, Optional, Tuple
+from urllib.parse import urlsplit
 
 from playwright.async_api import async_playwright, Playwright, Browser, BrowserContext
 
@@ -39,17 +44,65 @@ _CHROMIUM_ARGS = [
     "--disable-extensions",
 ]
 
+# Resource types the scrapers never read; aborted before they hit the network
+_BLOCKED_RESOURCES = frozenset(
+    t.strip() for t in config.BROWSER_BLOCK_RESOURCES.split(",") if t.strip()
+)
+
+
+# Analytics/tracker hosts; requests to them or their subdomains are aborted
+_BLOCKED_HOSTS = tuple(
+    h.strip().lower() for h in config.BROWSER_BLOCK_HOSTS.split(",") if h.strip()
+)
+
+
+# [origin, localStorage length] of a page
+_LOCAL_STORAGE_JS = "() => [location.origin, window.localStorage.length]"
+
+
+def _is_blocked_host(url: str, hosts: Tuple[str, ...]) -> bool:
+    host = urlsplit(url).hostname or ""
+    return any(host == h or host.endswith("." + h) for h in hosts)
+
+
+async def block_requests(
+    ctx: BrowserContext,
+    types: AbstractSet[str] = _BLOCKED_RESOURCES,
+    hosts: Tuple[str, ...] = _BLOCKED_HOSTS,
+) -> None:
+    """Abort requests for the given resource types or hosts in every page of ctx."""
+    if not types and not hosts:
+        return
+
+    async def _handle(route) -> None:
+        request = route.request
+        if request.resource_type in types or (hosts and _is_blocked_host(request.url, hosts)):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    await ctx.route("**/*", _handle)
+
 
 class BrowserPool:
     """Singleton browser pool that shares one Chromium instance."""
 
-    def __init__(self) -> None:
+    def __init__(self, warm: bool = True) -> None:
+        """
+        Args:
+            warm: Visit config.BROWSER_WARMUP_URL and pre-create one context
+                  per slot in start(). With warm=False contexts are created
+                  on first lease and then reused.
+        """
+        self._warm = warm
         self._playwright: Optional[Playwright] = None
         self._browser: Optional[Browser] = None
         self._started = False
         self._semaphore: Optional[asyncio.Semaphore] = None
         self._lock = asyncio.Lock()
         self._waiting: int = 0
+        self._ctx_queue: Optional[asyncio.Queue] = None
+        self._storage_state: Optional[dict] = None
 
     async def start(self) -> None:
         """Launch Playwright and Chromium. Call once at app startup."""
@@ -62,6 +115,12 @@ class BrowserPool:
             args=_CHROMIUM_ARGS,
         )
         self._semaphore = asyncio.Semaphore(config.MAX_BROWSER_PAGES)
+        self._ctx_queue = asyncio.Queue()
+        if self._warm:
+            self._storage_state = await self._capture_storage_state(self._browser)
+            # One warm context per slot, so a lease never has to wait on the queue
+            for _ in range(config.MAX_BROWSER_PAGES):
+                self._ctx_queue.put_nowait(await self._new_default_context(self._browser))
         self._started = True
         logger.info("BrowserPool: Ready (max %d concurrent pages)", config.MAX_BROWSER_PAGES)
 
@@ -71,12 +130,15 @@ class BrowserPool:
             return
         logger.info("BrowserPool: Shutting down")
         self._started = False
+        # Warm contexts are closed along with the browser below
+        self._ctx_queue = None
         if self._browser:
             try:
                 await self._browser.close()
             except Exception:
                 pass
             self._browser = None
+        self._storage_state = None
         if self._playwright:
             try:
                 await self._playwright.stop()
@@ -86,6 +148,10 @@ class BrowserPool:
 
     async def _ensure_browser(self) -> Browser:
         """Check browser health; restart if it crashed."""
+        # Fast path: healthy browser needs no lock
+        browser = self._browser
+        if browser is not None and browser.is_connected():
+            return browser
         async with self._lock:
             if self._browser and self._browser.is_connected():
                 return self._browser
@@ -106,19 +172,67 @@ class BrowserPool:
             logger.info("BrowserPool: Browser restarted")
             return self._browser
 
-    @asynccontextmanager
-    async def get_context(self, timeout: float = None, **kwargs):
+    async def _capture_storage_state(self, browser: Browser) -> Optional[dict]:
         """
-        Acquire a semaphore slot and yield an isolated BrowserContext.
+        Visit config.BROWSER_WARMUP_URL once and snapshot cookies/localStorage.
 
-        The context is automatically closed when the caller exits the block.
-        Pass extra kwargs (e.g. user_agent) to browser.new_context().
+        New contexts start from this state, so CDN/anti-bot cookies are issued
+        once per process rather than once per context. Failure is non-fatal.
+        """
+        if not config.BROWSER_WARMUP_URL:
+            return None
+        ctx = await browser.new_context(user_agent=config.USER_AGENT)
+        try:
+            await block_requests(ctx)
+            page = await ctx.new_page()
+            await page.goto(config.BROWSER_WARMUP_URL, timeout=10000)
+            state = await ctx.storage_state()
+            logger.info(
+                "BrowserPool: captured storage state (%d cookies) from %s",
+                len(state.get("cookies", [])), config.BROWSER_WARMUP_URL,
+            )
+            return state
+        except Exception as e:
+            logger.warning("BrowserPool: warmup of %s failed: %s", config.BROWSER_WARMUP_URL, e)
+            return None
+        finally:
+            try:
+                await ctx.close()
+            except Exception:
+                pass
 
-        Args:
-            timeout: Max seconds to wait for a pool slot. Defaults to
-                     config.BROWSER_POOL_TIMEOUT. Raises RuntimeError
-                     if no slot is available within the timeout.
+    async def _new_default_context(self, browser: Browser) -> BrowserContext:
+        """Create a context with the pool's default settings."""
+        ctx = await browser.new_context(
+            user_agent=config.USER_AGENT, storage_state=self._storage_state
+        )
+        await block_requests(ctx)
+        return ctx
+
+    async def _has_dirty_local_storage(self, ctx: BrowserContext) -> bool:
         """
+        True if an open page of ctx holds more localStorage than the warmup.
+
+        One evaluate per page, run before the pages are closed. Playwright
+        can't clear localStorage in place, so such a context is closed rather
+        than returned and the next lease creates a fresh one.
+        """
+        baseline = {
+            o["origin"]: len(o.get("localStorage", []))
+            for o in (self._storage_state or {}).get("origins", [])
+        }
+        for page in ctx.pages:
+            try:
+                origin, length = await page.evaluate(_LOCAL_STORAGE_JS)
+            except Exception:
+                # about:blank and crashed pages have no readable storage
+                continue
+            if length != baseline.get(origin, 0):
+                return True
+        return False
+
+    async def _acquire_slot(self, timeout: Optional[float]) -> None:
+        """Wait for a semaphore slot, raising RuntimeError on timeout."""
         if not self._started:
             raise RuntimeError("BrowserPool not started. Call start() first.")
 
@@ -126,28 +240,75 @@ class BrowserPool:
             timeout = float(config.BROWSER_POOL_TIMEOUT)
 
         self._waiting += 1
-        logger.info(
+        # Per-acquire noise stays at DEBUG; StructuredLogger skips formatting when disabled
+        logger.debug(
             "BrowserPool: requesting slot (waiting=%d, timeout=%.0fs)",
             self._waiting, timeout,
         )
         acquire_start = time.monotonic()
+        # shield() lets us see whether the acquire won the race against the
+        # timeout/cancel, so a slot granted at the last moment isn't leaked
+        acquire_task = asyncio.ensure_future(self._semaphore.acquire())
         try:
-            await asyncio.wait_for(self._semaphore.acquire(), timeout=timeout)
-        except asyncio.TimeoutError:
+            await asyncio.wait_for(asyncio.shield(acquire_task), timeout=timeout)
+        except BaseException as e:
+            if acquire_task.done() and not acquire_task.cancelled():
+                self._semaphore.release()
+            else:
+                acquire_task.cancel()
+            if isinstance(e, asyncio.TimeoutError):
+                raise RuntimeError(
+                    "Browser pool busy: no slot available within %.0fs "
+                    "(max_pages=%d, waiting=%d)" % (timeout, config.MAX_BROWSER_PAGES, self._waiting - 1)
+                ) from None
+            raise
+        finally:
             self._waiting -= 1
-            raise RuntimeError(
-                "Browser pool busy: no slot available within %.0fs "
-                "(max_pages=%d, waiting=%d)" % (timeout, config.MAX_BROWSER_PAGES, self._waiting)
-            )
-        self._waiting -= 1
         acquire_time = time.monotonic() - acquire_start
-        if acquire_time > 1.0:
+        if acquire_time > 5.0:
             logger.info("BrowserPool: slot acquired in %.1fs", acquire_time)
+        elif acquire_time > 1.0:
+            logger.debug("BrowserPool: slot acquired in %.1fs", acquire_time)
+
+    @asynccontextmanager
+    async def get_context(
+        self,
+        timeout: float = None,
+        block_resources: Optional[AbstractSet[str]] = None,
+        **kwargs,
+    ):
+        """
+        Acquire a semaphore slot and yield an isolated BrowserContext.
+
+        With no extra arguments the context comes from the warm pool (see
+        lease_context()). Pass extra kwargs (e.g. user_agent) to get a fresh
+        browser.new_context(**kwargs) that is closed when the block exits.
+
+        Args:
+            timeout: Max seconds to wait for a pool slot. Defaults to
+                     config.BROWSER_POOL_TIMEOUT. Raises RuntimeError
+                     if no slot is available within the timeout.
+            block_resources: Resource types to abort (e.g. {"image"}).
+                     Defaults to config.BROWSER_BLOCK_RESOURCES; pass an
+                     empty set for scrapers that need every resource.
+                     config.BROWSER_BLOCK_HOSTS is blocked either way.
+        """
+        if not kwargs and block_resources is None:
+            async with self.lease_context(timeout) as ctx:
+                yield ctx
+            return
+
+        await self._acquire_slot(timeout)
         ctx: Optional[BrowserContext] = None
         try:
             browser = await self._ensure_browser()
             kwargs.setdefault("user_agent", config.USER_AGENT)
+            if self._storage_state is not None:
+                kwargs.setdefault("storage_state", self._storage_state)
             ctx = await browser.new_context(**kwargs)
+            await block_requests(
+                ctx, _BLOCKED_RESOURCES if block_resources is None else block_resources
+            )
             yield ctx
         finally:
             if ctx:
@@ -157,6 +318,62 @@ class BrowserPool:
                     pass
             self._semaphore.release()
 
+    @asynccontextmanager
+    async def lease_context(self, timeout: float = None):
+        """
+        Acquire a semaphore slot and lease a pre-warmed BrowserContext.
+
+        The context is not closed on exit: leftover pages are closed, cookies
+        are reset to the warmup state and it goes back to the pool for the
+        next caller. A context whose open pages hold localStorage is closed
+        instead, so that site state doesn't leak into the next lease.
+        Contexts left over from a crashed browser are replaced transparently.
+
+        Args:
+            timeout: Max seconds to wait for a pool slot. Defaults to
+                     config.BROWSER_POOL_TIMEOUT. Raises RuntimeError
+                     if no slot is available within the timeout.
+        """
+        await self._acquire_slot(timeout)
+        ctx: Optional[BrowserContext] = None
+        try:
+            browser = await self._ensure_browser()
+            queue = self._ctx_queue
+            if queue is not None and not queue.empty():
+                ctx = queue.get_nowait()
+                if ctx.browser is not browser:
+                    # Belongs to a browser that was restarted — discard it
+                    ctx = None
+            if ctx is None:
+                ctx = await self._new_default_context(browser)
+            yield ctx
+        finally:
+            if ctx:
+                try:
+                    recycle = self._ctx_queue is None or await self._has_dirty_local_storage(ctx)
+                    # Closing the pages also drops their sessionStorage
+                    for page in ctx.pages:
+                        await page.close()
+                    if recycle:
+                        await ctx.close()
+                    else:
+                        await ctx.clear_cookies()
+                        if self._storage_state and self._storage_state.get("cookies"):
+                            # Restore the shared warmup cookies for the next lease
+                            await ctx.add_cookies(self._storage_state["cookies"])
+                        queue = self._ctx_queue
+                        if queue is not None:
+                            queue.put_nowait(ctx)
+                        else:
+                            # Pool stopped while the cookies were being reset
+                            await ctx.close()
+                except Exception as e:
+                    logger.warning("BrowserPool: dropping leased context: %s", e)
+                    try:
+                        await ctx.close()
+                    except Exception:
+                        pass
+            self._semaphore.release()
 
 # Module-level singleton
 browser_pool = BrowserPool()
@@ -22,13 +22,16 @@ includes all levels of government (provincial, territorial, municipal).
 """
 
 import asyncio
-import csv
-import io
+import importlib.util
 import re
-from datetime import datetime, timedelta
-from typing import Optional, List
+from datetime import datetime, timedelta, timezone
+from typing import Optional, List, Tuple
 
 import httpx
+import pyarrow as pa
+import pyarrow.compute as pc
+from pyarrow import csv as pacsv
+from selectolax.lexbor import LexborHTMLParser
 
 import sys
 sys.path.insert(0, str(__file__).rsplit("/", 2)[0])
@@ -45,37 +48,91 @@ SEARCH_URL = f"{CANADA_BUYS_BASE}/en/tender-opportunities"
 CSV_OPEN_TENDERS = f"{CANADA_BUYS_BASE}/opendata/pub/openTenderNotice-ouvertAvisAppelOffres.csv"
 CSV_NEW_TENDERS = f"{CANADA_BUYS_BASE}/opendata/pub/newTenderNotice-nouvelAvisAppelOffres.csv"
 
-
-def _normalize_csv_tender(row: dict) -> dict:
-    """Normalize a CSV row into our standard tender format."""
-    # Parse closing date (ISO 8601 with time, e.g. 2026-02-20T14:00:00)
-    closing_raw = row.get("tenderClosingDate-appelOffresDateCloture", "")
-    closing_date = closing_raw[:10] if closing_raw else ""
+# HTTP/2 needs the optional h2 package (httpx[http2]); fall back to HTTP/1.1 without it
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Shared client for the CSV feed and HTML pages (same host), per event loop
+_client: Optional[Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = None
+
+# The only CSV columns _normalize_csv_tender reads (of 67), in its unpack order
+_CSV_COLUMNS = [
+    "title-titre-eng",
+    "referenceNumber-numeroReference",
+    "solicitationNumber-numeroSollicitation",
+    "publicationDate-datePublication",
+    "tenderClosingDate-appelOffresDateCloture",
+    "tenderStatus-appelOffresStatut-eng",
+    "procurementCategory-categorieApprovisionnement",
+    "regionsOfDelivery-regionsLivraison-eng",
+    "contractingEntityName-nomEntitContractante-eng",
+    "noticeType-avisType-eng",
+    "contactInfoName-informationsContactNom",
+    "contactInfoEmail-informationsContactCourriel",
+    "tenderDescription-descriptionAppelOffres-eng",
+    "noticeURL-URLavis-eng",
+]
+# Fill for columns missing from the feed (default "")
+_CSV_DEFAULTS = {"tenderStatus-appelOffresStatut-eng": "Open"}
+
+_CATEGORY_MAP = {"GD": "Goods", "SRV": "Services", "CNST": "Construction", "SVRTGD": "Services related to goods"}
+
+_NOTICE_PATH = "/en/tender-opportunities/tender-notice/"
+_NOTICE_LINK_SELECTOR = f'a[href^="{_NOTICE_PATH}"]'
+_NOTICE_HREF = f'href="{_NOTICE_PATH}'
+_HTML_PAGE_SIZE = 50
+_HTML_DATE_RE = re.compile(r"^(\d{4})/(\d{2})/(\d{2})$")
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Get or create the pooled Canada Buys client for the current event loop."""
+    global _client
+    loop = asyncio.get_running_loop()
+    if _client is None or _client[0] is not loop or _client[1].is_closed:
+        _client = (loop, httpx.AsyncClient(
+            http2=_HTTP2,
+            follow_redirects=True,
+            timeout=60,
+            headers={"User-Agent": config.USER_AGENT},
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        ))
+    return _client[1]
+
+
+async def close_client() -> None:
+    """Close the pooled client. Call once at app shutdown."""
+    global _client
+    if _client is not None and _client[0] is asyncio.get_running_loop():
+        await _client[1].aclose()
+    _client = None
+
+
+def _normalize_csv_tender(row: tuple) -> dict:
+    """Normalize a CSV row (values in _CSV_COLUMNS order) into our standard tender format."""
+    (title, ref, sol_number, published, closing_raw, status, cat_code, region,
+     organization, notice_type, contact_name, contact_email, description, notice_url) = row
 
     # Map procurement category codes to readable names
-    cat_code = (row.get("procurementCategory-categorieApprovisionnement", "") or "").strip("* ")
-    category_map = {"GD": "Goods", "SRV": "Services", "CNST": "Construction", "SVRTGD": "Services related to goods"}
-    category = category_map.get(cat_code, cat_code)
+    cat_code = cat_code.strip("* ")
+    category = _CATEGORY_MAP.get(cat_code, cat_code)
 
-    ref = row.get("referenceNumber-numeroReference", "")
-    notice_url = row.get("noticeURL-URLavis-eng", "")
     source_url = notice_url if notice_url else (
         f"{CANADA_BUYS_BASE}/en/tender-opportunities/tender-notice/{ref}" if ref else ""
     )
 
     return {
-        "title": row.get("title-titre-eng", ""),
-        "solicitationNumber": row.get("solicitationNumber-numeroSollicitation", "") or ref,
-        "status": row.get("tenderStatus-appelOffresStatut-eng", "Open"),
-        "publishedDate": row.get("publicationDate-datePublication", ""),
-        "closingDate": closing_date,
+        "title": title,
+        "solicitationNumber": sol_number or ref,
+        "status": status,
+        "publishedDate": published,
+        # Closing date is ISO 8601 with time, e.g. 2026-02-20T14:00:00
+        "closingDate": closing_raw[:10],
         "category": category,
-        "region": (row.get("regionsOfDelivery-regionsLivraison-eng", "") or "").strip("* "),
-        "organization": row.get("contractingEntityName-nomEntitContractante-eng", ""),
-        "procurementType": row.get("noticeType-avisType-eng", ""),
-        "contactName": row.get("contactInfoName-informationsContactNom", ""),
-        "contactEmail": row.get("contactInfoEmail-informationsContactCourriel", ""),
-        "description": (row.get("tenderDescription-descriptionAppelOffres-eng", "") or "")[:500],
+        "region": region.strip("* "),
+        "organization": organization,
+        "procurementType": notice_type,
+        "contactName": contact_name,
+        "contactEmail": contact_email,
+        "description": description,  # truncated to 500 chars in _parse_csv_feed
         "sourceUrl": source_url,
         "source": "canada_buys",
     }
@@ -106,11 +163,10 @@ def _parse_html_date(date_str: str) -> str:
     date_str = date_str.strip()
     if not date_str or date_str == "9999/12/31":
         return ""
-    try:
-        dt = datetime.strptime(date_str[:10], "%Y/%m/%d")
-        return dt.strftime("%Y-%m-%d")
-    except ValueError:
+    m = _HTML_DATE_RE.match(date_str[:10])
+    if not m:
         return date_str
+    return f"{m[1]}-{m[2]}-{m[3]}"
 
 
 async def search_tenders(
@@ -132,6 +188,8 @@ async def search_tenders(
     Returns:
         Dict with source, tenders list, metadata
     """
+    scraped_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
     # Try CSV feed first (richest data, 100% date coverage)
     try:
         tenders = await _fetch_csv(keywords, days_back, max_results)
@@ -140,7 +198,7 @@ async def search_tenders(
                 "source": "canada_buys_csv",
                 "totalTenders": len(tenders),
                 "tenders": tenders,
-                "scrapedAt": datetime.utcnow().isoformat() + "Z",
+                "scrapedAt": scraped_at,
             }
     except Exception as e:
         logger.warning("CSV feed failed, falling back to HTML parsing: %s", e)
@@ -153,7 +211,7 @@ async def search_tenders(
                 "source": "canada_buys_html",
                 "totalTenders": len(tenders),
                 "tenders": tenders,
-                "scrapedAt": datetime.utcnow().isoformat() + "Z",
+                "scrapedAt": scraped_at,
             }
     except Exception as e:
         logger.error("HTML parsing failed: %s", e, exc_info=True)
@@ -162,10 +220,60 @@ async def search_tenders(
         "source": "canada_buys",
         "totalTenders": 0,
         "tenders": [],
-        "scrapedAt": datetime.utcnow().isoformat() + "Z",
+        "scrapedAt": scraped_at,
     }
 
 
+def _parse_csv_feed(body: bytes, cutoff_day: str, kw: Optional[str], max_results: int) -> List[dict]:
+    """
+    Parse and filter the open-tenders CSV in Arrow.
+
+    Only the columns _normalize_csv_tender reads are decoded, the date and
+    keyword filters run vectorized, and just the surviving rows become dicts.
+    """
+    table = pacsv.read_csv(
+        pa.BufferReader(body),
+        # Descriptions contain quoted line breaks
+        parse_options=pacsv.ParseOptions(newlines_in_values=True),
+        convert_options=pacsv.ConvertOptions(
+            include_columns=_CSV_COLUMNS,
+            include_missing_columns=True,
+            # Keep dates and codes as the raw strings the normalizer expects
+            column_types={col: pa.string() for col in _CSV_COLUMNS},
+        ),
+    )
+    # Columns absent from the feed come back as nulls
+    table = pa.table({col: pc.fill_null(table[col], _CSV_DEFAULTS.get(col, "")) for col in _CSV_COLUMNS})
+
+    # publicationDate is a plain YYYY-MM-DD, so dates compare as strings.
+    # A row dated on the cutoff day itself falls before cutoff's time of day.
+    pub = table["publicationDate-datePublication"]
+    mask = pc.or_(
+        pc.equal(pub, ""),
+        pc.greater(pc.utf8_slice_codeunits(pub, 0, 10), cutoff_day),
+    )
+    # Filter by keywords (search title and description)
+    if kw:
+        mask = pc.and_(mask, pc.or_(
+            pc.match_substring(pc.utf8_lower(table["title-titre-eng"]), kw),
+            pc.match_substring(pc.utf8_lower(table["tenderDescription-descriptionAppelOffres-eng"]), kw),
+        ))
+
+    matched = table.filter(mask).slice(0, max_results)
+    # Truncate descriptions in Arrow so only 500 chars per kept row become Python strings
+    desc_col = "tenderDescription-descriptionAppelOffres-eng"
+    matched = matched.set_column(
+        matched.schema.get_field_index(desc_col),
+        desc_col,
+        pc.utf8_slice_codeunits(matched[desc_col], 0, 500),
+    )
+    # Column-wise to_pylist + zip yields plain tuples; no per-row dict
+    return [
+        _normalize_csv_tender(row)
+        for row in zip(*(matched[col].to_pylist() for col in _CSV_COLUMNS))
+    ]
+
+
 async def _fetch_csv(
     keywords: Optional[str],
     days_back: int,
@@ -178,49 +286,15 @@ async def _fetch_csv(
     federal tenders with 100% date coverage and contact information.
     Updated daily at 7:00-8:30 AM ET.
     """
-    cutoff = datetime.utcnow() - timedelta(days=days_back)
-    keyword_pattern = re.compile(re.escape(keywords), re.IGNORECASE) if keywords else None
-    tenders: List[dict] = []
-
-    headers = {
-        "User-Agent": config.USER_AGENT,
-        "Accept": "text/csv,text/plain,*/*",
-    }
+    cutoff_day = (datetime.now(timezone.utc) - timedelta(days=days_back)).strftime("%Y-%m-%d")
+    kw = keywords.lower() if keywords else None
 
-    async with httpx.AsyncClient(
-        follow_redirects=True,
-        timeout=60,
-        headers=headers,
-    ) as client:
-        response = await client.get(CSV_OPEN_TENDERS)
-        response.raise_for_status()
+    client = _get_client()
+    response = await client.get(CSV_OPEN_TENDERS, headers={"Accept": "text/csv,text/plain,*/*"})
+    response.raise_for_status()
 
-        # Parse CSV (UTF-8 with BOM)
-        text = response.text.lstrip("\ufeff")
-        reader = csv.DictReader(io.StringIO(text))
-
-        for row in reader:
-            if len(tenders) >= max_results:
-                break
-
-            # Filter by publication date
-            pub_date = row.get("publicationDate-datePublication", "")
-            if pub_date:
-                try:
-                    pub_dt = datetime.strptime(pub_date, "%Y-%m-%d")
-                    if pub_dt < cutoff:
-                        continue
-                except ValueError:
-                    pass
-
-            # Filter by keywords (search title and description)
-            if keyword_pattern:
-                title = row.get("title-titre-eng", "")
-                desc = row.get("tenderDescription-descriptionAppelOffres-eng", "")
-                if not keyword_pattern.search(title) and not keyword_pattern.search(desc):
-                    continue
-
-            tenders.append(_normalize_csv_tender(row))
+    # Parsing the full feed is CPU-bound; keep it off the event loop
+    tenders = await asyncio.to_thread(_parse_csv_feed, response.content, cutoff_day, kw, max_results)
 
     logger.info("CSV feed returned %d tenders", len(tenders))
     return tenders
@@ -237,52 +311,69 @@ async def _fetch_html(
     Fallback for when CSV feed is unavailable. Includes all levels of
     government (not just federal). 50 items per page.
     """
-    cutoff = datetime.utcnow() - timedelta(days=days_back)
-    keyword_pattern = re.compile(re.escape(keywords), re.IGNORECASE) if keywords else None
+    cutoff_day = (datetime.now(timezone.utc) - timedelta(days=days_back)).strftime("%Y-%m-%d")
+    kw = keywords.lower() if keywords else None
     tenders: List[dict] = []
 
     headers = {
-        "User-Agent": config.USER_AGENT,
         "Accept": "text/html,application/xhtml+xml,*/*;q=0.8",
         "Accept-Language": "en-US,en;q=0.5",
     }
-
-    async with httpx.AsyncClient(
-        follow_redirects=True,
-        timeout=30,
-        headers=headers,
-    ) as client:
-        page_num = 0
-        max_pages = (max_results // 50) + 2
-
-        while page_num < max_pages and len(tenders) < max_results:
-            params = {}
-            if keywords:
-                params["search_api_fulltext"] = keywords
-            if page_num > 0:
-                params["page"] = str(page_num)
-
-            response = await client.get(SEARCH_URL, params=params)
-            response.raise_for_status()
-
-            page_tenders = _parse_table_html(response.text, cutoff, keyword_pattern)
-            if not page_tenders:
-                break
-
-            tenders.extend(page_tenders)
-            page_num += 1
-
-            if page_num < max_pages and len(tenders) < max_results:
-                await asyncio.sleep(0.5)
-
-    logger.info("HTML parsed %d tenders from %d page(s)", len(tenders), page_num)
+    client = _get_client()
+    max_pages = (max_results // _HTML_PAGE_SIZE) + 2
+    base_params = {"search_api_fulltext": keywords} if keywords else {}
+    sem = asyncio.Semaphore(config.CANADA_BUYS_PAGE_CONCURRENCY)
+
+    async def _fetch_page(page_num: int) -> Tuple[list, bool]:
+        """Tenders on one listing page, and whether it was a full page."""
+        params = dict(base_params)
+        if page_num > 0:
+            params["page"] = str(page_num)
+        async with sem:
+            response = await client.get(SEARCH_URL, params=params, headers=headers, timeout=30)
+        response.raise_for_status()
+        html = response.text
+        # Rows are filtered while parsing, so fullness comes from the raw links
+        return _parse_table_html(html, cutoff_day, kw), html.count(_NOTICE_HREF) >= _HTML_PAGE_SIZE
+
+    # Most searches fit on one page; only fan out when page 0 is full
+    first, full = await _fetch_page(0)
+    pages = [first]
+    if first and full and max_pages > 1:
+        tasks = [asyncio.ensure_future(_fetch_page(n)) for n in range(1, max_pages)]
+        try:
+            # Read in page order; once a page is empty or short, or enough
+            # tenders are in, the remaining pages are cancelled
+            collected = len(first)
+            for task in tasks:
+                page_tenders, full = await task
+                pages.append(page_tenders)
+                collected += len(page_tenders)
+                if not page_tenders or not full or collected >= max_results:
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    page_count = 0
+    for page_tenders in pages:
+        if not page_tenders:
+            break
+        tenders.extend(page_tenders)
+        page_count += 1
+
+    logger.info("HTML parsed %d tenders from %d page(s)", len(tenders), page_count)
     return tenders[:max_results]
 
 
-def _parse_table_html(html: str, cutoff: datetime, keyword_pattern) -> list:
+def _parse_table_html(html: str, cutoff_day: str, kw: Optional[str]) -> list:
     """
     Parse tender table rows from the HTML.
 
+    Rows published on or before cutoff_day (YYYY-MM-DD) are skipped, as are
+    rows whose title does not contain kw (already lower-cased).
+
     Each table row has 5 cells:
     0: Title (with link to /tender-notice/{uuid})
     1: Category (Goods, Services, Construction)
@@ -291,46 +382,43 @@ def _parse_table_html(html: str, cutoff: datetime, keyword_pattern) -> list:
     4: Organization
     """
     tenders = []
-    row_pattern = re.compile(r'<tr[^>]*>(.*?)</tr>', re.DOTALL)
 
-    for row_match in row_pattern.finditer(html):
-        row_html = row_match.group(1)
+    # Parse only the table region: building a DOM for the whole page
+    # (nav, scripts, footer) costs more than the rows themselves
+    start = html.find("<table")
+    end = html.rfind("</table>")
+    if start < 0 or end < start:
+        return tenders
 
-        link_match = re.search(
-            r'<a[^>]*href="(/en/tender-opportunities/tender-notice/([^"]+))"[^>]*>([^<]+)</a>',
-            row_html
-        )
-        if not link_match:
+    for row in LexborHTMLParser(html[start:end + len("</table>")]).css("tr"):
+        link = row.css_first(_NOTICE_LINK_SELECTOR)
+        if link is None:
             continue
 
-        href = link_match.group(1)
-        tender_id = link_match.group(2)
-        title = link_match.group(3).strip()
+        href = link.attributes.get("href") or ""
+        tender_id = href[len(_NOTICE_PATH):]
+        title = link.text(strip=True)
 
         if not title or len(title) < 3:
             continue
 
-        if keyword_pattern and not keyword_pattern.search(title):
+        if kw and kw not in title.lower():
             continue
 
-        cells = re.findall(r'<td[^>]*>(.*?)</td>', row_html, re.DOTALL)
-        clean_cells = [re.sub(r'<[^>]+>', ' ', c).strip() for c in cells]
+        # Cell text is read once each, only for cells we use (title came
+        # from the link), and the date filter runs before the rest are read
+        cells = row.css("td")
 
-        category = clean_cells[1] if len(clean_cells) > 1 else ""
-        open_date_str = clean_cells[2] if len(clean_cells) > 2 else ""
-        close_date_str = clean_cells[3] if len(clean_cells) > 3 else ""
-        organization = clean_cells[4] if len(clean_cells) > 4 else ""
+        def cell(i: int) -> str:
+            return cells[i].text(separator=" ", strip=True) if len(cells) > i else ""
 
-        published_date = _parse_html_date(open_date_str)
-        closing_date = _parse_html_date(close_date_str)
+        published_date = _parse_html_date(cell(2))
+        if published_date and published_date <= cutoff_day:
+            continue
 
-        if published_date:
-            try:
-                pub_dt = datetime.strptime(published_date, "%Y-%m-%d")
-                if pub_dt < cutoff:
-                    continue
-            except ValueError:
-                pass
+        category = cell(1)
+        closing_date = _parse_html_date(cell(3))
+        organization = cell(4)
 
         source_url = f"{CANADA_BUYS_BASE}{href}"
 
@@ -348,6 +436,23 @@ def _parse_table_html(html: str, cutoff: datetime, keyword_pattern) -> list:
     return tenders
 
 
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
 def search_tenders_sync(keywords=None, days_back=7) -> dict:
-    """Synchronous wrapper."""
-    return asyncio.run(search_tenders(keywords=keywords, days_back=days_back))
+    """Synchronous wrapper. Reuses one event loop (and so one client) across calls; see shutdown_sync()."""
+    global _sync_loop
+    if _sync_loop is None or _sync_loop.is_closed():
+        _sync_loop = asyncio.new_event_loop()
+    return _sync_loop.run_until_complete(search_tenders(keywords=keywords, days_back=days_back))
+
+
+def shutdown_sync() -> None:
+    """Close the client and event loop held by search_tenders_sync()."""
+    global _sync_loop
+    if _sync_loop is None:
+        return
+    if not _sync_loop.is_closed():
+        _sync_loop.run_until_complete(close_client())
+        _sync_loop.close()
+    _sync_loop = None
@@ -21,6 +21,65 @@ from utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+_NSN_RE = re.compile(r"NSN:\s*([\d-]+)")
+_NOM_RE = re.compile(r"Nomenclature:\s*(.+?)(?:\s*AMSC:|$)", re.DOTALL)
+_AMSC_RE = re.compile(r"AMSC:\s*(\w+)")
+_QTY_RE = re.compile(r"(\d[\d,]*)")
+
+# In-page extractors: each returns everything its Python caller needs in one
+# CDP round trip. Text is innerText (same as Locator.inner_text) and hrefs are
+# raw attributes (same as Locator.get_attribute).
+_HEADER_TEXT_JS = """() => {
+    const fs = document.querySelector('fieldset');
+    return fs ? fs.innerText : '';
+}"""
+
+_APPROVED_SOURCES_JS = """() => {
+    for (const fs of document.querySelectorAll('fieldset')) {
+        if (!/approved source data/i.test(fs.textContent.replace(/\\s+/g, ' '))) continue;
+        const table = fs.querySelector('table');
+        if (!table) continue;
+        return Array.from(table.querySelectorAll('tr')).slice(1)
+            .map(tr => Array.from(tr.querySelectorAll('td')).map(td => td.innerText.trim()))
+            .filter(cells => cells.length >= 3)
+            .map(cells => cells.slice(0, 3));
+    }
+    return [];
+}"""
+
+# Header fieldset / results tables on RFQ pages; present once the data has rendered
+_DATA_SELECTOR = "fieldset, table"
+
+# RFQ grid: by ID, else the first table whose header row names the RFQ columns
+_SOLICITATION_ROWS_JS = """() => {
+    const isRfqTable = t => {
+        const header = t.querySelector('tr');
+        const text = header ? header.textContent : '';
+        return text.includes('NSN/Part Number') || text.includes('RFQ/Quote');
+    };
+    const table = document.querySelector('#ctl00_cph1_grdRfqSearch')
+        || Array.from(document.querySelectorAll('table')).find(isRfqTable);
+    if (!table) return [];
+    const rows = [];
+    for (const tr of Array.from(table.querySelectorAll('tr')).slice(1)) {
+        const c = tr.querySelectorAll('td');
+        if (c.length < 8) continue;
+        const solLink = c[4].querySelector('a');
+        rows.push({
+            techDocs: c[3].innerText.trim(),
+            docHrefs: Array.from(c[3].querySelectorAll('a'))
+                .map(a => a.getAttribute('href')).filter(Boolean),
+            solicitation: c[4].innerText.trim(),
+            solicitationHref: solLink ? solLink.getAttribute('href') : null,
+            status: c[5].innerText.trim(),
+            purchaseRequest: c[6].innerText.trim(),
+            issued: c[7].innerText.trim(),
+            returnBy: c[8] ? c[8].innerText.trim() : '',
+        });
+    }
+    return rows;
+}"""
+
 
 async def wait_for_idle(page: Page, timeout_ms: int = 15000) -> None:
     """Wait for networkidle with a timeout — logs warning and continues if it fires."""
@@ -30,6 +89,19 @@ async def wait_for_idle(page: Page, timeout_ms: int = 15000) -> None:
         logger.warning("networkidle timed out after %dms, continuing", timeout_ms)
 
 
+async def wait_for_data(page: Page, selector: str = _DATA_SELECTOR, timeout_ms: int = 8000) -> None:
+    """
+    Wait until the content we extract is in the DOM — logs warning and continues on timeout.
+
+    DIBBS analytics beacons often keep networkidle from ever firing, so prefer
+    this over wait_for_idle whenever the expected markup is known.
+    """
+    try:
+        await page.wait_for_selector(selector, state="attached", timeout=timeout_ms)
+    except PlaywrightTimeoutError:
+        logger.warning("%r not found after %dms, continuing", selector, timeout_ms)
+
+
 async def handle_consent_banner(page: Page, return_url: str) -> bool:
     """
     Handle the DoD Notice and Consent Banner.
@@ -53,7 +125,7 @@ async def handle_consent_banner(page: Page, return_url: str) -> bool:
             # Navigate back to our specific search URL
             logger.debug("DIBBS: Navigating back to %s", return_url)
             await page.goto(return_url, timeout=config.SCRAPE_TIMEOUT, wait_until="domcontentloaded")
-            await wait_for_idle(page)
+            await wait_for_data(page)
             logger.debug("DIBBS: Now at URL: %s", page.url)
             return True
 
@@ -75,22 +147,24 @@ async def extract_header_info(page: Page) -> Tuple[str, str, str]:
     amsc = ""
 
     try:
-        # Get the first fieldset which contains header info
-        fieldset = page.locator("fieldset").first
-        text = await fieldset.inner_text()
+        # The first fieldset contains the header info
+        text = await page.evaluate(_HEADER_TEXT_JS)
+        if not text:
+            logger.warning("extract_header_info: no header fieldset on page")
+            return nsn, nomenclature, amsc
 
         # Extract NSN
-        nsn_match = re.search(r"NSN:\s*([\d-]+)", text)
+        nsn_match = _NSN_RE.search(text)
         if nsn_match:
             nsn = nsn_match.group(1)
 
         # Extract Nomenclature (may contain commas)
-        nom_match = re.search(r"Nomenclature:\s*(.+?)(?:\s*AMSC:|$)", text, re.DOTALL)
+        nom_match = _NOM_RE.search(text)
         if nom_match:
             nomenclature = nom_match.group(1).strip()
 
         # Extract AMSC
-        amsc_match = re.search(r"AMSC:\s*(\w+)", text)
+        amsc_match = _AMSC_RE.search(text)
         if amsc_match:
             amsc = amsc_match.group(1)
 
@@ -112,32 +186,15 @@ async def extract_approved_sources(page: Page) -> List[ApprovedSource]:
     sources = []
 
     try:
-        # Find the Approved Source Data fieldset
-        fieldset = page.locator('fieldset:has-text("Approved Source Data")')
-        table = fieldset.locator("table").first
-
-        if await table.count() > 0:
-            rows = table.locator("tr")
-            row_count = await rows.count()
-
-            # Skip header row (start at 1)
-            for i in range(1, row_count):
-                row = rows.nth(i)
-                cells = row.locator("td")
-                cell_count = await cells.count()
-
-                if cell_count >= 3:
-                    cage_code = (await cells.nth(0).inner_text()).strip()
-                    part_number = (await cells.nth(1).inner_text()).strip()
-                    company_name = (await cells.nth(2).inner_text()).strip()
-
-                    # Validate CAGE code (5 alphanumeric, not starting with SPE)
-                    if cage_code and not cage_code.startswith("SPE") and len(cage_code) == 5:
-                        sources.append(ApprovedSource(
-                            cageCode=cage_code,
-                            partNumber=part_number,
-                            companyName=company_name
-                        ))
+        # Rows come back as [cage, part, company] from a single evaluate()
+        for cage_code, part_number, company_name in await page.evaluate(_APPROVED_SOURCES_JS):
+            # Validate CAGE code (5 alphanumeric, not starting with SPE)
+            if cage_code and not cage_code.startswith("SPE") and len(cage_code) == 5:
+                sources.append(ApprovedSource(
+                    cageCode=cage_code,
+                    partNumber=part_number,
+                    companyName=company_name
+                ))
 
     except Exception as e:
         logger.error("extract_approved_sources error: %s", e, exc_info=True)
@@ -163,102 +220,61 @@ async def extract_solicitations(page: Page) -> List[Solicitation]:
     solicitations = []
 
     try:
-        # Find the main data table - it contains NSN/Part Number header
-        tables = page.locator("table")
-        table_count = await tables.count()
-
-        for t in range(table_count):
-            table = tables.nth(t)
-            text = await table.inner_text()
-
-            # Check if this is the RFQ results table (has NSN/Part Number column)
-            if "NSN/Part Number" in text or "RFQ/Quote" in text:
-                rows = table.locator("tr")
-                row_count = await rows.count()
-
-                # Skip header row (start at 1)
-                for i in range(1, row_count):
-                    row = rows.nth(i)
-                    cells = row.locator("td")
-                    cell_count = await cells.count()
-
-                    # Need at least 8 columns for the full table
-                    if cell_count >= 8:
-                        # Column 3: Technical Documents (text + download URLs)
-                        tech_docs_cell = cells.nth(3)
-                        tech_docs = (await tech_docs_cell.inner_text()).strip()
-
-                        # Extract document download URLs from links
-                        doc_urls = []
-                        doc_links = tech_docs_cell.locator("a")
-                        doc_link_count = await doc_links.count()
-                        for dl in range(doc_link_count):
-                            href = await doc_links.nth(dl).get_attribute("href")
-                            if href:
-                                if not href.startswith("http"):
-                                    href = f"https://www.dibbs.bsm.dla.mil{href}"
-                                doc_urls.append(href)
-
-                        # Column 4: Solicitation (with link)
-                        sol_cell = cells.nth(4)
-                        sol_number = (await sol_cell.inner_text()).strip()
-                        # Clean up - remove "Package View" and other extra text
-                        sol_number = sol_number.split('\n')[0].strip()
-
-                        sol_url = None
-                        link = sol_cell.locator("a").first
-                        if await link.count() > 0:
-                            sol_url = await link.get_attribute("href")
-
-                        # Column 5: RFQ/Quote Status - THIS IS THE KEY COLUMN
-                        status_cell = cells.nth(5)
-                        status_text = (await status_cell.inner_text()).strip()
-                        # Clean up status - extract just the status word
-                        # Status can be: "Open", "Removed", "Cancelled"
-                        status = status_text.split('\n')[0].strip()
-                        # Remove any extra characters like vote icons
-                        if 'Open' in status:
-                            status = 'Open'
-                        elif 'Removed' in status:
-                            status = 'Removed'
-                        elif 'Cancel' in status:
-                            status = 'Cancelled'
-
-                        # Column 6: Purchase Request (contains PR # and QTY on separate lines)
-                        pr_cell = cells.nth(6)
-                        pr_text = (await pr_cell.inner_text()).strip()
-                        pr_lines = pr_text.split('\n')
-                        pr_number = pr_lines[0].strip() if pr_lines else ""
-
-                        # Parse quantity from "QTY: XXX" line
-                        quantity = 0
-                        for line in pr_lines:
-                            if 'QTY' in line.upper():
-                                qty_match = re.search(r'(\d[\d,]*)', line)
-                                if qty_match:
-                                    try:
-                                        quantity = int(qty_match.group(1).replace(",", ""))
-                                    except ValueError:
-                                        quantity = 0
-
-                        # Column 7: Issued date
-                        issue_date = (await cells.nth(7).inner_text()).strip()
-
-                        # Column 8: Return By date
-                        return_by_date = (await cells.nth(8).inner_text()).strip()
-
-                        if sol_number:
-                            solicitations.append(Solicitation(
-                                solicitationNumber=sol_number,
-                                solicitationUrl=sol_url,
-                                technicalDocuments=tech_docs or "None",
-                                documentUrls=doc_urls,
-                                status=status,
-                                prNumber=pr_number,
-                                quantity=quantity,
-                                issueDate=issue_date,
-                                returnByDate=return_by_date
-                            ))
+        # Read every row of the RFQ results table in one evaluate() instead of
+        # ~10 locator round trips per row
+        for row in await page.evaluate(_SOLICITATION_ROWS_JS):
+            # Column 3: Technical Documents (text + download URLs)
+            tech_docs = row["techDocs"]
+            doc_urls = [
+                href if href.startswith("http") else f"https://www.dibbs.bsm.dla.mil{href}"
+                for href in row["docHrefs"]
+            ]
+
+            # Column 4: Solicitation (with link)
+            # Clean up - remove "Package View" and other extra text
+            sol_number = row["solicitation"].split('\n')[0].strip()
+            sol_url = row["solicitationHref"]
+
+            # Column 5: RFQ/Quote Status - THIS IS THE KEY COLUMN
+            # Clean up status - extract just the status word
+            # Status can be: "Open", "Removed", "Cancelled"
+            status = row["status"].split('\n')[0].strip()
+            # Remove any extra characters like vote icons
+            if 'Open' in status:
+                status = 'Open'
+            elif 'Removed' in status:
+                status = 'Removed'
+            elif 'Cancel' in status:
+                status = 'Cancelled'
+
+            # Column 6: Purchase Request (contains PR # and QTY on separate lines)
+            pr_lines = row["purchaseRequest"].split('\n')
+            pr_number = pr_lines[0].strip() if pr_lines else ""
+
+            # Parse quantity from "QTY: XXX" line
+            quantity = 0
+            for line in pr_lines:
+                if 'QTY' in line.upper():
+                    qty_match = _QTY_RE.search(line)
+                    if qty_match:
+                        try:
+                            quantity = int(qty_match.group(1).replace(",", ""))
+                        except ValueError:
+                            quantity = 0
+
+            if sol_number:
+                solicitations.append(Solicitation(
+                    solicitationNumber=sol_number,
+                    solicitationUrl=sol_url,
+                    technicalDocuments=tech_docs or "None",
+                    documentUrls=doc_urls,
+                    status=status,
+                    prNumber=pr_number,
+                    quantity=quantity,
+                    # Column 7: Issued date / Column 8: Return By date
+                    issueDate=row["issued"],
+                    returnByDate=row["returnBy"]
+                ))
 
     except Exception as e:
         logger.error("Error extracting solicitations: %s", e, exc_info=True)
@@ -281,20 +297,6 @@ def has_open_rfqs(solicitations: List[Solicitation]) -> bool:
     return False
 
 
-async def check_dibbs_health(page: Page) -> bool:
-    """Fast health check — can DIBBS respond within 10s?"""
-    try:
-        await page.goto(
-            "https://www.dibbs.bsm.dla.mil/rfq/",
-            timeout=10000,
-            wait_until="domcontentloaded",
-        )
-        return True
-    except Exception as e:
-        logger.warning("DIBBS health check failed: %s", e)
-        return False
-
-
 async def _do_scrape_dibbs(page: Page, nsn: str, source_url: str) -> ScrapeResult:
     """
     Core DIBBS scraping logic operating on an existing page.
@@ -302,28 +304,27 @@ async def _do_scrape_dibbs(page: Page, nsn: str, source_url: str) -> ScrapeResul
     Handles consent banner, retries, and data extraction.
     """
     try:
-        # Quick health check before committing to expensive retries
-        if not await check_dibbs_health(page):
-            return ScrapeResult(
-                success=False,
-                error="DIBBS unreachable (health check failed)"
-            )
-
-        # Retry logic for initial navigation (handles IP throttling / timeouts)
+        # Retry logic for initial navigation (handles IP throttling / timeouts).
+        # The first attempt is capped at 10s so a stalled load is retried
+        # quickly; retries back off and get the full timeout.
         for attempt in range(config.MAX_RETRIES):
             try:
                 logger.debug("DIBBS: Navigating to %s", source_url)
-                await page.goto(source_url, timeout=config.SCRAPE_TIMEOUT, wait_until="domcontentloaded")
+                timeout = min(config.SCRAPE_TIMEOUT, 10000) if attempt == 0 else config.SCRAPE_TIMEOUT
+                await page.goto(source_url, timeout=timeout, wait_until="domcontentloaded")
 
                 # Handle consent banner (pass source_url so we can return to it after consent)
                 await handle_consent_banner(page, source_url)
 
-                # Wait for page to stabilize
-                await wait_for_idle(page)
+                # Wait for the header/results markup rather than networkidle
+                await wait_for_data(page)
                 break
             except PlaywrightTimeoutError:
                 if attempt == config.MAX_RETRIES - 1:
-                    raise
+                    return ScrapeResult(
+                        success=False,
+                        error="DIBBS unreachable (navigation timed out)"
+                    )
                 delay = (config.RETRY_DELAY / 1000) * (2 ** attempt) + random.uniform(0, 1)
                 logger.warning(
                     "DIBBS page.goto timeout for NSN %s, retrying in %.1fs (attempt %d/%d)",
@@ -335,9 +336,12 @@ async def _do_scrape_dibbs(page: Page, nsn: str, source_url: str) -> ScrapeResul
         rfq_data = None
         for attempt in range(config.MAX_RETRIES):
             logger.debug("DIBBS: Extraction attempt %d/%d", attempt + 1, config.MAX_RETRIES)
-            nsn_found, nomenclature, amsc = await extract_header_info(page)
-            approved_sources = await extract_approved_sources(page)
-            solicitations = await extract_solicitations(page)
+            # Independent reads of the same page; overlap their CDP round trips
+            (nsn_found, nomenclature, amsc), approved_sources, solicitations = await asyncio.gather(
+                extract_header_info(page),
+                extract_approved_sources(page),
+                extract_solicitations(page),
+            )
 
             logger.debug("DIBBS: Found NSN=%s, sources=%d, solicitations=%d", nsn_found, len(approved_sources), len(solicitations))
 
@@ -359,8 +363,8 @@ async def _do_scrape_dibbs(page: Page, nsn: str, source_url: str) -> ScrapeResul
                 logger.warning("DIBBS: No data found, retrying in %.1fs (attempt %d/%d)",
                               delay, attempt + 1, config.MAX_RETRIES)
                 await asyncio.sleep(delay)
-                await page.reload()
-                await wait_for_idle(page)
+                await page.reload(wait_until="domcontentloaded")
+                await wait_for_data(page)
 
         if rfq_data:
             return ScrapeResult(success=True, data=rfq_data)
@@ -372,6 +376,10 @@ async def _do_scrape_dibbs(page: Page, nsn: str, source_url: str) -> ScrapeResul
         return ScrapeResult(success=False, error=str(e))
 
 
+def _dibbs_url(nsn: str) -> str:
+    return f"https://www.dibbs.bsm.dla.mil/rfq/rfqnsn.aspx?snsn={format_nsn(nsn)}"
+
+
 async def scrape_dibbs(nsn: str, browser_context=None) -> ScrapeResult:
     """
     Main function to scrape DIBBS for an NSN.
@@ -384,8 +392,7 @@ async def scrape_dibbs(nsn: str, browser_context=None) -> ScrapeResult:
 
     Returns ScrapeResult with success status and data.
     """
-    clean_nsn = format_nsn(nsn)
-    source_url = f"https://www.dibbs.bsm.dla.mil/rfq/rfqnsn.aspx?snsn={clean_nsn}"
+    source_url = _dibbs_url(nsn)
 
     # Pool path: use provided context
     if browser_context is not None:
@@ -423,3 +430,68 @@ async def scrape_dibbs(nsn: str, browser_context=None) -> ScrapeResult:
                 await browser.close()
             except Exception:
                 pass
+
+
+async def scrape_dibbs_batch(
+    nsns: List[str],
+    browser_context=None,
+    concurrency: int = 4,
+) -> List[ScrapeResult]:
+    """
+    Scrape many NSNs over a few reused pages instead of a new page per NSN.
+
+    Runs concurrency workers, each with one page, over a shared iterator of
+    NSNs; a page navigates straight from one NSN to the next, so page setup
+    and the consent banner are paid once per worker rather than once per NSN.
+
+    Args:
+        nsns: NSNs to scrape
+        browser_context: Optional BrowserContext from the shared pool.
+            If None, launches a standalone browser for the whole batch.
+        concurrency: Number of pages scraping in parallel
+
+    Returns ScrapeResults in the same order as nsns.
+    """
+    if not nsns:
+        return []
+
+    # Standalone path: one browser for the whole batch
+    if browser_context is None:
+        try:
+            async with async_playwright() as p:
+                browser = await p.chromium.launch(headless=config.HEADLESS)
+                try:
+                    context = await browser.new_context(user_agent=config.USER_AGENT)
+                    return await scrape_dibbs_batch(nsns, context, concurrency)
+                finally:
+                    await browser.close()
+        except Exception as e:
+            logger.error("scrape_dibbs_batch standalone failed: %s", e, exc_info=True)
+            return [ScrapeResult(success=False, error=str(e)) for _ in nsns]
+
+    results: List[Optional[ScrapeResult]] = [None] * len(nsns)
+    pending = iter(enumerate(nsns))
+
+    async def _worker() -> None:
+        try:
+            page = await browser_context.new_page()
+        except Exception as e:
+            # Leave this worker's share to the others
+            logger.error("scrape_dibbs_batch: failed to open page: %s", e, exc_info=True)
+            return
+        try:
+            # The iterator is shared: each NSN is taken by exactly one worker
+            for idx, nsn in pending:
+                results[idx] = await _do_scrape_dibbs(page, nsn, _dibbs_url(nsn))
+        finally:
+            try:
+                await page.close()
+            except Exception:
+                pass
+
+    await asyncio.gather(*[_worker() for _ in range(min(concurrency, len(nsns)))])
+
+    return [
+        r if r is not None else ScrapeResult(success=False, error="No browser page available")
+        for r in results
+    ]
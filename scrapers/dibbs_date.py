@@ -11,15 +11,19 @@ import re
 import time
 import random
 import asyncio
+import atexit
+import threading
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from playwright.async_api import async_playwright, Page, Browser, TimeoutError as PlaywrightTimeoutError
+from selectolax.lexbor import LexborHTMLParser
 
 import sys
 sys.path.insert(0, str(__file__).rsplit("/", 2)[0])
 
 from config import config
-from scrapers.dibbs import handle_consent_banner, wait_for_idle
+from scrapers.browser_pool import BrowserPool, block_requests
+from scrapers.dibbs import handle_consent_banner, wait_for_data, wait_for_idle
 from utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -28,6 +32,105 @@ logger = get_logger(__name__)
 # URL for the dates listing page
 DIBBS_DATES_URL = "https://www.dibbs.bsm.dla.mil/Rfq/RfqDates.aspx?category=issue"
 
+_DATE_LINK_SELECTOR = 'a[href*="RfqRecs.aspx"]'
+_RESULTS_TABLE_SELECTOR = "#ctl00_cph1_grdRfqSearch"
+_PAGE_OF_SELECTOR = "text=/Page \\d+ of \\d+/"
+_PAGER_POSTBACK_RE = re.compile(r"__doPostBack\('([^']+)','Page\$\d+'\)")
+
+# Line-break marker for _parse_grid_rows (private-use char: not whitespace)
+_LINE_BREAK = "\ue000"
+_LINE_BREAK_TAG_RE = re.compile(r"<br\s*/?>|</?(?:div|p)\b[^>]*>", re.IGNORECASE)
+
+# innerText of every td in each direct-child row of the results table
+_ROW_CELLS_JS = """(table) => Array.from(table.querySelectorAll(':scope > tbody > tr'))
+    .map(tr => Array.from(tr.querySelectorAll('td')).map(td => td.innerText))"""
+
+
+# Callers without a pool context (CLI, Streamlit) share one browser. It lives on
+# a private background loop, so every caller loop reuses the same pool rather
+# than each loop starting its own (which could never be stopped from another)
+_standalone_pool: Optional[BrowserPool] = None
+_pool_loop: Optional[asyncio.AbstractEventLoop] = None
+_pool_loop_lock = threading.Lock()
+
+# (expires_at, result) of the last successful available-dates scrape
+_dates_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+_dates_lock: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Lock]] = None
+
+
+def _get_pool_loop() -> asyncio.AbstractEventLoop:
+    """Background loop that owns the standalone pool, started on first use."""
+    global _pool_loop
+    with _pool_loop_lock:
+        if _pool_loop is None:
+            _pool_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_pool_loop.run_forever, name="dibbs-date-browser", daemon=True
+            ).start()
+            atexit.register(shutdown_sync)
+        return _pool_loop
+
+
+async def _get_standalone_pool() -> Optional[BrowserPool]:
+    """Return the shared pool, or None if it can't start. Runs on _pool_loop."""
+    global _standalone_pool
+    if _standalone_pool is not None:
+        return _standalone_pool
+    # No warmup visit or pre-created contexts: contexts are made on first lease
+    pool = BrowserPool(warm=False)
+    try:
+        await pool.start()
+    except Exception as e:
+        logger.warning("DIBBS date scraper: shared browser unavailable, launching per call: %s", e)
+        return None
+    if _standalone_pool is not None:
+        # Another caller started one first
+        await pool.stop()
+        return _standalone_pool
+    _standalone_pool = pool
+    return pool
+
+
+async def _stop_standalone_pool() -> None:
+    global _standalone_pool
+    pool, _standalone_pool = _standalone_pool, None
+    if pool is not None:
+        await pool.stop()
+
+
+async def _with_standalone_context(scrape, *args):
+    """
+    Run scrape(*args, browser_context=ctx) on _pool_loop with a context leased
+    from the standalone pool. Returns None if the pool can't start.
+    """
+    async def _run():
+        pool = await _get_standalone_pool()
+        if pool is None:
+            return None
+        async with pool.lease_context() as ctx:
+            return await scrape(*args, browser_context=ctx)
+
+    return await asyncio.wrap_future(
+        asyncio.run_coroutine_threadsafe(_run(), _get_pool_loop())
+    )
+
+
+async def close_pool() -> None:
+    """Stop the shared standalone browser, if it was started."""
+    if _pool_loop is not None:
+        await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(_stop_standalone_pool(), _pool_loop)
+        )
+
+
+def shutdown_sync() -> None:
+    """Stop the shared standalone browser from synchronous code (registered atexit)."""
+    if _pool_loop is not None and _pool_loop.is_running():
+        try:
+            asyncio.run_coroutine_threadsafe(_stop_standalone_pool(), _pool_loop).result(timeout=30)
+        except Exception as e:
+            logger.warning("DIBBS date scraper: stopping shared browser failed: %s", e)
+
 
 async def _do_scrape_available_dates(page) -> List[str]:
     """Core logic: extract dates from an existing page."""
@@ -35,9 +138,10 @@ async def _do_scrape_available_dates(page) -> List[str]:
 
     await page.goto(DIBBS_DATES_URL, timeout=config.SCRAPE_TIMEOUT, wait_until="domcontentloaded")
     await handle_consent_banner(page, DIBBS_DATES_URL)
-    await wait_for_idle(page)
+    # Only the date links matter; don't wait on the rest of the page's traffic
+    await wait_for_data(page, _DATE_LINK_SELECTOR)
 
-    date_links = page.locator('a[href*="RfqRecs.aspx"]')
+    date_links = page.locator(_DATE_LINK_SELECTOR)
     count = await date_links.count()
 
     for i in range(count):
@@ -50,18 +154,80 @@ async def _do_scrape_available_dates(page) -> List[str]:
     return dates
 
 
-async def scrape_available_dates(browser_context=None) -> Dict[str, Any]:
+def _cached_dates() -> Optional[Dict[str, Any]]:
+    """Copy of the cached available-dates result, or None if missing/expired."""
+    if _dates_cache is None or _dates_cache[0] <= time.monotonic():
+        return None
+    result = _dates_cache[1]
+    return {**result, "dates": list(result["dates"])}
+
+
+def _get_dates_lock() -> asyncio.Lock:
+    """Lock serializing available-dates refreshes on the current event loop."""
+    global _dates_lock
+    loop = asyncio.get_running_loop()
+    if _dates_lock is None or _dates_lock[0] is not loop:
+        _dates_lock = (loop, asyncio.Lock())
+    return _dates_lock[1]
+
+
+async def scrape_available_dates(
+    browser_context=None,
+    force: bool = False,
+    pool: Optional[BrowserPool] = None,
+) -> Dict[str, Any]:
     """
     Scrape available RFQ issue dates from DIBBS.
 
+    Non-empty results are cached for DIBBS_DATES_CACHE_TTL seconds (the
+    list changes at most a few times a day); concurrent callers share
+    one refresh.
+
     Args:
         browser_context: Optional BrowserContext from the shared pool.
+            If None, leases one from this module's standalone pool.
+        force: Skip the cache and re-scrape.
+        pool: Lease a context from this pool, only when a scrape is actually
+            needed (cache hits and callers waiting on a refresh hold no slot).
 
     Returns:
         Dictionary with dates list and metadata.
     """
+    global _dates_cache
+    use_cache = config.DIBBS_DATES_CACHE_TTL > 0 and not force
+    if use_cache:
+        cached = _cached_dates()
+        if cached is not None:
+            logger.debug("Available dates cache hit")
+            return cached
+
+    async with _get_dates_lock():
+        # Another task may have refreshed it while we waited
+        if use_cache:
+            cached = _cached_dates()
+            if cached is not None:
+                return cached
+        if browser_context is None and pool is not None:
+            async with pool.get_context() as ctx:
+                result = await _scrape_available_dates(ctx)
+        else:
+            result = await _scrape_available_dates(browser_context)
+        if config.DIBBS_DATES_CACHE_TTL > 0 and result["dates"]:
+            _dates_cache = (time.monotonic() + config.DIBBS_DATES_CACHE_TTL, result)
+            result = {**result, "dates": list(result["dates"])}
+    return result
+
+
+async def _scrape_available_dates(browser_context=None) -> Dict[str, Any]:
+    """Uncached scrape_available_dates()."""
     dates: List[str] = []
 
+    # No context given: lease one from the shared standalone pool
+    if browser_context is None:
+        result = await _with_standalone_context(_scrape_available_dates)
+        if result is not None:
+            return result
+
     # Pool path
     if browser_context is not None:
         page = await browser_context.new_page()
@@ -81,7 +247,7 @@ async def scrape_available_dates(browser_context=None) -> Dict[str, Any]:
             "scrapedAt": datetime.utcnow().isoformat() + "Z"
         }
 
-    # Standalone path
+    # Fallback when the shared pool can't start: launch a browser for this call
     browser: Optional[Browser] = None
     context = None
 
@@ -89,6 +255,7 @@ async def scrape_available_dates(browser_context=None) -> Dict[str, Any]:
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=config.HEADLESS)
             context = await browser.new_context(user_agent=config.USER_AGENT)
+            await block_requests(context)
             page = await context.new_page()
             dates = await _do_scrape_available_dates(page)
 
@@ -148,7 +315,7 @@ async def get_total_pages(page: Page) -> int:
     """
     try:
         # Look for pagination text like "Page 1 of 5"
-        pagination_text = await page.locator("text=/Page \\d+ of \\d+/").first.inner_text()
+        pagination_text = await page.locator(_PAGE_OF_SELECTOR).first.inner_text()
         match = re.search(r"Page \d+ of (\d+)", pagination_text)
         if match:
             return int(match.group(1))
@@ -207,6 +374,83 @@ async def click_next_page(page: Page, current_page: int) -> bool:
     return False
 
 
+async def get_pager_target(page: Page) -> Optional[str]:
+    """
+    Return the ASP.NET event target of the results grid's pager, if any.
+
+    Pager links look like javascript:__doPostBack('ctl00$cph1$grdRfqSearch','Page$3');
+    posting 'Page$N' to that target jumps straight to page N from any page.
+    Requires the "Page X of Y" text, which go_to_page() uses to confirm arrival.
+    """
+    try:
+        if await page.locator(_PAGE_OF_SELECTOR).count() == 0:
+            return None
+        hrefs = await page.eval_on_selector_all(
+            'a[href*="__doPostBack"]', "els => els.map(a => a.getAttribute('href'))"
+        )
+    except Exception as e:
+        logger.debug("get_pager_target error: %s", e)
+        return None
+    for href in hrefs:
+        match = _PAGER_POSTBACK_RE.search(href or "")
+        if match:
+            return match.group(1)
+    return None
+
+
+async def go_to_page(page: Page, pager_target: str, page_num: int) -> bool:
+    """
+    Jump to a results page with the grid's pager postback.
+
+    Returns:
+        True once "Page {page_num} of" is shown, False otherwise
+    """
+    try:
+        # Deferred so evaluate() returns before the postback navigates away
+        await page.evaluate(
+            "([target, n]) => { setTimeout(() => __doPostBack(target, 'Page$' + n), 0); }",
+            [pager_target, page_num],
+        )
+        await page.wait_for_selector(
+            f"text=/Page {page_num} of \\d+/", state="attached", timeout=config.SCRAPE_TIMEOUT
+        )
+        return True
+    except Exception as e:
+        logger.warning("go_to_page: page %d failed: %s", page_num, e)
+        return False
+
+
+def _cell_text(td) -> str:
+    """Text of a parsed cell laid out like innerText: collapsed spaces, one line per break."""
+    lines = td.text(deep=True).split(_LINE_BREAK)
+    return "\n".join(" ".join(line.split()) for line in lines).strip()
+
+
+def _parse_grid_rows(html: str) -> Optional[List[List[str]]]:
+    """
+    Cell text of each direct-child row of the results grid in page HTML.
+
+    Same shape as _ROW_CELLS_JS; None if the grid isn't in the HTML.
+    """
+    start = html.find(f'id="{_RESULTS_TABLE_SELECTOR[1:]}"')
+    if start < 0:
+        return None
+    start = html.rfind("<table", 0, start)
+    if start < 0:
+        return None
+    # Parse from the grid on; <br>/<div>/<p> become line markers first since
+    # raw source newlines are just whitespace to innerText
+    tree = LexborHTMLParser(_LINE_BREAK_TAG_RE.sub(_LINE_BREAK, html[start:]))
+    table = tree.css_first(_RESULTS_TABLE_SELECTOR)
+    if table is None:
+        return None
+    return [
+        [_cell_text(td) for td in tr.css("td")]
+        for tbody in table.iter() if tbody.tag == "tbody"
+        for tr in tbody.iter() if tr.tag == "tr"
+    ]
+
+
 async def extract_nsns_from_page(page: Page) -> List[Dict[str, Any]]:
     """
     Extract all NSN data from the current page.
@@ -228,21 +472,21 @@ async def extract_nsns_from_page(page: Page) -> List[Dict[str, Any]]:
     nsns = []
 
     # Step 1: Find the data table — prefer direct ID, fall back to keyword search
+    rows: Optional[List[List[str]]] = None
     table = None
-    table_selector = "#ctl00_cph1_grdRfqSearch"
+    table_selector = _RESULTS_TABLE_SELECTOR
 
     try:
         await page.wait_for_selector(table_selector, timeout=10000)
-        table = page.locator(table_selector)
-        if await table.count() > 0:
+        # The grid is server-rendered: parse one HTML snapshot in-process
+        # instead of walking the live DOM
+        rows = _parse_grid_rows(await page.content())
+        if rows is not None:
             logger.debug("extract_nsns: found data table by ID selector")
-        else:
-            table = None
     except Exception as e:
         logger.debug("extract_nsns: ID selector not found (%s), trying fallback", e)
-        table = None
 
-    if table is None:
+    if rows is None:
         try:
             tables = page.locator("table")
             table_count = await tables.count()
@@ -259,18 +503,20 @@ async def extract_nsns_from_page(page: Page) -> List[Dict[str, Any]]:
         except Exception as e:
             logger.error("extract_nsns: fallback table search failed: %s", e, exc_info=True)
 
-    if table is None:
-        logger.warning("extract_nsns: no data table found on page")
-        return nsns
+        if table is None:
+            logger.warning("extract_nsns: no data table found on page")
+            return nsns
 
-    # Step 2: Get direct-child rows to avoid nested pagination table rows
-    try:
-        rows = table.locator(":scope > tbody > tr")
-        row_count = await rows.count()
-        logger.debug("extract_nsns: found %d direct rows in table", row_count)
-    except Exception as e:
-        logger.error("extract_nsns: failed to locate rows: %s", e, exc_info=True)
-        return nsns
+        # Step 2: Read the cell text of every direct-child row (avoids nested
+        # pagination table rows) in one evaluate() rather than a round trip per cell
+        try:
+            rows = await table.evaluate(_ROW_CELLS_JS)
+        except Exception as e:
+            logger.error("extract_nsns: failed to read rows: %s", e, exc_info=True)
+            return nsns
+
+    row_count = len(rows)
+    logger.debug("extract_nsns: found %d direct rows in table", row_count)
 
     # Step 3: Extract data from each row
     # Row 0 = pagination, Row 1 = header, Row 2+ = data
@@ -280,38 +526,32 @@ async def extract_nsns_from_page(page: Page) -> List[Dict[str, Any]]:
 
     for i in range(2, row_count):
         try:
-            row = rows.nth(i)
-            cells = row.locator("td")
-            cell_count = await cells.count()
+            cells = [text.strip() for text in rows[i]]
 
-            if cell_count < 9:
+            if len(cells) < 9:
                 skipped_cells += 1
-                logger.debug("extract_nsns: row %d has %d cells (need 9), skipping", i, cell_count)
+                logger.debug("extract_nsns: row %d has %d cells (need 9), skipping", i, len(cells))
                 continue
 
             # Column 5: Status — only process "Open"
-            status_text = (await cells.nth(5).inner_text()).strip()
-            status = status_text.split('\n')[0].strip()
+            status = cells[5].split('\n')[0].strip()
 
             if 'Open' not in status:
                 skipped_status += 1
                 continue
 
             # Column 1: NSN
-            nsn_text = (await cells.nth(1).inner_text()).strip()
-            nsn = nsn_text.split('\n')[0].strip()
+            nsn = cells[1].split('\n')[0].strip()
 
             # Column 2: Nomenclature (Description)
-            nomenclature = (await cells.nth(2).inner_text()).strip()
+            nomenclature = cells[2]
 
             # Column 4: Solicitation
-            sol_text = (await cells.nth(4).inner_text()).strip()
-            solicitation = sol_text.split('\n')[0].strip()
+            solicitation = cells[4].split('\n')[0].strip()
 
             # Column 6: Purchase Request (contains QTY)
-            pr_text = (await cells.nth(6).inner_text()).strip()
             quantity = 0
-            for line in pr_text.split('\n'):
+            for line in cells[6].split('\n'):
                 if 'QTY' in line.upper():
                     qty_match = re.search(r'(\d[\d,]*)', line)
                     if qty_match:
@@ -321,10 +561,10 @@ async def extract_nsns_from_page(page: Page) -> List[Dict[str, Any]]:
                             quantity = 0
 
             # Column 7: Issue Date
-            issue_date = (await cells.nth(7).inner_text()).strip()
+            issue_date = cells[7]
 
             # Column 8: Return By Date
-            return_by_date = (await cells.nth(8).inner_text()).strip()
+            return_by_date = cells[8]
 
             if nsn:
                 nsns.append({
@@ -349,6 +589,62 @@ async def extract_nsns_from_page(page: Page) -> List[Dict[str, Any]]:
     return nsns
 
 
+async def _scrape_pages_parallel(
+    page: Page,
+    source_url: str,
+    pager_target: str,
+    pages_to_scrape: int,
+    start_time: float,
+) -> List[Optional[List[Dict[str, Any]]]]:
+    """
+    Extract pages 1..pages_to_scrape using several browser pages at once.
+
+    page already shows page 1. Up to config.DIBBS_DATE_PAGE_CONCURRENCY
+    workers (page plus extra pages in the same context, each loading
+    source_url for its own view state) pull page numbers from a shared
+    iterator and jump to them with go_to_page().
+
+    Returns:
+        NSN lists in page order; None for pages that could not be reached
+    """
+    results: List[Optional[List[Dict[str, Any]]]] = [None] * pages_to_scrape
+    results[0] = await extract_nsns_from_page(page)
+    pending = iter(range(2, pages_to_scrape + 1))
+
+    async def _work(worker_page: Page) -> None:
+        # The iterator is shared: each page number is taken by exactly one worker
+        for page_num in pending:
+            if time.monotonic() - start_time > 240:
+                logger.warning("Pagination wall-clock limit (240s) hit at page %d/%d", page_num, pages_to_scrape)
+                return
+            if await go_to_page(worker_page, pager_target, page_num):
+                results[page_num - 1] = await extract_nsns_from_page(worker_page)
+            await asyncio.sleep(config.BATCH_DELAY / 1000)
+
+    async def _extra_worker() -> None:
+        worker_page = None
+        try:
+            worker_page = await page.context.new_page()
+            await worker_page.goto(source_url, timeout=config.SCRAPE_TIMEOUT, wait_until="domcontentloaded")
+            # Consent cookie is shared across the context; this is normally a no-op
+            await handle_consent_banner(worker_page, source_url)
+            await _work(worker_page)
+        except Exception as e:
+            # Leave this worker's share to the others
+            logger.warning("DIBBS date scraper: extra page worker failed: %s", e)
+        finally:
+            if worker_page is not None:
+                try:
+                    await worker_page.close()
+                except Exception:
+                    pass
+
+    extra = min(config.DIBBS_DATE_PAGE_CONCURRENCY, pages_to_scrape - 1) - 1
+    await asyncio.gather(_work(page), *[_extra_worker() for _ in range(extra)])
+
+    return results
+
+
 async def _do_scrape_nsns_by_date(page, date: str, source_url: str, max_pages: int) -> Dict[str, Any]:
     """Core logic: scrape NSNs by date using an existing page."""
     all_nsns: List[Dict[str, Any]] = []
@@ -364,7 +660,7 @@ async def _do_scrape_nsns_by_date(page, date: str, source_url: str, max_pages: i
                 await page.goto(source_url, timeout=config.SCRAPE_TIMEOUT, wait_until="domcontentloaded")
                 logger.info("DIBBS date scraper: page loaded, URL=%s title=%s", page.url, await page.title())
                 await handle_consent_banner(page, source_url)
-                await wait_for_idle(page)
+                await wait_for_data(page, f"{_RESULTS_TABLE_SELECTOR}, table")
                 logger.info("DIBBS date scraper: after consent, URL=%s title=%s", page.url, await page.title())
                 break
             except PlaywrightTimeoutError:
@@ -389,25 +685,44 @@ async def _do_scrape_nsns_by_date(page, date: str, source_url: str, max_pages: i
             date=date,
         )
 
-        for page_num in range(1, pages_to_scrape + 1):
-            if time.monotonic() - start_time > 240:
-                logger.warning("Pagination wall-clock limit (240s) hit at page %d/%d", page_num, pages_to_scrape)
-                break
-
-            page_nsns = await extract_nsns_from_page(page)
-            all_nsns.extend(page_nsns)
-            pages_scraped += 1
+        pager_target = None
+        if pages_to_scrape > 1 and config.DIBBS_DATE_PAGE_CONCURRENCY > 1:
+            pager_target = await get_pager_target(page)
 
+        if pager_target:
+            results = await _scrape_pages_parallel(
+                page, source_url, pager_target, pages_to_scrape, start_time
+            )
+            for page_num, page_nsns in enumerate(results, 1):
+                if page_nsns is None:
+                    logger.warning("DIBBS date scraper: page %d/%d not scraped", page_num, pages_to_scrape)
+                    continue
+                all_nsns.extend(page_nsns)
+                pages_scraped += 1
             logger.info(
-                "DIBBS date scraper: page %d/%d extracted %d NSNs (%d cumulative)",
-                page_num, pages_to_scrape, len(page_nsns), len(all_nsns),
+                "DIBBS date scraper: %d/%d pages extracted %d NSNs in parallel",
+                pages_scraped, pages_to_scrape, len(all_nsns),
             )
-
-            if page_num < pages_to_scrape:
-                success = await click_next_page(page, page_num)
-                if not success:
+        else:
+            for page_num in range(1, pages_to_scrape + 1):
+                if time.monotonic() - start_time > 240:
+                    logger.warning("Pagination wall-clock limit (240s) hit at page %d/%d", page_num, pages_to_scrape)
                     break
-                await asyncio.sleep(config.BATCH_DELAY / 1000)
+
+                page_nsns = await extract_nsns_from_page(page)
+                all_nsns.extend(page_nsns)
+                pages_scraped += 1
+
+                logger.info(
+                    "DIBBS date scraper: page %d/%d extracted %d NSNs (%d cumulative)",
+                    page_num, pages_to_scrape, len(page_nsns), len(all_nsns),
+                )
+
+                if page_num < pages_to_scrape:
+                    success = await click_next_page(page, page_num)
+                    if not success:
+                        break
+                    await asyncio.sleep(config.BATCH_DELAY / 1000)
 
     except ValueError:
         raise
@@ -448,6 +763,7 @@ async def scrape_nsns_by_date(
         date: Date in MM-DD-YYYY format (e.g., "01-12-2026")
         max_pages: Maximum pages to scrape (0 = all pages)
         browser_context: Optional BrowserContext from the shared pool.
+            If None, leases one from this module's standalone pool.
 
     Returns:
         Dictionary with date, total pages, NSN list, and metadata
@@ -455,6 +771,12 @@ async def scrape_nsns_by_date(
     source_url = build_date_url(date)
     logger.info("scrape_nsns_by_date: starting", date=date, max_pages=max_pages, url=source_url)
 
+    # No context given: lease one from the shared standalone pool
+    if browser_context is None:
+        result = await _with_standalone_context(scrape_nsns_by_date, date, max_pages)
+        if result is not None:
+            return result
+
     # Pool path
     if browser_context is not None:
         page = await browser_context.new_page()
@@ -466,7 +788,7 @@ async def scrape_nsns_by_date(
             except Exception:
                 pass
 
-    # Standalone path
+    # Fallback when the shared pool can't start: launch a browser for this call
     browser: Optional[Browser] = None
     context = None
 
@@ -474,6 +796,7 @@ async def scrape_nsns_by_date(
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=config.HEADLESS)
             context = await browser.new_context(user_agent=config.USER_AGENT)
+            await block_requests(context)
             page = await context.new_page()
             return await _do_scrape_nsns_by_date(page, date, source_url, max_pages)
 
@@ -520,3 +843,4 @@ if __name__ == "__main__":
     print(f"Found {result['totalNsns']} NSNs on page 1")
     for nsn in result['nsns'][:5]:
         print(f"  - {nsn['nsn']}: {nsn['nomenclature']}")
+    shutdown_sync()
@@ -8,6 +8,7 @@ import re
 import time
 import random
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 from urllib.parse import urlparse
@@ -38,6 +39,24 @@ EXCLUDED_DOMAINS = [
 ]
 
 
+def _build_session() -> requests.Session:
+    """Build a keep-alive session shared by all Firecrawl calls."""
+    session = requests.Session()
+    # Retries are handled by firecrawl_request (with jitter and 4xx skip),
+    # so the adapter only provides connection pooling.
+    adapter = HTTPAdapter(
+        pool_connections=config.FIRECRAWL_CONCURRENCY,
+        pool_maxsize=config.FIRECRAWL_CONCURRENCY,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared across supplier lookups so TLS/DNS setup is paid once per host
+_session = _build_session()
+
+
 def firecrawl_request(endpoint: str, body: Dict[str, Any], timeout_override: Optional[float] = None, max_retries: int = 3) -> Dict[str, Any]:
     """
     Make a request to the Firecrawl API with retry and exponential backoff.
@@ -65,7 +84,7 @@ def firecrawl_request(endpoint: str, body: Dict[str, Any], timeout_override: Opt
 
     for attempt in range(max_retries):
         try:
-            response = requests.post(
+            response = _session.post(
                 url,
                 json=body,
                 headers=headers,
@@ -4,8 +4,9 @@ LLM Service (OpenRouter)
 OpenRouter client for email classification, reply drafting, and quote extraction.
 """
 
+import asyncio
 import json
-from typing import Optional
+from typing import Optional, Tuple
 
 from openai import AsyncOpenAI
 
@@ -26,6 +27,22 @@ STAGES = [
     "Not Yet",          # Paused for manual review
 ]
 
+OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+
+# Shared client so calls reuse pooled connections instead of a new TLS
+# handshake each time. Its httpx pool is bound to the event loop it first
+# ran on, so it is lazy-initialized per event loop (like core's semaphores).
+_client: Optional[Tuple[asyncio.AbstractEventLoop, str, AsyncOpenAI]] = None
+
+
+def _get_client(api_key: str) -> AsyncOpenAI:
+    """Get or create the OpenRouter client for the current event loop."""
+    global _client
+    loop = asyncio.get_running_loop()
+    if _client is None or _client[0] is not loop or _client[1] != api_key:
+        _client = (loop, api_key, AsyncOpenAI(api_key=api_key, base_url=OPENROUTER_BASE_URL))
+    return _client[2]
+
 
 async def _call_llm(
     messages: list,
@@ -50,10 +67,7 @@ async def _call_llm(
     if not api_key:
         raise RuntimeError("OpenRouter not configured (OPENROUTER_API_KEY)")
 
-    client = AsyncOpenAI(
-        api_key=api_key,
-        base_url="https://openrouter.ai/api/v1",
-    )
+    client = _get_client(api_key)
 
     try:
         response = await client.chat.completions.create(
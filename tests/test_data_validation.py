@@ -4,6 +4,8 @@ Unit tests for data accuracy — verify helpers and models work correctly.
 Run with: pytest tests/test_data_validation.py -v
 """
 
+import csv
+import io
 import sys
 import os
 
@@ -18,6 +20,8 @@ from models import (
 )
 from core import flatten_to_rows
 from services.firecrawl import calculate_confidence
+from scrapers.canada_buys import _parse_csv_feed, _parse_table_html
+from scrapers.dibbs_date import _parse_grid_rows
 
 
 # ── NSN Validation ──────────────────────────────────────────────────
@@ -155,10 +159,10 @@ class TestFlattenResults:
 
     def test_flatten_no_suppliers(self):
         result = self._make_result(suppliers=[])
-        rows = flatten_to_rows(result)
+        rows = list(flatten_to_rows(result))
         assert len(rows) == 1
-        assert rows[0]["supplier_name"] == ""
-        assert rows[0]["open_status"] == "OPEN"
+        assert rows[0].supplier_name == ""
+        assert rows[0].open_status == "OPEN"
 
     def test_flatten_with_suppliers(self):
         suppliers = [
@@ -181,19 +185,197 @@ class TestFlattenResults:
             )
         ]
         result = self._make_result(suppliers=suppliers)
-        rows = flatten_to_rows(result)
+        rows = list(flatten_to_rows(result))
         assert len(rows) == 1
-        assert rows[0]["supplier_name"] == "Acme"
-        assert rows[0]["cage_code"] == "1A2B3"
-        assert rows[0]["email"] == "a@acme.com"
+        assert rows[0].supplier_name == "Acme"
+        assert rows[0].cage_code == "1A2B3"
+        assert rows[0].email == "a@acme.com"
 
     def test_flatten_closed_status(self):
         result = self._make_result(has_open_rfq=False)
-        rows = flatten_to_rows(result)
-        assert rows[0]["open_status"] == "CLOSED"
+        rows = list(flatten_to_rows(result))
+        assert rows[0].open_status == "CLOSED"
 
     def test_flatten_required_columns(self):
         result = self._make_result()
-        rows = flatten_to_rows(result)
+        rows = list(flatten_to_rows(result))
         required_cols = {"nsn", "open_status", "supplier_name", "cage_code", "email", "phone"}
-        assert required_cols.issubset(set(rows[0].keys()))
+        assert required_cols.issubset(set(rows[0]._fields))
+
+
+# ── Canada Buys CSV Feed ────────────────────────────────────────────
+
+class TestCanadaBuysCsvFeed:
+    _HEADER = [
+        "title-titre-eng",
+        "referenceNumber-numeroReference",
+        "solicitationNumber-numeroSollicitation",
+        "publicationDate-datePublication",
+        "tenderClosingDate-appelOffresDateCloture",
+        "procurementCategory-categorieApprovisionnement",
+        "tenderDescription-descriptionAppelOffres-eng",
+        "title-titre-fra",
+    ]
+
+    def _make_feed(self, rows):
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        writer.writerow(self._HEADER)
+        writer.writerows(rows)
+        # The feed is served with a UTF-8 byte order mark
+        return b"\xef\xbb\xbf" + buf.getvalue().encode("utf-8")
+
+    def _parse(self, rows, kw=None, max_results=100):
+        return _parse_csv_feed(self._make_feed(rows), "2026-01-01", kw, max_results)
+
+    def test_bom_does_not_break_first_column(self):
+        tenders = self._parse([["Pump repair", "REF-1", "", "2026-01-10", "2026-02-20T14:00:00", "*GD", "Pumps", "x"]])
+        assert len(tenders) == 1
+        assert tenders[0]["title"] == "Pump repair"
+        assert tenders[0]["solicitationNumber"] == "REF-1"
+        assert tenders[0]["closingDate"] == "2026-02-20"
+        assert tenders[0]["category"] == "Goods"
+
+    def test_missing_columns_get_defaults(self):
+        tenders = self._parse([["Pump repair", "REF-1", "", "2026-01-10", "", "GD", "", ""]])
+        assert tenders[0]["status"] == "Open"
+        assert tenders[0]["organization"] == ""
+
+    def test_embedded_newlines_stay_in_one_row(self):
+        tenders = self._parse([
+            ["Pump repair", "REF-1", "", "2026-01-10", "", "GD", "Line one\nLine two", ""],
+            ["Valves", "REF-2", "", "2026-01-11", "", "GD", "Brass", ""],
+        ])
+        assert [t["title"] for t in tenders] == ["Pump repair", "Valves"]
+        assert tenders[0]["description"] == "Line one\nLine two"
+
+    def test_description_truncated_to_500(self):
+        tenders = self._parse([["Pump repair", "REF-1", "", "2026-01-10", "", "GD", "é" * 600, ""]])
+        assert tenders[0]["description"] == "é" * 500
+
+    def test_date_filter_excludes_cutoff_day(self):
+        tenders = self._parse([
+            ["Old", "REF-1", "", "2025-12-31", "", "GD", "", ""],
+            ["Cutoff", "REF-2", "", "2026-01-01", "", "GD", "", ""],
+            ["New", "REF-3", "", "2026-01-02", "", "GD", "", ""],
+            ["Undated", "REF-4", "", "", "", "GD", "", ""],
+        ])
+        assert [t["title"] for t in tenders] == ["New", "Undated"]
+
+    def test_keyword_matches_title_or_description(self):
+        rows = [
+            ["PUMP repair", "REF-1", "", "2026-01-10", "", "GD", "", ""],
+            ["Valves", "REF-2", "", "2026-01-10", "", "GD", "Spare pump parts", ""],
+            ["Chairs", "REF-3", "", "2026-01-10", "", "GD", "Office furniture", "pompe"],
+        ]
+        tenders = self._parse(rows, kw="pump")
+        assert [t["title"] for t in tenders] == ["PUMP repair", "Valves"]
+
+    def test_max_results(self):
+        rows = [["T%d" % i, "REF-%d" % i, "", "2026-01-10", "", "GD", "", ""] for i in range(5)]
+        assert [t["title"] for t in self._parse(rows, max_results=2)] == ["T0", "T1"]
+
+
+# ── DIBBS Date Grid ─────────────────────────────────────────────────
+
+_DIBBS_GRID_HTML = """<html><body><form><table id="ctl00_cph1_grdRfqSearch" class="grid">
+<tbody><tr class="pager"><td colspan="9"><span>Page 1 of 3</span></td></tr>
+<tr><th>#</th><th>NSN/Part Number</th><th>Nomenclature</th></tr>
+<tr>
+  <td>1</td>
+  <td><a href="x">5330-01-123-4567</a><br>
+      PN123</td>
+  <td>GASKET,
+      RUBBER</td><td></td>
+  <td><a>SPE7M1-25-T-0001</a><br/><span>Package&nbsp;View</span></td>
+  <td><div>Open</div><img src="v.gif"></td>
+  <td>7000123<br>QTY: <b>1,250</b></td>
+  <td>01/02/2025</td><td>01/20/2025</td>
+</tr>
+<tr><td>2</td><td>5330-01-999-0000</td><td>X</td><td></td><td>SPE</td><td>Cancelled</td><td></td><td></td><td></td></tr>
+</tbody></table></form></body></html>"""
+
+
+class TestDibbsGridParsing:
+    def test_rows_match_inner_text_shape(self):
+        rows = _parse_grid_rows(_DIBBS_GRID_HTML)
+        assert rows == [
+            ["Page 1 of 3"],
+            [],
+            ["1", "5330-01-123-4567\nPN123", "GASKET, RUBBER", "", "SPE7M1-25-T-0001\nPackage View",
+             "Open", "7000123\nQTY: 1,250", "01/02/2025", "01/20/2025"],
+            ["2", "5330-01-999-0000", "X", "", "SPE", "Cancelled", "", "", ""],
+        ]
+
+    def test_grid_found_after_leading_markup(self):
+        html = "<html><head><title>RFQs</title></head>" + _DIBBS_GRID_HTML[len("<html>"):]
+        assert len(_parse_grid_rows(html)) == 4
+
+    def test_missing_grid_returns_none(self):
+        assert _parse_grid_rows("<html><table><tr><td>x</td></tr></table></html>") is None
+
+
+# ── Canada Buys HTML Table ──────────────────────────────────────────
+
+_CANADA_BUYS_HTML = """<html><head><title>Tender opportunities</title></head><body>
+<nav><a href="/en/tender-opportunities/tender-notice/nav-link">Browse all tenders</a></nav>
+<table class="views-table">
+<thead><tr><th>Title</th><th>Category</th><th>Open/amendment date</th><th>Closing date</th><th>Organization</th></tr></thead>
+<tbody>
+<tr>
+  <td><a href="/en/tender-opportunities/tender-notice/abc-123"> Pump Repair Services </a></td>
+  <td>Services</td>
+  <td>2026/01/10</td>
+  <td>2026/02/20</td>
+  <td>Public Services and <em>Procurement</em> Canada</td>
+</tr>
+<tr>
+  <td><a href="/en/tender-opportunities/tender-notice/def-456">Office chairs</a></td>
+  <td>Goods</td>
+  <td>2026/01/01</td>
+  <td>9999/12/31</td>
+  <td>National Defence</td>
+</tr>
+<tr>
+  <td><a href="/en/tender-opportunities/tender-notice/ghi-789">Spare pump parts</a></td>
+  <td>Goods</td>
+  <td>2026/01/05</td>
+  <td>9999/12/31</td>
+  <td>Fisheries and Oceans Canada</td>
+</tr>
+<tr><td><a href="/en/tender-opportunities/tender-notice/jkl-000">AB</a></td><td>Goods</td><td>2026/01/05</td><td></td><td></td></tr>
+<tr><td><a href="/en/about">About</a></td><td></td><td></td><td></td><td></td></tr>
+</tbody></table>
+<footer><a href="/en/tender-opportunities/tender-notice/footer-link">Footer tender</a></footer>
+</body></html>"""
+
+
+class TestCanadaBuysHtmlTable:
+    def test_rows_parsed_and_normalized(self):
+        # Links outside the table, short titles and non-notice rows are ignored
+        tenders = _parse_table_html(_CANADA_BUYS_HTML, "2026-01-01", None)
+        assert [t["solicitationNumber"] for t in tenders] == ["abc-123", "ghi-789"]
+        first = tenders[0]
+        assert first["title"] == "Pump Repair Services"
+        assert first["category"] == "Services"
+        assert first["publishedDate"] == "2026-01-10"
+        assert first["closingDate"] == "2026-02-20"
+        assert first["organization"] == "Public Services and Procurement Canada"
+        assert first["sourceUrl"] == "https://canadabuys.canada.ca/en/tender-opportunities/tender-notice/abc-123"
+        assert first["status"] == "Open"
+        assert first["source"] == "canada_buys"
+
+    def test_no_closing_date_is_blank(self):
+        tenders = _parse_table_html(_CANADA_BUYS_HTML, "2026-01-01", None)
+        assert tenders[1]["closingDate"] == ""
+
+    def test_keyword_filters_on_title(self):
+        tenders = _parse_table_html(_CANADA_BUYS_HTML, "2025-12-01", "pump")
+        assert [t["solicitationNumber"] for t in tenders] == ["abc-123", "ghi-789"]
+
+    def test_date_filter_excludes_cutoff_day(self):
+        tenders = _parse_table_html(_CANADA_BUYS_HTML, "2026-01-05", None)
+        assert [t["solicitationNumber"] for t in tenders] == ["abc-123"]
+
+    def test_page_without_table(self):
+        assert _parse_table_html("<html><body>No results</body></html>", "2026-01-01", None) == []